@@ -0,0 +1,84 @@
+# This Python program compares filtering a long list of words by their
+# lengths and by whether they are numbers, word by word in Python
+# ('min_word_length()' and 'del_num()'), with filtering them by masks
+# ('wordcount.masks.filter_words()'), with and without NumPy. The words
+# are drawn from a Zipfian vocabulary, with some numbers among them.
+# Last modified 2026-10-18 23:58
+
+
+# For generating the same words every time.
+import random
+from itertools import accumulate
+
+# For timing each way of filtering.
+import time
+
+# For reading options from the command line.
+import argparse
+
+# For importing the package wordcount from the folder above.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from wordcount.words import min_word_length, del_num
+from wordcount import masks
+
+
+def make_words(count, types):
+    """
+    Return a list of 'count' words drawn from a Zipfian vocabulary of
+    'types' different words, of which one in fifty is a number.
+    """
+    random.seed(2022)
+    vocabulary = []
+    for index in range(types):
+        if index % 50 == 49:
+            vocabulary.append(str(index) if index % 100 == 49 else
+                '-' + str(index) + '.5')
+        else:
+            vocabulary.append(''.join(random.choices(
+                'abcdefghijklmnopqrstuvwxyz', k=random.randint(1, 12))))
+    weights = list(accumulate(1 / (rank + 1) for rank in range(types)))
+    return random.choices(vocabulary, cum_weights=weights, k=count)
+
+
+def in_python(words, min_length):
+    """Filter the words one by one, as 'count_text()' used to."""
+    return del_num(min_word_length(words, min_length))
+
+
+def measure(name, function, *args):
+    """Run a way of filtering, print its time, and return its results."""
+    start = time.perf_counter()
+    results = function(*args)
+    seconds = time.perf_counter() - start
+    print(name + "\t" + format(seconds, '.2f') + " s")
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Compare filtering words in Python and by masks.")
+    parser.add_argument('--words', type=int, default=10000000,
+        help="the number of words (default: 10000000)")
+    parser.add_argument('--types', type=int, default=1000000,
+        help="the number of different words (default: 1000000)")
+    parser.add_argument('--min-length', type=int, default=4,
+        help="the minimal length of the word (default: 4)")
+    args = parser.parse_args()
+
+    words = make_words(args.words, args.types)
+
+    expected = measure("Python, word by word", in_python, words,
+        args.min_length)
+    with_numpy = measure("Masks, NumPy\t", masks.filter_words, words,
+        args.min_length, False, frozenset(), True)
+    without_numpy = measure("Masks, no NumPy", masks.filter_words, words,
+        args.min_length)
+
+    print("Words kept:\t" + str(len(expected)) + " of " + str(len(words)))
+    print("Same words:\t" + str(with_numpy == expected
+        and without_numpy == expected))
@@ -0,0 +1,112 @@
+# This Python program compares counting all phrases exactly
+# (wordcount.phrases.count_ngrams) with counting them approximately in
+# a summary of fixed size (wordcount.sketch.count_ngrams_approx). The
+# sentences are generated from a Zipfian vocabulary, with some phrases
+# repeated often, so that most long phrases are unique but a few are
+# frequent. The time, peak memory, and the accuracy of the top phrases
+# are printed.
+# Last modified 2026-10-18 17:10
+
+
+# For generating the same sentences every time.
+import random
+from itertools import accumulate
+
+# For timing and measuring the memory of each way of counting.
+import time
+import tracemalloc
+
+# For reading options from the command line.
+import argparse
+
+# For importing the package wordcount from the folder above.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from wordcount.phrases import count_ngrams
+from wordcount.sketch import count_ngrams_approx, summary_top
+from wordcount.topk import top_items
+
+
+def make_sentences(count, types, repeated=200):
+    """
+    Return a list of sentences of 5 to 20 words drawn from a Zipfian
+    vocabulary of 'types' words. Some sentences begin with one of a few
+    'repeated' phrases, chosen by a Zipfian law too.
+    """
+    random.seed(2022)
+    vocabulary = ['w' + format(index, 'x') for index in range(types)]
+    weights = list(accumulate(1 / (rank + 1) for rank in range(types)))
+    phrases = [' '.join(random.choices(vocabulary, k=6))
+        for index in range(repeated)]
+    phrase_weights = list(accumulate(
+        1 / (rank + 1) for rank in range(repeated)))
+
+    sentences = []
+    for index in range(count):
+        words = random.choices(vocabulary, cum_weights=weights,
+            k=random.randint(5, 20))
+        if random.random() < 0.2:
+            words.insert(0, random.choices(
+                phrases, cum_weights=phrase_weights)[0])
+        sentences.append(' '.join(words))
+    return sentences
+
+
+def measure(name, function, *args):
+    """
+    Run a way of counting, print its time and peak memory, and return
+    its results.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = function(*args)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(name + "\t" + format(seconds, '.2f') + " s, peak "
+        + format(peak / 1048576, '.1f') + " MB")
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Compare exact and approximate counting of phrases.")
+    parser.add_argument('--sentences', type=int, default=500000,
+        help="the number of sentences (default: 500000)")
+    parser.add_argument('--types', type=int, default=50000,
+        help="the number of different words (default: 50000)")
+    parser.add_argument('--length', type=int, default=5,
+        help="the number of words in a phrase (default: 5)")
+    parser.add_argument('--capacity', type=int, default=100000,
+        help="the most phrases kept in the summary (default: 100000)")
+    parser.add_argument('--top', type=int, default=30,
+        help="the number of top phrases compared (default: 30)")
+    args = parser.parse_args()
+
+    sentences = make_sentences(args.sentences, args.types)
+
+    exact = measure("Exact", count_ngrams, sentences, args.length)
+    summary = measure("Approximate", count_ngrams_approx, sentences,
+        args.length, args.capacity)
+
+    exact_top = top_items(exact, args.top)
+    approx_top = summary_top(summary, args.top)
+    found = set(phrase for phrase, least, most in approx_top)
+    recall = sum(1 for phrase, count in exact_top if phrase in found)
+    worst = max(exact[phrase] - least for phrase, least, most in approx_top)
+
+    print("Phrases:\t" + str(summary['total']) + " counted, "
+        + str(len(exact)) + " different, "
+        + str(len(summary['counts'])) + " kept in the summary")
+    print("Error bound:\t" + str(summary['error']) + " (total / (capacity "
+        "+ 1) = " + format(summary['total'] / (args.capacity + 1), '.1f')
+        + ")")
+    print("Top " + str(args.top) + ":\t" + str(recall)
+        + " found by both; the largest error is " + str(worst))
+    print("Counts within bounds:\t" + str(all(least <= exact[phrase] <= most
+        for phrase, least, most in approx_top)))
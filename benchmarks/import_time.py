@@ -0,0 +1,72 @@
+# This Python program measures the cold import time of the package
+# wordcount, i.e., importing it in a new Python process, and checks
+# that importing it neither loads the modules for drawing word clouds
+# nor runs any counting. The scripts (e.g., wdct.py) are imported too,
+# as their main programs must only run when they are started.
+# Last modified 2026-10-18 12:30
+
+
+# For starting a new Python process for each import.
+import subprocess
+import sys
+
+# For reading options from the command line.
+import argparse
+
+# For running the imports in the folder above.
+import os
+
+
+# The folder of the package and the scripts.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The modules that take long to import, and are only needed for drawing.
+HEAVY_MODULES = ['wordcloud', 'PIL', 'numpy', 'matplotlib']
+
+# The program run in the new process. It prints the import time in
+# seconds, and then the heavy modules that have been imported, if any.
+PROGRAM = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+print(' '.join(name for name in {heavy!r} if name in sys.modules))
+"""
+
+
+def import_time(module):
+    """
+    Import a module in a new Python process, and return the import
+    time in seconds and the list of heavy modules imported with it.
+    """
+    program = PROGRAM.format(module=module, heavy=HEAVY_MODULES)
+    output = subprocess.run(
+        [sys.executable, '-c', program], cwd=ROOT, check=True,
+        capture_output=True, text=True).stdout.splitlines()
+    return float(output[0]), output[1].split()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Measure the cold import time of wordcount.")
+    parser.add_argument('--repeat', type=int, default=5,
+        help="how many times each module is imported (default: 5)")
+    args = parser.parse_args()
+
+    failed = False
+    for module in ['wordcount', 'wdct', 'word_frq', 'phrase_frq',
+            'ct_word', 'ct_phrase']:
+        times = []
+        for index in range(args.repeat):
+            seconds, heavy = import_time(module)
+            times.append(seconds)
+
+        msg = module + "\t\tbest " + format(min(times) * 1000, '.1f')
+        msg += " ms, median " + format(
+            sorted(times)[len(times) // 2] * 1000, '.1f') + " ms"
+        if heavy:
+            msg += "\tHEAVY MODULES IMPORTED: " + ' '.join(heavy)
+            failed = True
+        print(msg)
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,109 @@
+# This Python program shows how the time of counting all phrases of a
+# given number of words by 'wordcount.phrases.count_ngrams()' grows with
+# the number of words in the text. The text is doubled each time, and
+# the time per word should stay about the same, i.e., the time grows
+# linearly. For the smaller texts, the former way of phrase_frq.py,
+# counting each phrase of 'phrase_set()' in each sentence by
+# 'list_a_in_b()', is timed too, whose time grows much faster.
+# Last modified 2026-10-18 23:40
+
+
+# For generating the same sentences every time.
+import random
+
+# For timing each way of counting.
+import time
+
+# For reading options from the command line.
+import argparse
+
+# For importing the package wordcount from the folder above.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from wordcount.phrases import count_ngrams, phrase_set, list_a_in_b
+
+
+def make_sentences(tokens, types):
+    """
+    Return a list of sentences of 5 to 20 words, with about 'tokens'
+    words in all, drawn from a Zipfian vocabulary of 'types' words.
+    """
+    random.seed(2022)
+    vocabulary = ['w' + format(index, 'x') for index in range(types)]
+    weights = [1 / (rank + 1) for rank in range(types)]
+    words = random.choices(vocabulary, weights, k=tokens)
+
+    sentences = []
+    start = 0
+    while start < tokens:
+        end = start + random.randint(5, 20)
+        sentences.append(' '.join(words[start:end]))
+        start = end
+    return sentences
+
+
+def count_rescans(sentences, phrase_length):
+    """
+    Count each phrase of 'phrase_set()' in each sentence by
+    'list_a_in_b()', as phrase_frq.py used to.
+    """
+    return {phrase: sum(list_a_in_b(phrase, sentence)
+        for sentence in sentences)
+        for phrase in phrase_set(sentences, phrase_length)}
+
+
+def measure(function, *args):
+    """Run a way of counting, and return its time in seconds."""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Show that counting all phrases by 'count_ngrams()' "
+        "takes time linear in the number of words.")
+    parser.add_argument('--tokens', type=int, default=125000,
+        help="the number of words of the first text (default: 125000)")
+    parser.add_argument('--steps', type=int, default=5,
+        help="how many times the text is doubled, and counted "
+        "(default: 5)")
+    parser.add_argument('--types', type=int, default=20000,
+        help="the number of different words (default: 20000)")
+    parser.add_argument('--length', type=int, default=3,
+        help="the number of words in a phrase (default: 3)")
+    parser.add_argument('--rescan-limit', type=int, default=4000,
+        help="the most words counted the former way, which takes much "
+        "longer (default: 4000)")
+    args = parser.parse_args()
+
+    # The former way, on texts small enough to finish.
+    print("Words\t\tRescans (s)\tRatio to the last")
+    tokens = 500
+    last = None
+    while tokens <= args.rescan_limit:
+        seconds = measure(count_rescans, make_sentences(tokens, args.types),
+            args.length)
+        line = str(tokens).ljust(16) + format(seconds, '.3f') + "\t\t"
+        line += format(seconds / last, '.2f') if last else "-"
+        print(line)
+        last = seconds
+        tokens *= 2
+
+    print("\nWords\t\tcount_ngrams (s)\tRatio to the last"
+        "\tMicroseconds per word")
+    tokens = args.tokens
+    last = None
+    for step in range(args.steps):
+        seconds = measure(count_ngrams, make_sentences(tokens, args.types),
+            args.length)
+        line = str(tokens).ljust(16) + format(seconds, '.3f') + "\t\t\t"
+        line += (format(seconds / last, '.2f') if last else "-") + "\t\t\t"
+        line += format(seconds / tokens * 1000000, '.2f')
+        print(line)
+        last = seconds
+        tokens *= 2
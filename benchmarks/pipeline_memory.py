@@ -0,0 +1,114 @@
+# This Python program compares the peak memory (RSS) of counting the
+# words of a text file as a whole ('count_text()', which makes lists of
+# all the words), and through the chain of lazy filters
+# ('wordcount.pipeline.count_pipeline()'), for texts of growing length
+# with the same vocabulary. Each count is run in a new process, so that
+# its peak memory is measured on its own. Linux or macOS is needed for
+# measuring the peak memory.
+# Last modified 2026-10-18 19:50
+
+
+# For generating the same text files every time.
+import random
+from itertools import accumulate
+
+# For measuring the peak memory and time of each count.
+import resource
+import time
+
+# For running each count in a new process.
+import subprocess
+
+# For reading options from the command line.
+import argparse
+
+# For importing the package wordcount from the folder above.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from wordcount.source import open_source
+from wordcount.count import count_text
+from wordcount.pipeline import count_pipeline
+
+
+# The characters and character sets for splitting words, as in wdct.py.
+split_char = ":;!?\"#$&{}<>*/÷=\\@|·~‘“”–⋯"
+split_chars = [", ", ". ", ".\n", ".\r", "' ", "’ ", " (", ") "]
+
+
+def make_text(filename, tokens, types=50000):
+    """
+    Write a text of a given number of words, drawn from a Zipfian
+    vocabulary of 'types' different words, into a file, and return the
+    file name.
+    """
+    random.seed(2022)
+    vocabulary = ['w' + format(index, 'x') + 'ord' for index in range(types)]
+    weights = list(accumulate(1 / (rank + 1) for rank in range(types)))
+    with open(filename, 'w', encoding='utf-8') as file_object:
+        for start in range(0, tokens, 100000):
+            words = random.choices(vocabulary, cum_weights=weights,
+                k=min(100000, tokens - start))
+            file_object.write(' '.join(words) + ', ')
+    return filename
+
+
+def count_once(way, filename):
+    """
+    Count the words in a text file in one way, 'text' or 'pipeline',
+    and print the time, the peak memory in MB, and the number of
+    different words, separated by tabs.
+    """
+    start = time.perf_counter()
+    if way == 'text':
+        results = count_text(open_source(filename), split_char,
+            split_chars, frozenset(), 4)
+    else:
+        results = count_pipeline(filename, split_char, split_chars,
+            settings={'min_length': 4})
+    seconds = time.perf_counter() - start
+
+    # The peak memory is given in kB on Linux, and in bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        peak /= 1024
+    print(format(seconds, '.2f') + "\t" + format(peak / 1024, '.1f')
+        + "\t" + str(len(results)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Compare the peak memory of counting a whole text "
+        "and counting through lazy filters.")
+    parser.add_argument('--tokens', type=int, default=2000000,
+        help="the number of words in the shortest text; each next text "
+        "is twice as long (default: 2000000)")
+    parser.add_argument('--steps', type=int, default=4,
+        help="the number of texts (default: 4)")
+    parser.add_argument('--file', default='bench_pipeline.txt',
+        help="where the text file is written (default: "
+        "bench_pipeline.txt)")
+    parser.add_argument('--count', nargs=2, metavar=('WAY', 'FILE'),
+        help=argparse.SUPPRESS)     # Used for the new processes.
+    args = parser.parse_args()
+
+    if args.count is not None:
+        count_once(*args.count)
+        sys.exit()
+
+    print("Words\t\tWay\t\tTime (s)\tPeak RSS (MB)\tDifferent words")
+    tokens = args.tokens
+    for step in range(args.steps):
+        make_text(args.file, tokens)
+        for way in ['text', 'pipeline']:
+            output = subprocess.run(
+                [sys.executable, __file__, '--count', way, args.file],
+                capture_output=True, text=True).stdout.split('\t')
+            print(str(tokens).ljust(16) + way.ljust(16) + output[0]
+                + "\t\t" + output[1] + "\t\t" + output[2].strip())
+        tokens *= 2
+
+    os.remove(args.file)
@@ -0,0 +1,144 @@
+# This Python program compares the latency of counting words through
+# the counting service (wordcount/service.py) with that of starting a
+# new process for each count, as the scripts are run. The service is
+# started on localhost, and many requests are sent to it at the same
+# time; then the same file is counted by the command line a few times.
+# The 50th and 99th percentiles (p50, p99) of the latency are printed.
+# Last modified 2026-10-18 13:40
+
+
+# For generating the same text file every time.
+import random
+
+# For timing each request.
+import time
+
+# For reading options from the command line.
+import argparse
+
+# For sending requests at the same time.
+from concurrent.futures import ThreadPoolExecutor
+
+# For sending requests to the service.
+import json
+import urllib.request
+
+# For starting the service and the command line as new processes.
+import subprocess
+import sys
+import os
+
+
+# The folder of the package.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_text(filename, words):
+    """
+    Write an English-like text of a given number of words into a file,
+    and return the file name.
+    """
+    random.seed(2022)
+    vocabulary = ['the', 'of', 'which', 'analysis', 'well-known', 'data',
+        'results', 'model', '3.5', 'in', 'on', 'software', 'review']
+    marks = [' ', ' ', ' ', ', ', '. ', '\n']
+    with open(filename, 'w', encoding='utf-8') as file_object:
+        file_object.write(''.join(random.choice(vocabulary)
+            + random.choice(marks) for index in range(words)))
+    return filename
+
+
+def percentile(latencies, percent):
+    """Return the given percentile of a list of latencies."""
+    ordered = sorted(latencies)
+    index = max(0, -(-len(ordered) * percent // 100) - 1)
+    return ordered[int(index)]
+
+
+def report(name, latencies):
+    """Print the p50 and p99 latencies in milliseconds."""
+    msg = name + "\t" + str(len(latencies)) + " requests, "
+    msg += "p50 " + format(percentile(latencies, 50) * 1000, '.1f')
+    msg += " ms, p99 " + format(percentile(latencies, 99) * 1000, '.1f')
+    msg += " ms"
+    print(msg)
+
+
+def send(url, request):
+    """
+    Send a request to the service, and return the latency in seconds.
+    """
+    data = json.dumps(request).encode('utf-8')
+    start = time.perf_counter()
+    with urllib.request.urlopen(urllib.request.Request(url, data,
+            {'Content-Type': 'application/json'})) as response:
+        json.loads(response.read())
+    return time.perf_counter() - start
+
+
+def wait_for(url, timeout=30):
+    """Wait until the service answers, or raise an error."""
+    deadline = time.time() + timeout
+    while True:
+        try:
+            send(url, {'text': ''})
+            return
+        except OSError:
+            if time.time() > deadline:
+                raise
+            time.sleep(0.1)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Compare the latency of the counting service with "
+        "that of the command line.")
+    parser.add_argument('--requests', type=int, default=2000,
+        help="the number of requests to the service (default: 2000)")
+    parser.add_argument('--clients', type=int, default=16,
+        help="the number of requests sent at the same time (default: 16)")
+    parser.add_argument('--runs', type=int, default=50,
+        help="the number of runs of the command line (default: 50)")
+    parser.add_argument('--words', type=int, default=2000,
+        help="the number of words in the text file (default: 2000)")
+    parser.add_argument('--workers', type=int, default=1,
+        help="the number of processes of the service (default: 1)")
+    parser.add_argument('--port', type=int, default=8765,
+        help="the port of the service (default: 8765)")
+    parser.add_argument('--exclusion', default='',
+        help="the exclusion file applied to all counts")
+    args = parser.parse_args()
+
+    filename = make_text(os.path.abspath('bench_service.txt'), args.words)
+    exclusion = os.path.abspath(args.exclusion) if args.exclusion else ''
+    request = {'path': filename, 'exclusion': exclusion, 'top': 40}
+    url = 'http://127.0.0.1:' + str(args.port) + '/count'
+
+    service = subprocess.Popen([sys.executable, '-m', 'wordcount.service',
+        '--port', str(args.port), '--workers', str(args.workers),
+        '--exclusion', exclusion], cwd=ROOT, stdout=subprocess.DEVNULL)
+
+    try:
+        wait_for(url)
+        with ThreadPoolExecutor(args.clients) as executor:
+            latencies = list(executor.map(
+                lambda index: send(url, request), range(args.requests)))
+    finally:
+        service.terminate()
+        service.wait()
+
+    command = [sys.executable, '-m', 'wordcount.service', '--count',
+        filename, '--exclusion', exclusion, '--top', '40']
+    command_latencies = []
+    for index in range(args.runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=ROOT, check=True,
+            stdout=subprocess.DEVNULL)
+        command_latencies.append(time.perf_counter() - start)
+
+    print("Text size:\t" + str(args.words) + " words, "
+        + str(args.clients) + " clients")
+    report("Service", latencies)
+    report("Command line", command_latencies)
+
+    os.remove(filename)
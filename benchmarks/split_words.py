@@ -0,0 +1,100 @@
+# This Python program compares the speed of wordcount.split_words() with
+# single-pass ways of splitting the same text, i.e., one str.translate
+# table for 'split_char' plus one alternation regex for 'split_chars'.
+# A text file of a given size (100 MB by default) is generated first.
+# Last modified 2026-10-18 12:30
+
+
+# For generating the same text file every time.
+import random
+
+# For timing each way of splitting.
+import time
+
+# For reading options from the command line.
+import argparse
+
+# For compiling the alternation of character sets.
+import re
+
+# For importing the package wordcount from the folder above.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from wordcount.words import split_words
+
+
+# The characters and character sets for splitting words, as in wdct.py.
+split_char = ":;!?\"#$&{}<>*/÷=\\@|·~‘“”–⋯"
+split_chars = [", ", ". ", ".\n", ".\r", "' ", "’ ", " (", ") "]
+
+
+def make_text(filename, size):
+    """
+    Write an English-like text of about 'size' characters into a file,
+    with punctuations and hyphenated words, and return the file name.
+    """
+    random.seed(2022)
+    words = ["word" + str(index) for index in range(5000)]
+    words += ["non-linear", "it's", "(see", "table)", "‘quoted’", "3.14"]
+    marks = ["", "", "", ",", ".", ".\n", "'", "’", ")", ":", "“"]
+
+    with open(filename, 'w', encoding='utf-8') as file_object:
+        written = 0
+        while written < size:
+            line = ''
+            for index in range(1000):
+                line += random.choice(words) + random.choice(marks) + ' '
+            file_object.write(line)
+            written += len(line)
+
+    return filename
+
+
+def split_single_pass(contents, table, pattern):
+    """
+    Split a text string with one str.translate() for 'split_char' and
+    one alternation regex for 'split_chars'. Note that the result is
+    not always the same as that of split_words(), which replaces the
+    character sets one after another: e.g., in "x', y", ", " is first
+    replaced by a space, and then "' " is found and replaced too.
+    """
+    string = contents.lower().translate(table)
+    return pattern.sub(' ', string).split()
+
+
+def time_it(message, function, *args):
+    """Run a function, print the time it takes, and return its result."""
+    start = time.perf_counter()
+    result = function(*args)
+    print(message + "\t" + format(time.perf_counter() - start, '.3f') + " s")
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Compare ways of splitting words of wordcount.")
+    parser.add_argument('--size', type=int, default=100,
+        help="the size of the text file in MB (default: 100)")
+    parser.add_argument('--file', default='bench_text.txt',
+        help="where the text file is written (default: bench_text.txt)")
+    args = parser.parse_args()
+
+    make_text(args.file, args.size * 1000000)
+    with open(args.file, encoding='utf-8') as file_object:
+        contents = file_object.read()
+
+    table = str.maketrans(dict.fromkeys(split_char, ' '))
+    pattern = re.compile('|'.join(re.escape(chars) for chars in split_chars))
+
+    print("Text size:\t" + str(len(contents)) + " characters")
+    words = time_it("split_words()", split_words, contents, split_char,
+        split_chars)
+    single = time_it("single pass", split_single_pass, contents, table,
+        pattern)
+    print("Same words:\t" + str(words == single))
+
+    os.remove(args.file)
@@ -0,0 +1,279 @@
+# This Python program times each stage of counting words and phrases
+# on its own, on synthetic texts of growing size, and writes the times
+# as JSON, so that the times of two versions of the package can be
+# compared. The texts are generated from a Zipfian vocabulary, with a
+# given share of hyphenated words, numbers and punctuations, and are
+# the same every time for the same options.
+#     The stages are those of the scripts: open_source, remove_char,
+# split_sentence, split_words, split_letters, exclude_words (with stop
+# lists of several sizes), min_word_length, del_num, Counter,
+# count_ngrams, count_phrase (on all the phrases of 'phrase_set()'),
+# top_counts and report_results.
+# Last modified 2026-10-18 20:20
+
+
+# For generating the same texts every time.
+import random
+from itertools import accumulate
+
+# For timing each stage.
+import time
+
+# For counting the words, as the scripts do.
+from collections import Counter
+
+# For writing the times and telling which version was timed.
+import json
+import platform
+import subprocess
+
+# For keeping the text files and the reports out of the way.
+import tempfile
+import contextlib
+import io
+
+# For reading options from the command line.
+import argparse
+
+# For importing the package wordcount from the folder above.
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from wordcount.source import open_source
+from wordcount.words import (split_words, split_letters, exclude_words,
+    min_word_length, del_num)
+from wordcount.phrases import (remove_char, split_sentence, phrase_set,
+    count_phrase, count_ngrams, top_counts)
+from wordcount.report import report_results
+
+
+# The characters and character sets for splitting words, as in wdct.py.
+split_char = ":;!?\"#$&{}<>*/÷=\\@|·~‘“”–⋯"
+split_chars = [", ", ". ", ".\n", ".\r", "' ", "’ ", " (", ") "]
+
+# The punctuations put after words, and how often each of them is used.
+PUNCTUATIONS = [',', '.', '.', ';', ':', '!', '?', ')', '"']
+
+
+def make_vocabulary(types, hyphens=0.05, numbers=0.02, seed=2022):
+    """
+    Return a list of 'types' different words, of which the share
+    'hyphens' are hyphenated, and the share 'numbers' are numbers. The
+    words are listed from the most frequent, for a Zipfian text.
+    """
+    generator = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    vocabulary = []
+    seen = set()
+    for index in range(types):
+        chance = generator.random()
+        if chance < numbers:
+            word = str(generator.randint(0, 99999))
+        else:
+            word = ''.join(generator.choices(letters,
+                k=generator.randint(1, 12)))
+            if chance < numbers + hyphens:
+                word += '-' + ''.join(generator.choices(letters,
+                    k=generator.randint(2, 8)))
+        if word in seen:    # Each word is made different.
+            word += format(index, 'x')
+        seen.add(word)
+        vocabulary.append(word)
+    return vocabulary
+
+
+def make_text(tokens, vocabulary, punctuation=0.1, seed=2022):
+    """
+    Return a text of a given number of words drawn from the Zipfian
+    vocabulary, where a word is followed by a punctuation with the
+    chance 'punctuation', and some words are capitalized.
+    """
+    generator = random.Random(seed)
+    weights = list(accumulate(1 / (rank + 1)
+        for rank in range(len(vocabulary))))
+    words = generator.choices(vocabulary, cum_weights=weights, k=tokens)
+
+    for index in range(len(words)):
+        chance = generator.random()
+        if chance < punctuation:
+            words[index] += generator.choice(PUNCTUATIONS)
+        elif chance > 0.97:
+            words[index] = words[index].capitalize()
+    return ' '.join(words)
+
+
+def time_stage(function, *args, repeat=3):
+    """
+    Run a stage 'repeat' times, and return the least time in seconds
+    and the result of the last run. The output on screen of the stage
+    is dropped.
+    """
+    best = None
+    for turn in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            result = function(*args)
+            seconds = time.perf_counter() - start
+        if best is None or seconds < best:
+            best = seconds
+    return best, result
+
+
+def git_version():
+    """Return the short hash of the checked out commit, or ''."""
+    try:
+        output = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=ROOT, capture_output=True, text=True)
+    except OSError:
+        return ''
+    return output.stdout.strip()
+
+
+def stage_key(entry):
+    """
+    Return what tells a timed stage from others in the JSON file: the
+    stage, the number of words, and the size of the stop list, if any.
+    """
+    return entry['stage'], entry['tokens'], entry.get('stop_words')
+
+
+def time_stages(tokens, args, folder):
+    """
+    Generate a text of a given number of words, time each stage on it,
+    and return a list of dicts, one for each stage, with the stage, the
+    number of words, the time in seconds, and any setting of the stage.
+    Each stage is given the result of the stage before it, as in the
+    scripts.
+    """
+    vocabulary = make_vocabulary(args.types, args.hyphens, args.numbers)
+    txtsource = os.path.join(folder, 'source.txt')
+    with open(txtsource, 'w', encoding='utf-8') as file_object:
+        file_object.write(make_text(tokens, vocabulary, args.punctuation))
+    report_file = os.path.join(folder, 'results.txt')
+
+    times = []
+
+    def add(stage, seconds, **settings):
+        times.append(dict({'stage': stage, 'tokens': tokens,
+            'seconds': round(seconds, 6)}, **settings))
+
+    seconds, contents = time_stage(open_source, txtsource)
+    add('open_source', seconds)
+
+    # Words, as counted by wdct.py and word_frq.py.
+    seconds, words = time_stage(split_words, contents, split_char,
+        split_chars)
+    add('split_words', seconds)
+    seconds, letters = time_stage(split_letters, contents)
+    add('split_letters', seconds)
+
+    for size in args.stop_lists:
+        exclude_string = ' '.join(vocabulary[:size])
+        seconds, kept = time_stage(exclude_words, words, exclude_string)
+        add('exclude_words', seconds, stop_words=size)
+
+    seconds, kept = time_stage(min_word_length, kept, 4)
+    add('min_word_length', seconds, min_length=4)
+    seconds, kept = time_stage(del_num, kept)
+    add('del_num', seconds)
+    seconds, results = time_stage(Counter, kept)
+    add('Counter', seconds)
+    seconds, top = time_stage(report_results, results, 4, 3, 40,
+        txtsource, '', report_file, repeat=1)
+    add('report_results', seconds)
+
+    # Phrases, as counted by phrase_frq.py.
+    seconds, clear_contents = time_stage(remove_char, contents, '"-')
+    add('remove_char', seconds)
+    seconds, sentences = time_stage(split_sentence, clear_contents)
+    add('split_sentence', seconds)
+    seconds, phrase_counts = time_stage(count_ngrams, sentences,
+        args.phrase_length)
+    add('count_ngrams', seconds, phrase_length=args.phrase_length)
+    seconds, top = time_stage(top_counts, phrase_counts, 30, 3)
+    add('top_counts', seconds)
+
+    # Counting every phrase of 'phrase_set()' by 'count_phrase()' is
+    # only timed on short texts, as it takes much longer.
+    if tokens <= args.phrase_set_limit:
+        seconds, phrases = time_stage(phrase_set, sentences,
+            args.phrase_length)
+        add('phrase_set', seconds, phrase_length=args.phrase_length)
+        seconds, counts = time_stage(count_phrase, phrases, sentences,
+            repeat=1)
+        add('count_phrase', seconds, phrases=len(phrases))
+
+    return times
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Time each stage of counting words and phrases on "
+        "synthetic texts, and write the times as JSON.")
+    parser.add_argument('--tokens', type=int, nargs='+',
+        default=[100000, 1000000],
+        help="the numbers of words in the texts (default: 100000 "
+        "1000000)")
+    parser.add_argument('--types', type=int, default=50000,
+        help="the number of different words (default: 50000)")
+    parser.add_argument('--punctuation', type=float, default=0.1,
+        help="the share of words followed by a punctuation (default: "
+        "0.1)")
+    parser.add_argument('--hyphens', type=float, default=0.05,
+        help="the share of hyphenated words in the vocabulary (default: "
+        "0.05)")
+    parser.add_argument('--numbers', type=float, default=0.02,
+        help="the share of numbers in the vocabulary (default: 0.02)")
+    parser.add_argument('--stop-lists', type=int, nargs='+',
+        default=[10, 100, 1000, 10000],
+        help="the sizes of the stop lists for exclude_words (default: 10 "
+        "100 1000 10000)")
+    parser.add_argument('--phrase-length', type=int, default=3,
+        help="the number of words in a phrase (default: 3)")
+    parser.add_argument('--phrase-set-limit', type=int, default=100000,
+        help="the longest text, in words, on which count_phrase is timed "
+        "(default: 100000)")
+    parser.add_argument('--output', default='stages.json',
+        help="the JSON file for the times (default: stages.json)")
+    parser.add_argument('--compare', metavar='JSON',
+        help="a JSON file written before, e.g., by another version, to "
+        "compare the times with")
+    args = parser.parse_args()
+
+    # The times of the same stages written before, if any.
+    before = {}
+    if args.compare is not None:
+        with open(args.compare, encoding='utf-8') as file_object:
+            for entry in json.load(file_object)['times']:
+                before[stage_key(entry)] = entry['seconds']
+
+    times = []
+    with tempfile.TemporaryDirectory() as folder:
+        for tokens in args.tokens:
+            times += time_stages(tokens, args, folder)
+
+    # With '--compare', the ratio of each time to the time before is
+    # printed too; a ratio above 1 means the stage is slower now.
+    print("Words\t\tStage\t\t\tSeconds" + ("\tRatio" if before else ""))
+    for entry in times:
+        stage = entry['stage']
+        if 'stop_words' in entry:
+            stage += ' (' + str(entry['stop_words']) + ')'
+        line = str(entry['tokens']).ljust(16) + stage.ljust(24)
+        line += format(entry['seconds'], '.4f')
+        if before.get(stage_key(entry)):
+            line += "\t" + format(
+                entry['seconds'] / before[stage_key(entry)], '.2f')
+        print(line)
+
+    with open(args.output, 'w', encoding='utf-8') as file_object:
+        json.dump({'version': git_version(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'time': time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
+            'options': vars(args), 'times': times},
+            file_object, indent=2)
+    print("Times written to " + args.output)
@@ -0,0 +1,141 @@
+# This Python program compares the memory and time of counting words
+# in class Counter with counting them by integer IDs (wordcount/vocab.py).
+# A text file with a Zipfian vocabulary, i.e., a few words are very
+# frequent and most are rare, is generated first. The peak memory while
+# counting, and the memory kept by the results, are measured by
+# tracemalloc, in another run than the time, as tracing slows down the
+# code in Python much more than that in C. Then, the time of filtering
+# the counts by length and listing the top words, or all the words from
+# the most frequent, is compared.
+# Last modified 2026-10-18 23:59
+
+
+# For generating the same text file every time.
+import random
+
+# For filtering and listing the top words of class Counter.
+from collections import Counter
+
+# For timing and measuring the memory of each way of counting.
+import time
+import tracemalloc
+
+# For reading options from the command line.
+import argparse
+
+# For importing the package wordcount from the folder above.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from wordcount.source import open_source
+from wordcount.count import count_text, count_stream
+from wordcount.vocab import count_ids, top_words, to_counter
+
+
+# The characters and character sets for splitting words, as in wdct.py.
+split_char = ":;!?\"#$&{}<>*/÷=\\@|·~‘“”–⋯"
+split_chars = [", ", ". ", ".\n", ".\r", "' ", "’ ", " (", ") "]
+
+
+def make_text(filename, tokens, types):
+    """
+    Write a text of a given number of words, drawn from a Zipfian
+    vocabulary of 'types' different words, into a file, and return the
+    file name.
+    """
+    random.seed(2022)
+    vocabulary = ['w' + format(index, 'x') + 'ord' for index in range(types)]
+    weights = [1 / (rank + 1) for rank in range(types)]
+    with open(filename, 'w', encoding='utf-8') as file_object:
+        for start in range(0, tokens, 100000):
+            words = random.choices(vocabulary, weights,
+                k=min(100000, tokens - start))
+            file_object.write(' '.join(words) + ', ')
+    return filename
+
+
+def measure(name, function, *args):
+    """
+    Run a way of counting twice, and print its time, the peak memory
+    while counting, and the memory kept by its results. Return the
+    results.
+    """
+    start = time.perf_counter()
+    function(*args)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    results = function(*args)
+    kept, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    msg = name + "\t" + format(seconds, '.2f') + " s, peak "
+    msg += format(peak / 1048576, '.1f') + " MB, kept "
+    msg += format(kept / 1048576, '.1f') + " MB"
+    print(msg)
+    return results
+
+
+def top_counter(results, top_common, min_length):
+    """
+    Filter the counts in class Counter by length, and list the top
+    words by 'most_common()'.
+    """
+    return Counter({word: count for word, count in results.items()
+        if len(word) >= min_length}).most_common(top_common)
+
+
+def count_whole(filename, min_length):
+    """Count the words of the whole text in class Counter."""
+    return count_text(open_source(filename), split_char, split_chars,
+        frozenset(), min_length)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Compare the memory of counting words in a Counter "
+        "and by integer IDs.")
+    parser.add_argument('--tokens', type=int, default=10000000,
+        help="the number of words in the text (default: 10000000)")
+    parser.add_argument('--types', type=int, default=1000000,
+        help="the number of different words (default: 1000000)")
+    parser.add_argument('--file', default='bench_vocab.txt',
+        help="where the text file is written (default: bench_vocab.txt)")
+    args = parser.parse_args()
+
+    make_text(args.file, args.tokens, args.types)
+    min_length = 4
+
+    whole = measure("Counter, whole text", count_whole, args.file,
+        min_length)
+    stream = measure("Counter, by chunks", count_stream, args.file,
+        split_char, split_chars, frozenset(), min_length)
+    vocabulary = measure("IDs, by chunks", count_ids, args.file,
+        split_char, split_chars)
+
+    print("Different words:\t" + str(len(vocabulary['counts'])))
+    print("Same top words:\t" + str(whole.most_common(40)
+        == top_words(vocabulary, 40, min_length)))
+
+    # The counts of all the lengths, filtered afterwards, by a Counter
+    # and by the arrays of the IDs.
+    results = to_counter(vocabulary)
+    for top_common in [40, None]:
+        name = "Top " + str(top_common) if top_common else "All words"
+        start = time.perf_counter()
+        expected = top_counter(results, top_common, min_length)
+        counter_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        listed = top_words(vocabulary, top_common, min_length)
+        ids_seconds = time.perf_counter() - start
+
+        msg = name + ", length >= " + str(min_length) + ":\tCounter "
+        msg += format(counter_seconds, '.3f') + " s, IDs "
+        msg += format(ids_seconds, '.3f') + " s, same: "
+        msg += str(listed == expected)
+        print(msg)
+
+    os.remove(args.file)
@@ -0,0 +1,94 @@
+# This Python program compares writing all the counted words of a
+# growing vocabulary as a text report built by string concatenation,
+# as the reports used to be, with writing them by
+# 'wordcount.export.write_counts()' as TSV, JSON Lines and in the
+# binary format, and reading them back by 'read_counts()'.
+# Last modified 2026-10-18 21:20
+
+
+# For generating the same counts every time.
+import random
+from collections import Counter
+
+# For timing each way of writing.
+import time
+
+# For keeping the files out of the way.
+import tempfile
+
+# For reading options from the command line.
+import argparse
+
+# For importing the package wordcount from the folder above.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from wordcount.export import write_counts, read_counts
+
+
+def make_results(types):
+    """
+    Return the counts of 'types' different words in class Counter, some
+    of which hold letters beyond ASCII.
+    """
+    random.seed(2022)
+    endings = ['', '', '', 'é', 'ß', '’s']
+    return Counter({'w' + format(index, 'x') + random.choice(endings):
+        random.randint(1, 1000) for index in range(types)})
+
+
+def concatenate(results, filename):
+    """Write all the words by 'msg +=', as the reports used to."""
+    msg = ""
+    for word, count in results.most_common():
+        msg += word + "\t\t" + str(count) + "\n"
+    with open(filename, 'w', encoding='utf-8') as file_object:
+        file_object.write(msg)
+
+
+def measure(function, *args):
+    """Run a way of writing or reading, and return its time in seconds."""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Compare writing all the counted words by string "
+        "concatenation and by the streaming writers.")
+    parser.add_argument('--types', type=int, nargs='+',
+        default=[100000, 200000, 400000, 1000000],
+        help="the numbers of different words (default: 100000 200000 "
+        "400000 1000000)")
+    parser.add_argument('--concat-limit', type=int, default=400000,
+        help="the most words written by concatenation, which takes much "
+        "longer (default: 400000)")
+    args = parser.parse_args()
+
+    print("Words\t\tConcat (s)\tTSV (s)\tJSONL (s)\tBinary (s)"
+        "\tRead binary (s)\tSize binary / TSV")
+    with tempfile.TemporaryDirectory() as folder:
+        for types in args.types:
+            results = make_results(types)
+            line = str(types).ljust(16)
+            if types <= args.concat_limit:
+                seconds = measure(concatenate, results,
+                    os.path.join(folder, 'report.txt'))
+                line += format(seconds, '.2f') + "\t\t"
+            else:
+                line += "-\t\t"
+
+            for form in ['tsv', 'jsonl', 'binary']:
+                seconds = measure(write_counts, results,
+                    os.path.join(folder, 'counts.' + form), form)
+                line += format(seconds, '.2f') + "\t"
+            filename = os.path.join(folder, 'counts.binary')
+            seconds = measure(list, read_counts(filename))
+            line += "\t" + format(seconds, '.2f') + "\t\t"
+            line += format(os.path.getsize(filename) / os.path.getsize(
+                os.path.join(folder, 'counts.tsv')), '.2f')
+            print(line)
@@ -1,86 +1,64 @@
 # This program counts the frequency of given words in a text file.
-# Last modified 2022-08-30 13.51
+#     The words are split and reported by the package 'wordcount';
+# this program only runs when it is started as a script.
+# Last modified 2026-10-18 18.50
 
-# For splitting words by blanks and punctuations.
-# Used by function 'split_words()'
-import re
+# For counting the words at once, instead of scanning for each word.
+from collections import Counter
 
-
-def split_words(contents):
-    """
-    Split a string into a list of words in lower cases, and return
-    that list. Requires to import modulus 're' to use re.sub().
-    """
-    string = contents.lower()   # turn letters into lower cases.
-    
-    # Replace each non-alphabetic character with a space.
-    string = re.sub('[^A-Za-z]', ' ', string)
-
-    words = string.split()
-    return words
-
-
-def output_results(results, txtsource, output_file):
-    """
-    Format the results, print them on screen, and store them in a
-    file.
-    """
-    import time     # For recording the time of running program.
-
-    # Format date and test conditions
-    msg = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-    msg += "\nRead file:\t" + txtsource + "\n"
-    
-    for result in results:
-        msg += result[0] + "\t\t" + str(result[1]) + "\n"
-
-    msg += "Output file:\t" + output_file + "\n\n\n"
-
-    # Print results and associated info.
-    print(msg)
-    # Also, write the results and associated into to the file.
-    with open(output_file, 'a') as file_object:
-        file_object.write(msg)
+# For splitting words by blanks and punctuations, and reporting.
+from wordcount.words import split_letters
+from wordcount.count import count_mapped_letters
+from wordcount.store import open_store, lookup_words
+from wordcount.report import report_counts
 
 
 
 # The main program
 
-# The file in which the original texts is stored.
-txtsource = 'resource\\source.txt'
+if __name__ == '__main__':
+
+    # The file in which the original texts is stored.
+    txtsource = 'resource\\source.txt'
 
-# The file where results will be stored.
-output_file = 'data\\results.txt'
+    # The file where results will be stored.
+    output_file = 'data\\results.txt'
 
-# This list stores which words will be counted.
-key_list = [
-    'which', 'what', 'who', 'whose', 'where', 'when', 'why',
-    'whether', 'while'
-    ]
+    # This list stores which words will be counted.
+    key_list = [
+        'which', 'what', 'who', 'whose', 'where', 'when', 'why',
+        'whether', 'while'
+        ]
 
-with open(txtsource) as f_obj:
-    contents = f_obj.read()
+    # The database file where the counts of all words are kept, so that
+    # the words are looked up without reading the text again, until the
+    # text file is changed. If it is '', the text is read every time.
+    index_file = 'data\\ct_word.db'
 
-words = split_words(contents)
+    if index_file != '':
+        counts = lookup_words(
+            open_store(index_file, repr(('ct_word',))), [txtsource],
+            count_mapped_letters, key_list)
 
-counts = {}      # Create an empty dict to store counting results.
+    else:
+        with open(txtsource) as f_obj:
+            contents = f_obj.read()
 
-for key in key_list:
-    count = 0
-    
-    for word in words:
-        if key == word:
-            count += 1
+        # All words are counted in a single pass, and each word in the
+        # list is then looked up.
+        words = Counter(split_letters(contents))
 
-    counts[key] = count
+        counts = {}      # Create an empty dict to store counting results.
 
-# Rearrange the order. The function sorted() will return a list of 
-# tuples to store the words and corresponding counts.
-#
-# key=lambda x:x[1]  -- It tells sorted() to sort based on the value 
-#                       of the second element in each item (i.e., 
-#                       the  counts, or say the value in the dict).
-results = sorted(counts.items(), key=lambda x:x[1], reverse=True)
+        for key in key_list:
+            counts[key] = words[key]
 
-output_results(results, txtsource, output_file)
+    # Rearrange the order. The function sorted() will return a list of 
+    # tuples to store the words and corresponding counts.
+    #
+    # key=lambda x:x[1]  -- It tells sorted() to sort based on the value 
+    #                       of the second element in each item (i.e., 
+    #                       the  counts, or say the value in the dict).
+    results = sorted(counts.items(), key=lambda x:x[1], reverse=True)
 
+    report_counts(results, txtsource, output_file)
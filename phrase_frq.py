@@ -2,331 +2,172 @@
 # combination of words in a text file. Specific phrases can be 
 # excluded, like those listed in a file. The most frequently 
 # counted words are displayed.
-# Last modified: 2022-08-30 14.22
+#     The counting is done by the package 'wordcount'; this program
+# only runs when it is started as a script.
+# Last modified: 2026-10-18 23.59
 
 
-# For splitting words by blanks, and splitting sentences by 
-# punctuations.
-import re
+# For reading a range of phrase lengths from the command line.
+import argparse
 
+# For counting the phrases of the fragments kept.
+from collections import Counter
 
-def open_source(filename):
-    """
-    Open the file and return contents as a list of characters for
-    further use. The files to be opened should be in ASCII encoding.
-    """
-    try:
-        with open(filename) as file_object:
-            contents = file_object.read()
+# For opening the text file, counting and reporting the phrases.
+from wordcount.source import open_source, open_exclusion
+from wordcount.phrases import (remove_char, split_sentence, read_sentences,
+    count_ngrams, exclude_phrase, top_counts, count_ngram_range,
+    decode_phrase, top_ngrams)
+from wordcount.sketch import count_ngrams_approx, summary_top
+from wordcount.fragments import open_fragments, count_stored_ngrams
+from wordcount.report import report_phrases
 
-    # Abort when the file is not found.
-    except FileNotFoundError:
-        print("Cannot open file '" + filename + "'.")
+# For saving the counts to be merged with those of other texts.
+from wordcount.snapshot import save_snapshot
 
-    # Abort when the coding is not correct,
-    # e.g., if it is not a text file, or the coding is wrong.
-    except UnicodeDecodeError:
-        message = "Cannot open file '" + filename + ".\n"
-        message += "Make sure it is an ASCII text file."
-        print(message)
 
-    else:
-        return contents
-
-
-def open_exclusion(filename):
-    """
-    Open the file containing words to be excluded. This will return
-    a string for further use.
-        The file to be openned should be in ASCII encoding.
-        If the file can't be openned properly, return ''.
-    """
-    try:
-        with open(filename) as file_object:
-            contents = file_object.read()
-
-    # Abort when the file is not found.
-    except FileNotFoundError:
-        msg = "Cannot open file '" + filename + "'.\n"
-        msg += "No phrase is exluded from counting.\n"
-        print(msg)
-        return ''
-
-    # Abort when the coding is not correct,
-    # e.g., if it is not a text file, or the coding is wrong.
-    except UnicodeDecodeError:
-        msg = "The coding of '" + filename + "' seems wrong.\n"
-        msg += "No phrase is exluded from counting.\n"
-        print(msg)
-        return ''
-
-    else:
-        return contents
-
-
-def remove_char(string, char_list=''):
-    """"
-    This will remove the specific characters listed in the 
-    string 'char_list' from the original string 'orig_string', and
-    return a new string.
-        DO NOT use any so-called separating characters (like a
-    space) in the 'char_list', because ALL the listed characters
-    will be chopped off.
-    """
-    for char in char_list:
-        if char in string:
-            string = string.replace(char, '')
-    return string
-
-
-def split_sentence(contents, split_chars=',.!?:;()'):
-    """
-    Split texts into short, sentence-like fragments according to 
-    punctuations, and return a list of sentences (strings).
-        Punctuation characters for spliting are typically '.!?:;', 
-    but a comma ',' is also considered.
-    """
-    split_pattern = "[" + split_chars + "]+"
-    sentences = re.split(split_pattern, contents)
-
-    # This loop removes empty spaces in each sentence fragment.
-    for index in range(len(sentences)):
-        sentences[index] = sentences[index].strip().lower()
-
-    return sentences
-
-
-def split_words(contents):
-    """
-    Split a string into a list of words, of which the letters are all
-    in lower cases, and return that list.
-    """
-    string = contents.lower()   # turn letters into lower cases.
-    
-    # Replace each non-alphabetic character with a space.
-    string = re.sub('[^A-Za-z\']', ' ', string)
 
-    words = string.split()
-    return words
-
-
-def phrases_in_sentence(sentence, phrase_length=2):
-    """
-    Extracts all phrases in a string (typically a sentence), and
-    return a list of these phrases. When the phrase cannot be
-    created (e.g., the sentence fragment is shorter than the given
-    length), an empty list is returned.
-        Phrases are defined as continuesly written words. The
-    length of the phrase (phrase_len) is defined as the number of
-    words in the phrase. The words are separated by blanks,
-    typically a space. 
-    """
-    words = split_words(sentence)
-
-    # Count the number of words in the splited sentence.
-    word_number = len(words)
-
-    # Create an empty list to store these phrases.
-    phrases = []
+# The main program.
 
-    # A phrase should not have less than 2 words.
-    if phrase_length < 2:
-        phrase_length = 2
-    
-    # Extract phrases in the sentence. 
-    # 's_index': the index in the sentence fragment.
-    # 'pr_index': the index in the phrase.
+if __name__ == '__main__':
+
+    phrase_length = 5   # The number of words in phrase.
+    top_range = 30      # Show only the top frequent phrases.
+    least_count = 3     # Phrases with less than this counts are skimmed.
+
+    # The file in which the original texts is stored.
+    txtsource = 'resource\\source.txt'
+
+    # The file stores words to be excluded from counting.
+    #     These words are separated from each other with a newline,
+    # i.e., each line stores only one phrase in the file.
+    exclusion = 'resource\\excl_phrase.txt'
+
+    # The file where results will be stored.
+    output_file = 'data\\results.txt'
+
+    # For very large texts, where almost every long phrase is unique,
+    # the phrases can be counted approximately, keeping the counts of
+    # at most 'capacity' phrases. Each count may then be less than the
+    # true count, by at most the number of phrases / (capacity + 1).
+    approximate = False
+    capacity = 100000
+
+    # The snapshot file where all the counts of the phrases are saved,
+    # so that the counts of texts split across several hosts can be
+    # merged, by 'python -m wordcount.snapshot'. It is only saved when
+    # the phrases of one length are counted exactly. If it is '', none
+    # is saved.
+    snapshot_file = ''
+
+    # The text is split into fragments and words only once, and they
+    # are kept as IDs in this file next to the text, until the text is
+    # changed, so that later runs count the phrases without splitting
+    # the text. They are not used for approximate counts. Set it to ''
+    # to split the text every time.
+    fragment_file = 'resource\\source.txt.frag'
+
+    # All phrases from 'min_n' to 'max_n' words can be counted in one
+    # run, e.g., 'python phrase_frq.py --min-n 2 --max-n 6', which
+    # splits the sentences into words only once for all lengths.
+    parser = argparse.ArgumentParser(
+        description="Count the frequency of all phrases in a text file.")
+    parser.add_argument('--min-n', type=int,
+        help="the least number of words in a phrase (default: 2)")
+    parser.add_argument('--max-n', type=int,
+        help="the most number of words in a phrase (default: --min-n)")
+    args = parser.parse_args()
+
+    # The phrases are counted from the fragments kept, if any, as they
+    # are counted from the sentences. 'sentences' stays empty when the
+    # text file cannot be read. For the approximate counts, whose
+    # summary is of fixed size, the sentences are read chunk by chunk
+    # while counted, so that the text is never kept in memory as well.
+    ranged = args.min_n is not None or args.max_n is not None
+    sentences = []
+    fragments = None
+    if approximate and not ranged:
+        sentences = read_sentences(txtsource, '"-')
+    elif fragment_file != '' and not approximate:
+        fragments = open_fragments(txtsource, fragment_file)
     else:
-        for s_index in range(word_number):
-            if (s_index + phrase_length) <= word_number:
-                phrase = ''     # An empty string to store a phrase.
-                for pr_index in range(phrase_length):
-                    phrase += words[s_index + pr_index] + ' '
-                phrase = phrase.rstrip()    # Remove the last space.
-                phrases.append(phrase)
-            else:
-                break
-        
-        phrases = set(phrases)     # Combine same phrases, if any.
-        return phrases
-
-
-def phrase_set(sentences, phrase_length=2):
-    """
-    Collect all phrases with given number of words in a list of
-    sentences, and return them as a list of phrases.
-        Same phrases are combined as one.
-    """
-    if phrase_length < 2:   # A phrase can't have less than 2 words.
-        phrase_length = 2
-
-    phrases = []            # An empty list to store phrases.
-    
-    for sentence in sentences:
-        phrases += phrases_in_sentence(sentence, phrase_length) 
-
-    while '' in phrases:    # Remove empty phrases, if any.
-        phrases.remove('')
-
-    phrases = set(phrases)  # Combine same phrases, if any.
-    return phrases
-
-
-def exclude_phrase(phrases, exclusion=''):
-    """
-    Exclude the phrases, as listed in the given file 'exclusion',
-    from a list of phrases (strings). This will return a list of
-    phrases without the excluded ones.
-        In the file 'exclusion', the phrases to be excluded are
-    separated from each other by a new line.
-    """
-    # When the file for storing excluded words is not given.
-    if exclusion == '':
-        return phrases
-    
-    # When the file for storing excluded words is given.
+        contents = open_source(txtsource)
+        clear_contents = remove_char(contents, '"-')
+
+        sentences = split_sentence(clear_contents)
+
+    # Only the exact counts of one length are kept in 'results'.
+    results = None
+
+    # Count the phrases of all lengths in the range at once, and report
+    # the top phrases of each length.
+    if ranged:
+        min_n = args.min_n if args.min_n is not None else 2
+        max_n = args.max_n if args.max_n is not None else min_n
+        if fragments is not None:
+            words, tables = count_stored_ngrams(fragments, min_n, max_n)
+        else:
+            words, tables = count_ngram_range(sentences, min_n, max_n)
+        top_tables = top_ngrams(words, tables, top_range, least_count,
+            exclusion)
+
+        for length, top_results in top_tables.items():
+            note = "Phrases of " + str(length) + " words."
+            report_phrases(top_results, top_range, least_count, txtsource,
+                output_file, note)
+
+    # Count the phrases approximately, in a summary of fixed size.
+    elif approximate:
+        summary = count_ngrams_approx(sentences, phrase_length, capacity)
+        exclude_phrase(summary['counts'], exclusion)
+
+        # The least counts are reported, and the note tells how many
+        # more each phrase may appear.
+        top_results = [(phrase, least) for phrase, least, most
+            in summary_top(summary, top_range, least_count)]
+        note = "Approximate counts: each may be less than the true count "
+        note += "by up to " + str(summary['error']) + " (of "
+        note += str(summary['total']) + " phrases)."
+
+    # Count all phrases of the fragments kept, as tuples of IDs, and
+    # turn them back into strings, the same as 'count_ngrams()' gives.
+    elif fragments is not None:
+        length = max(phrase_length, 2)  # As in 'count_ngrams()'.
+        words, tables = count_stored_ngrams(fragments, length, length)
+        results = Counter({decode_phrase(words, phrase_ids): count
+            for phrase_ids, count in tables[length].items()})
+        results = exclude_phrase(results, exclusion)
+
+        top_results = top_counts(results, top_range, least_count)
+        note = ''
+
+    # Count all phrases in one pass over the sentences. This gives the
+    # same results as 'count_phrase(phrase_set(sentences,
+    # phrase_length))', which scans all the sentences again for every
+    # phrase.
     else:
-        contents = open_exclusion(exclusion).lower()
-        exclude_phrases = contents.splitlines()
-
-        for exclude_phrase in exclude_phrases:
-            while exclude_phrase in phrases:
-                phrases.remove(exclude_phrase)
-        return phrases
-
-
-def list_a_in_b(str_a, str_b):
-    """
-    Count how many list_a, as a whole, continuous series of items,
-    can be found in list_b. 
-    """
-    list_a = split_words(str_a)
-    list_b = split_words(str_b)
-
-    a_len = len(list_a)
-    b_len = len(list_b)
-    count = 0
-    
-    for b_index in range(b_len):
-        if b_index + a_len <= b_len:
-
-            # Make a copy for part of list_b, and the length of the
-            # copy is the same length as that of list_a.
-            sect_b = []     # An empty list to store part of list_b.
-            for a_index in range(a_len):
-                sect_b.append(list_b[b_index + a_index])
-
-            # Compare if list_a is the same as sect_b.
-            if list_a == sect_b:
-                count += 1
-    
-    return count
-
-
-def count_phrase(phrases, sentences=[]):
-    """
-    Count the number of phrase in a list of sentences that have no
-    punctuations. This will return a dict containing each phrase as
-    the key and the corresponding counting as the value.
-    """
-    count_dict = {}     # An empty dict to store counting results.
-    
-    for phrase in phrases:
-        count = 0
-        
-        # Count a phrase in each sentence.
-        for sentence in sentences:
-            count += list_a_in_b(phrase, sentence)
-
-        count_dict[phrase] = count
-    
-    return count_dict
-
-
-def top_counts(count_dict, top_range=10, least_count=0):
-    """
-    Rearrange the phrase count results based on count numbers, from
-    more to less, and list the top counted phrases (by default, the
-    top 10). Those whose counts are less than a given number will
-    be ignored. In the end, the top counted phrases and their
-    corresponding counts are returned.
-    """
-    # Remove phrases with small counts. ???
-    for key in list(count_dict.keys()):
-        if count_dict[key] < least_count:
-            del count_dict[key]
-
-    # Sort the phrases by their counts
-    sorted_counts = sorted(count_dict.items(), key=lambda x:x[1], 
-        reverse=True)
-
-    top_counts = []     # An empty list to store top counted items.
-
-    # Pick the items with the count in the top range.
-    for index in range(len(sorted_counts)):
-        if index < top_range:
-            item = (sorted_counts[index][0], sorted_counts[index][1])
-            top_counts.append(item)
-
-    return top_counts
-
-
-def output_results(
-    top_results, top_range, least_count, txtsource, output_file
-    ):
-    """
-    Format the results, print them on screen, and store them in a
-    file.
-    """
-    import time     # For recording the time of running program.
-
-    # Format date and test conditions
-    msg = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-    msg += "\nRead file:\t" + txtsource + "\n"
-    msg += "The top " + str(top_range) + " results "
-    msg += "(skimmed if counts < " + str(least_count) + "):\n"
-
-    for index in range(len(top_results)):
-        msg += top_results[index][0] + "\t\t"
-        msg += str(top_results[index][1]) + "\n"
-
-    msg += "Output file:\t" + output_file + "\n\n\n"
-
-    # Print results and associated info.
-    print(msg)
-    # Also, write the results and associated into to the file.
-    with open(output_file, 'a') as file_object:
-        file_object.write(msg)
-
-
-
-# The main program.
-
-phrase_length = 5   # The number of words in phrase.
-top_range = 30      # Show only the top frequent phrases.
-least_count = 3     # Phrases with less than this counts are skimmed.
-
-# The file in which the original texts is stored.
-txtsource = 'resource\\source.txt'
-
-# The file stores words to be excluded from counting.
-#     These words are separated from each other with a newline,
-# i.e., each line stores only one phrase in the file.
-exclusion = 'resource\\excl_phrase.txt'
-
-# The file where results will be stored.
-output_file = 'data\\results.txt'
-
-contents = open_source(txtsource)
-clear_contents = remove_char(contents, '"-')
-
-sentences = split_sentence(clear_contents)
-phrases = phrase_set(sentences, phrase_length)
-phrases = exclude_phrase(phrases, exclusion)
-results = count_phrase(phrases, sentences)
-
-top_results = top_counts(results, top_range, least_count)
-
-output_results(
-    top_results, top_range, least_count, txtsource, output_file
-    )
+        results = count_ngrams(sentences, phrase_length)
+        results = exclude_phrase(results, exclusion)
+
+        top_results = top_counts(results, top_range, least_count)
+        note = ''
+
+    # Save the exact counts of one length, from the fragments or the
+    # sentences, as a snapshot. The settings tell the phrases excluded,
+    # as 'exclude_phrase()' reads them, and the characters removed from
+    # the text and those splitting it, rather than the path of the
+    # exclusion file, which may differ between hosts.
+    if snapshot_file != '' and results is not None:
+        excluded = []
+        if exclusion != '':
+            excluded = sorted(set(
+                open_exclusion(exclusion, 'phrase').lower().splitlines()))
+        settings = repr(('phrase_frq', phrase_length, excluded, '"-',
+            ',.!?:;()'))
+        save_snapshot(results, snapshot_file, 'phrases', settings,
+            [txtsource])
+
+    if not ranged:
+        report_phrases(
+            top_results, top_range, least_count, txtsource, output_file,
+            note)
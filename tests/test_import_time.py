@@ -0,0 +1,94 @@
+# These tests check that importing the package wordcount in a new Python
+# process is fast, and that it neither loads the modules only needed for
+# drawing word clouds or running the service, nor runs any counting,
+# and that counting a short text does not import NumPy either.
+# The time is read from 'python -X importtime'. See
+# 'benchmarks/import_time.py' for measuring the time of the scripts too.
+# Run them by 'python -m pytest' in the folder above.
+# Last modified 2026-10-18 23:58
+
+
+# For importing the package in a new Python process.
+import subprocess
+import sys
+
+# For running the imports in the folder above.
+import os
+
+import pytest
+
+
+# The folder of the package and the scripts.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The most time importing the package may take, in seconds. It takes
+# about 0.05 s; NumPy or Matplotlib alone take longer than this.
+MAX_SECONDS = 0.2
+
+# The modules that take long to import, and must not be imported with
+# the package.
+HEAVY_MODULES = ['numpy', 'matplotlib', 'wordcloud', 'PIL', 'asyncio']
+
+
+def import_package(module='wordcount'):
+    """
+    Import a module in a new Python process by 'python -X importtime',
+    and return a tuple of its cumulative import time in seconds and the
+    list of all the modules imported, with the module itself last.
+    """
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+        cwd=ROOT, check=True, capture_output=True, text=True)
+
+    # Each line is 'import time: self [us] | cumulative | name', and the
+    # names of nested imports are indented.
+    times = {}
+    modules = []
+    for line in output.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative) / 1000000
+        modules.append(name.strip())
+    return times[module], modules
+
+
+def test_import_time():
+    # The best of a few runs, so that a busy machine does not fail it.
+    best = min(import_package()[0] for index in range(3))
+    assert best < MAX_SECONDS
+
+
+@pytest.mark.parametrize('module', ['wordcount', 'wdct', 'word_frq',
+    'phrase_frq', 'ct_word', 'ct_phrase'])
+def test_no_heavy_modules(module):
+    seconds, modules = import_package(module)
+    assert modules[-1] == module
+    imported = set(name.split('.')[0] for name in modules)
+    assert [name for name in HEAVY_MODULES if name in imported] == []
+
+
+def test_no_output():
+    # Importing the scripts does not run their main programs.
+    for module in ['wordcount', 'wdct', 'word_frq', 'phrase_frq',
+            'ct_word', 'ct_phrase']:
+        output = subprocess.run([sys.executable, '-c', 'import ' + module],
+            cwd=ROOT, check=True, capture_output=True, text=True)
+        assert output.stdout == ''
+
+
+def test_count_without_heavy_modules():
+    # The masks of 'filter_words()' are only made by NumPy when asked.
+    code = ('import sys\n'
+        'from wordcount import count_text\n'
+        'results = count_text("The 2 words of the text, of 3 words", '
+        'min_length=2)\n'
+        'print(sorted(results.items()))\n'
+        'print(sorted(name for name in sys.modules'
+        ' if name.split(".")[0] in ' + repr(HEAVY_MODULES) + '))\n')
+    output = subprocess.run([sys.executable, '-c', code],
+        cwd=ROOT, check=True, capture_output=True, text=True)
+    counts, heavy = output.stdout.splitlines()
+    assert counts == ("[('of', 2), ('text', 1), ('the', 2), "
+        "('words', 2)]")
+    assert heavy == '[]'
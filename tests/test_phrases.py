@@ -0,0 +1,89 @@
+# These tests check that 'count_ngrams()' counts all phrases of a given
+# number of words the same as the former way of phrase_frq.py, i.e.,
+# 'count_phrase()' on the phrases collected by 'phrase_set()', and as
+# counting each phrase by 'list_a_in_b()' in each sentence, and that
+# 'count_ngram_range()' counts each length the same as 'count_ngrams()'.
+# Run them by 'python -m pytest' in the folder above.
+# Last modified 2026-10-18 23:58
+
+
+# For generating the same random text every time.
+import random
+
+# For importing the package wordcount from the folder above.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+import pytest
+
+from wordcount.phrases import (remove_char, split_sentence, phrase_set,
+    list_a_in_b, count_phrase, count_ngrams, count_ngram_range,
+    decode_phrase)
+
+
+# A text with capital letters, apostrophes, quotes, hyphens, repeated
+# and overlapping phrases, and fragments shorter than a phrase.
+TEXT = """
+The word count of the text. Of which of the words, of which of them?
+"It's the word," she said; it's the word count (of the text)! Yes.
+A well-known word: the word count of the word count of the text.
+Of of of of of. The the. Which: of which of which of which.
+"""
+
+
+def make_text(words, sentences):
+    """
+    Return a random text of a number of sentences, with words drawn
+    from a short list, so that many phrases are repeated or overlap.
+    """
+    random.seed(2022)
+    punctuations = ['.', ',', '!', '?', ';', ':']
+    return ' '.join(' '.join(random.choices(words, k=random.randint(1, 12)))
+        + random.choice(punctuations) for index in range(sentences))
+
+
+def split_text(text):
+    """Split a text into sentences, as phrase_frq.py does."""
+    return split_sentence(remove_char(text, '"-'), ',.!?:;()')
+
+
+@pytest.mark.parametrize('phrase_length', [2, 3, 4, 5])
+@pytest.mark.parametrize('text', [TEXT,
+    make_text(['of', 'which', 'the', 'word', "it's", 'Count'], 300)])
+def test_same_as_count_phrase(text, phrase_length):
+    sentences = split_text(text)
+    expected = count_phrase(phrase_set(sentences, phrase_length), sentences)
+    assert count_ngrams(sentences, phrase_length) == expected
+
+
+@pytest.mark.parametrize('phrase_length', [2, 3])
+def test_same_as_list_a_in_b(phrase_length):
+    sentences = split_text(TEXT)
+    expected = {phrase: sum(list_a_in_b(phrase, sentence)
+        for sentence in sentences)
+        for phrase in phrase_set(sentences, phrase_length)}
+    assert count_ngrams(sentences, phrase_length) == expected
+
+
+def test_overlapping_phrases():
+    results = count_ngrams(split_text(TEXT), 2)
+    assert results['of which'] == 5
+    assert results['which of'] == 4
+    assert results['of of'] == 4
+
+
+def test_short_phrase_length():
+    sentences = split_text(TEXT)
+    assert count_ngrams(sentences, 1) == count_ngrams(sentences, 2)
+
+
+def test_same_as_count_ngram_range():
+    sentences = split_text(make_text(['a', 'b', 'c', 'd'], 200))
+    words, tables = count_ngram_range(sentences, 2, 5)
+    for phrase_length, table in tables.items():
+        assert {decode_phrase(words, phrase_ids): count
+            for phrase_ids, count in table.items()} == count_ngrams(
+            sentences, phrase_length)
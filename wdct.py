@@ -6,361 +6,318 @@
 # in a file or those shorter than a given length. and the most
 # frequently counted words are displayed.
 # UTF-8 encoding is used for reading all text files.
-# Last modified 2022-10-12 18:45
+#     The counting is done by the package 'wordcount', which can also
+# be imported by other programs; this program only runs when it is
+# started as a script.
+# Last modified 2026-10-18 23:59
 
 
 
-# For counting by frequency.
-from collections import Counter
-
-# Modulus for creating word clouds.
-import wordcloud
-
-# The class 'Image' is needed to open images.
-from PIL import Image
-
-# For preparing the image array for image masking and color pattern.
-import numpy as np
-
-# For displaying the word cloud on the screen.
-import matplotlib.pyplot as plt
-
-# For getting the time and forming the result report. 
-import time
-
-
-
-def open_source(filename):
-    """
-    Open the file and return text contents as a string.
-    UTF-8 encoding is used for opening the text file.
-    """
-    try:
-        with open(filename, encoding='utf-8') as file_object:
-            contents = file_object.read()    
-
-    except FileNotFoundError:   # Abort when the file is not found.
-        print("Cannot open file '" + filename + "'.")
-
-    # Abort when the coding is not correct, e.g., when it is not a
-    # text file, or the coding is wrong.
-    except UnicodeDecodeError:
-        message = "Cannot open file '" + filename + ".\n"
-        message += "Make sure it is an UTF-8 encoded text file."
-        print(message)
-
-    else:
-        return contents
-
-
-def open_exclusion(filename):
-    """
-    Open the file containing words to be excluded (sometimes called
-    'stop word'). This will return a string for further use.
-        The file to be openned should be in ASCII encoding.
-        If the file can't be openned properly, return ''.
-    """
-    try:
-        with open(filename, encoding='utf-8') as file_object:
-            contents = file_object.read()
-
-    # Abort when the file is not found.
-    except FileNotFoundError:
-        msg = "Cannot open file '" + filename + "'. for excluding "
-        msg += "specific words.\n"
-        msg += "No word is exluded from word counting.\n"
-        print(msg)
-        return ''
-
-    # Abort when the coding is not correct,
-    # e.g., if it is not a text file, or the coding is wrong.
-    except UnicodeDecodeError:
-        msg = "The coding of '" + filename + "' seems wrong.\n"
-        msg += "No word is exluded from word counting.\n"
-        print(msg)
-        return ''
-
-    else:
-        return contents
-
-
-def split_words(contents, split_char="", split_chars=[", ", ". "]):
-    """
-    Split a text string (the 'contents') into a list of words in lower
-    cases, and return the word list. Characters listed in 'split_char'
-    will be replaced by a space, and character sets in the list
-    'split_chars' will be replaced by a space, too. Then, blank
-    characters are used as for word splitting.
-    """
-    string = contents.lower()    # Turn all letters into lower cases.
-
-    # Replace all spliting characters (mostly punctuations) into
-    # spaces. For dealing with acadamic papers, uft-8 encoding is
-    # suggested to avoid encoding errors.
-    for char in split_char:
-        string = string.replace(char, ' ')
-
-    # Replace all splitting character sets into spaces.
-    for chars in split_chars:
-        string = string.replace(chars, ' ')
-
-    # Split the text string by blank letters, including the space, \t,
-    # \r, and \n.
-    words = string.split()
-
-    return words
-
-
-def exclude_words(words, exclude_string=''):
-    """
-    Exclude the words listed in the given file 'exclusion'.
-    This will return a list words without the excluded words.
-    """
-    # When the file for storing excluded words is not given. This may
-    # happen, for instance, when the file storing excluded words
-    # cannot be opened properly.
-    if exclude_string == '':
-        return words
-    
-    # When the file for storing excluded words is given.
-    else:
-        exclude_string = exclude_string.lower()
-        exclude_words = split_words(exclude_string)
-        for exclude_word in exclude_words:
-            while exclude_word in words:
-                words.remove(exclude_word)
-        return words
-
-
-def min_word_length(words, min_length=1):
-    """
-    Exclude words short than the minimum length as defined by the
-    'min_length', and return a list of words without these short words.
-    """
-    if min_length <= 1:     # A word cannot be less than a character.
-        return words
-    else:
-        sorted_words = []   # Store the new word list for returning.
-        for index in range(len(words)):
-            if len(words[index]) >= min_length:
-                sorted_words.append(words[index])
-        return sorted_words
-
-
-def is_num(string):
-    """
-    Determine if a string is a number or not. The number can be an
-    integer or a folat, and can be a positive or a negative number.
-    This is used by the following function 'del_num()'.
-    """
-    if len(string) == 0:
-        return False
-    
-    if (string[0] == '-' or string[0] == '+'):
-        string = string[1:]     # Remove the negetive sign.
-
-    # Split the string into sections by the decimal mark '.'.
-    sects = string.split('.')
-
-    if len(sects) > 2:          # A number cannot have > 2 sections.
-        return False
-    else:
-        for sect in sects:      # Check if each sector is a number.
-            if not sect.isdigit():
-                return False
-            else:
-                return True
-    
-
-def del_num(words):
-    """
-    Remove numbers (including negative ones) from a list of strings.
-    """
-    sorted_words = []
-
-    for word in words:
-        if is_num(word):
-            continue
-        else:
-            sorted_words.append(word)
-
-    return sorted_words
-
-
-def remove_less_counts(results, min_count=1):
-    """
-    Exclude words with counts less than a given value.
-    The count results are a list of tuples containing two elements - 
-    the counted element (the word) and the member of count.
-    """
-    if min_count <= 1:          # A listed word cannot have < 1 count.
-        return results
-    else:
-        sorted_results = []     # Store the result list for returning.
-        for index in range(len(results)):
-            if results[index][1] >= min_count:
-                sorted_results.append(results[index])
-        return sorted_results
-
-
-def report_results(
-    results,        # Word frequency results in class Counter.
-    min_length,     # The minimal length of the word for counting.
-    min_count,      # The minimal counting number of the word.
-    top_common,     # The top most frequently counted words.
-    txtsource,      # Where the text is stored (for report).
-    exclude_string, # Words to be excluded (for reporting.
-    report_file,    # Where the result report is stored.
-    ):
-    """
-    This is the reporting function that will format the results, print
-    them on screen, form the word cloud image, display them on screen,
-    and save these files.
-    """
-    # Format date and test conditions
-    msg = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-    msg += "\nRead file:\t" + txtsource + "\n"
-
-    if exclude_string == '':
-        msg += "No word is specifically excluded.\n"
-    else:
-        msg += "Exclusion word list is applied.\n"
-
-    msg += "Word length >= " + str(min_length) + ", "
-    msg += "count >= " + str(min_count) + ". "
-    msg += "Top " + str(top_common) + " most frequent words:\n"
-
-    # Format results for printing and storage.
-    top_words = results.most_common(top_common)
-    printed_words = remove_less_counts(top_words, min_count)
-
-    for printed_word in printed_words:
-        msg += printed_word[0] + "\t\t" + str(printed_word[1]) + "\n"
-
-    msg += "Output file:\t" + report_file + "\n\n\n"
-    
-    # Print results and associated info.
-    print(msg)
-
-    # Also, write the results and associated into to the file.
-    with open(report_file, 'a') as file_object:
-        file_object.write(msg)
-
-
-
-def open_mask(mask_image):
-    """
-    This function forms an image array for generating a mask image and
-    a color pattern, both of which will be used for the word cloud.
-    Note that words will not show on areas with the white color (NOT
-    transparent areas).
-    """
-    try:
-        img_array = np.array(Image.open(mask_image))
-    except FileNotFoundError:
-        return None
-    else:
-        info = "Apply the mask file '" + mask_image
-        info += "' for the word cloud.\n"
-        print(info)
-        return img_array
-
-
-def draw_word_cloud(
-    word_frq,       # A dictionary storing the word frequency results. 
-    max_words=200,  # How many (most frequent) words will display.
-    wc_img=None,    # Where the word cloud image will be stored.
-    img_array=None  # The image array for mask and color patterning.
-    ):
-    """
-    Draw the word cloud, display it on the screen, and save it.
-    More parameters about the word cloud image formed can be adjusted
-    inside this function.
-    """
-    # Create the word cloud and apply the mask
-    wc_obj = wordcloud.WordCloud(
-        width=1000,                 # The width of the word cloud.
-        height=1000,                # The height of the word cloud.
-        background_color='white',   # Background color; default black.
-        font_path='arialbd.ttf',    # Use the "Arial Bold" font.
-        min_font_size=12,           # Minimum font size; 4 by default.
-      # max_font_size=24,           # Maximum font size.
-        max_words=max_words,        # Maximal number of words to show.
-        mask=img_array              # Apply a mask array for output.
-        )
-
-    # Generate the word cloud object using the given text.
-    wc_obj.generate_from_frequencies(word_frq)
-
-    # Tailor the color pattern of the word cloud from the patten of a
-    # given image. Here, the image used is the same as the mask image.
-    # img_colors = wordcloud.ImageColorGenerator(mskimg)
-    if img_array is None:
-        print("No mask is applied for creating the word cloud.\n")
-    else:
-        # Extract the color pattern for image mask.
-        img_colors = wordcloud.ImageColorGenerator(img_array)
-        wc_obj.recolor(color_func=img_colors)
-
-    # Display the word cloud on the screen.
-    plt.imshow(wc_obj, interpolation='bilinear')
-    plt.axis('off')     # Hide the axis
-    plt.show()          # Display the image on the screen
-
-    # Save the word cloud output to an image
-    wc_obj.to_file(wc_img)
-
-
-
-# The following is the main program:
-
-# All the .TXT files should be in UTF-8 or ASCII encoding.
-txtsource = '.\\resource\\SERev.txt'    # Text file to be analyzed.
+# For reading options, e.g., the number of workers, from command line.
+import argparse
 
-# This file stores the words to be excluded from counting.
-# Words are separated from each other with a comma and/or a space.
-exclusion = '.\\resource\\excl_word.txt'
+# For stopping when the text file cannot be counted.
+import sys
 
-report_file = '.\\data\\results.txt'    # For saving results.
-mask_image = ".\\resource\\cube.png"    # For image mask and coloring.
-wc_img = ".\\data\\SERev.png"           # For saving word cloud image.
-
-
-# Parameters for counting the word frequency, which will be saved in
-# a report file.
-min_length = 4      # The least lenght of a word.
-top_common = 40     # The top frequent words to list out.
-min_count = 3       # Only words' frequency >= this will be listed.
-
-# Define the characters and character sets for splitting words. Blank
-# characters have been already included so it is not necessary to
-# list them.
-split_char = ":;!?\"#$&{}<>*/÷=\\@|·~‘“”–⋯"
-split_chars = [", ", ". ", ".\n", ".\r", "' ", "’ ", " (", ") "]
+# For keeping the top words counted by integer IDs.
+from collections import Counter
 
+# For opening the text files, counting and reporting the words.
+from wordcount.source import open_source, open_exclusion
+from wordcount.words import compile_exclusion
+from wordcount.count import (count_text, count_stream, count_mapped,
+    count_parallel, find_sources, count_batch)
+from wordcount.vocab import count_ids, top_words, to_counter
+from wordcount.topk import new_top_view
+from wordcount.pipeline import count_pipeline
+from wordcount.report import report_results
+from wordcount.export import write_counts
+from wordcount.snapshot import save_snapshot
 
-contents = open_source(txtsource)
-words = split_words(contents, split_char, split_chars)
+# For measuring each stage of counting, with '--stats'.
+from wordcount.instrument import (start_recording, stop_recording,
+    measure_stage, stage_summary, write_stages)
 
-exclude_string = open_exclusion(exclusion)
+# For keeping the counts of files between runs.
+from wordcount.store import open_store, update_store
 
-# remove words that are not taken into account.
-words = exclude_words(words, exclude_string)
+# For drawing the word cloud. The modules for drawing are imported only
+# when the word cloud is drawn.
+from wordcount.cloud import open_mask, draw_word_cloud
 
-words = min_word_length(words, min_length)  # Remove short words.
-words = del_num(words)      # Remove numbers in the list of words.
 
-# Counting the words utilizing class Counter.
-# The results forms a dictionary which is encapsuled in a tuple, so
-# that the order of key-value pairs can be kept. Words are listed as
-# keys, and the corresponding count numbers are the values for those
-# keys. This class will also be used to generate the word cloud.
-results = Counter(words)
 
-report_results(results, min_length, min_count, top_common, txtsource,
-        exclude_string, report_file)
+# The following is the main program:
 
+if __name__ == '__main__':
+
+    # All the .TXT files should be in UTF-8 or ASCII encoding.
+    txtsource = '.\\resource\\SERev.txt'    # Text file to be analyzed.
+
+    # This file stores the words to be excluded from counting.
+    # Words are separated from each other with a comma and/or a space.
+    exclusion = '.\\resource\\excl_word.txt'
+
+    report_file = '.\\data\\results.txt'    # For saving results.
+    batch_file = '.\\data\\batch.tsv'     # For tables in batch mode.
+    mask_image = ".\\resource\\cube.png"    # For image mask, coloring.
+    wc_img = ".\\data\\SERev.png"           # For saving word cloud image.
+
+
+    # Parameters for counting the word frequency, which will be saved
+    # in a report file.
+    min_length = 4      # The least lenght of a word.
+    top_common = 40     # The top frequent words to list out.
+    min_count = 3       # Only words' frequency >= this will be listed.
+    cloud_words = 200   # How many words are shown in the word cloud.
+
+    # For large files, the text can be read by chunks of this many
+    # characters at a time. If it is 0, the whole file is read at once.
+    chunk_size = 0
+
+    # With '--pipeline', the words flow through these filters, in this
+    # order, one word at a time, and the file is read chunk by chunk.
+    # See 'FILTERS' in wordcount/pipeline.py for the filters.
+    filters = ['exclude', 'min_length', 'numbers']
+
+    # The database file where the counts are kept between runs, so that
+    # the text file, or each file in batch mode, is only counted again
+    # when it has been changed. If it is '', the counts are not kept.
+    store_file = ''
+
+    # In batch mode with '--ingest', this many files are read at the
+    # same time while others are counted, and at most this many bytes
+    # are read but not yet counted.
+    readers = 8
+    max_in_flight = 64 * 1048576
+
+    # Define the characters and character sets for splitting words.
+    # Blank characters have been already included so it is not
+    # necessary to list them.
+    split_char = ":;!?\"#$&{}<>*/÷=\\@|·~‘“”–⋯"
+    split_chars = [", ", ". ", ".\n", ".\r", "' ", "’ ", " (", ") "]
+
+
+    # The number of worker processes can be given from the command
+    # line, e.g., 'python wdct.py --workers 8', and so can reading the
+    # file through a memory map, e.g., 'python wdct.py --mmap', and
+    # counting many files, e.g., 'python wdct.py --batch resource', also
+    # with the files read while others are counted, '--ingest'.
+    parser = argparse.ArgumentParser(
+        description="Count the frequency of all words in a text file.")
+    parser.add_argument('--workers', type=int, default=1,
+        help="the number of processes for counting (default: 1)")
+    parser.add_argument('--mmap', action='store_true',
+        help="read the ASCII or UTF-8 file through a memory map")
+    parser.add_argument('--batch', metavar='PATTERN',
+        help="count all .txt files in a folder, or files matching a glob "
+        "pattern, instead of the text file")
+    parser.add_argument('--ids', action='store_true',
+        help="count the words chunk by chunk, and find the top words on "
+        "arrays of their counts by integer IDs")
+    parser.add_argument('--progress', action='store_true',
+        help="read the file chunk by chunk, and print the current top "
+        "words after each chunk")
+    parser.add_argument('--pipeline', action='store_true',
+        help="count the words through a chain of lazy filters, chunk by "
+        "chunk, without any list of all the words")
+    parser.add_argument('--ingest', action='store_true',
+        help="in batch mode, read the files while others are counted, "
+        "for many small files")
+    parser.add_argument('--output', metavar='FILE',
+        help="also write all the counted words, not only the top ones, "
+        "into FILE, from the most frequent")
+    parser.add_argument('--format', choices=['tsv', 'jsonl', 'binary'],
+        default='tsv',
+        help="the format of the file of '--output' (default: tsv)")
+    parser.add_argument('--snapshot', metavar='FILE',
+        help="save all the counts as a snapshot in FILE, which can be "
+        "merged with others by 'python -m wordcount.snapshot'")
+    parser.add_argument('--quiet', action='store_true',
+        help="do not print the report of the top words on screen; it is "
+        "still added to the report file")
+    parser.add_argument('--stats', choices=['text', 'json', 'prometheus'],
+        help="measure the wall time and the words in and out of each "
+        "stage, and summarize them as text after the report, or write "
+        "them as JSON or as a Prometheus text file")
+    parser.add_argument('--stats-file', metavar='FILE',
+        help="the file for the summary of the stages (default: "
+        "stages.json or stages.prom; with text, the report file)")
+    parser.add_argument('--trace-memory', action='store_true',
+        help="with '--stats', also measure the peak memory of each stage "
+        "by tracemalloc, which makes counting slower")
+    parser.add_argument('--profile', metavar='FILE',
+        help="with '--stats', also profile the run by cProfile, and save "
+        "the profile in FILE, for 'python -m pstats FILE'")
+    args = parser.parse_args()
+    workers = args.workers
+
+    # With '--stats', each stage is measured; otherwise 'recorder' is
+    # None and nothing is measured.
+    recorder = None
+    if args.stats is not None:
+        recorder = start_recording(args.trace_memory,
+            args.profile is not None)
+
+    exclude_string = open_exclusion(exclusion)
+    exclusion_set = compile_exclusion(exclude_string)
+
+    # The vocabulary of the counts by integer IDs, with '--ids'.
+    vocabulary = None
+
+    # All the ways of counting are measured as one stage, 'count'. When
+    # the text is counted as a whole, its stages are also measured one
+    # by one.
+    with measure_stage(recorder, 'count') as record:
+        # Take the counts kept from the last run, if the text file has not
+        # been changed since then, or count it again through a memory map.
+        # In batch mode, so is each of the files, and only those new or
+        # changed are read; the tables of each file are kept in the
+        # store instead of 'batch_file'.
+        if store_file != '':
+            settings = repr(('wdct', split_char, split_chars,
+                sorted(exclusion_set), min_length))
+            sources = [txtsource]
+            if args.batch is not None:
+                txtsource = args.batch
+                sources = find_sources(args.batch)
+            results = update_store(
+                open_store(store_file, settings), sources,
+                lambda filename: count_mapped(filename, split_char,
+                    split_chars, exclusion_set, min_length))
+
+        # Count many text files in one run. All the counts of each file
+        # are written into 'batch_file', and the results of all are
+        # reported.
+        # With '--ingest', the files are read while others are counted.
+        elif args.batch is not None and args.ingest:
+            # Imported only here, as asyncio takes long to import.
+            from wordcount.ingest import count_ingested
+
+            txtsource = args.batch
+            results = count_ingested(find_sources(args.batch), batch_file,
+                split_char, split_chars, exclusion_set, min_length,
+                workers, readers, max_in_flight)
+
+        elif args.batch is not None:
+            txtsource = args.batch
+            results = count_batch(find_sources(args.batch), batch_file,
+                split_char, split_chars, exclusion_set, min_length,
+                workers)
+
+        # Split the text file into shards and count them on multiple CPU
+        # cores, through a memory map shared by all the processes. The
+        # results are the same as counting in one process.
+        elif workers > 1:
+            results = count_parallel(txtsource, split_char, split_chars,
+                exclusion_set, min_length, workers)
+
+        # Count the words chunk by chunk, and keep their counts by integer
+        # IDs in arrays. Only the top words, which are all that the report
+        # and the word cloud use, are taken out of them here.
+        elif args.ids:
+            vocabulary = count_ids(txtsource, split_char, split_chars,
+                exclusion_set, max(chunk_size, 1048576))
+            results = None
+            if vocabulary is not None:
+                results = Counter(dict(top_words(
+                    vocabulary, max(top_common, cloud_words), min_length)))
+
+        # Count the text file through a memory map, without decoding all
+        # the text into a string.
+        elif args.mmap:
+            results = count_mapped(txtsource, split_char, split_chars,
+                exclusion_set, min_length)
+
+        # Count the words through the filters, one word at a time, so that
+        # the memory used does not grow with the length of the text.
+        elif args.pipeline:
+            results = count_pipeline(txtsource, split_char, split_chars,
+                filters,
+                {'exclusion': exclusion_set, 'min_length': min_length},
+                chunk_size or 1048576)
+
+        # Read and count the text file chunk by chunk, for files too large
+        # to be kept in memory. The results are the same as counting as a
+        # whole. With '--progress', the current top words are printed after
+        # each chunk.
+        elif chunk_size > 0 or args.progress:
+            top_view = None
+            if args.progress:
+                top_view = new_top_view(10, min_count)
+            results = count_stream(txtsource, split_char, split_chars,
+                exclusion_set, min_length, chunk_size or 1048576, top_view)
 
-# Generate the word cloud image applying a mask image.
-img_array = open_mask(mask_image)
-draw_word_cloud(results, 200, wc_img, img_array)
+        else:
+            with measure_stage(recorder, 'open_source'):
+                contents = open_source(txtsource)
+
+            # Split the words, remove words that are not taken into
+            # account (short words and numbers), and count them utilizing
+            # class Counter. Words are listed as keys, and the
+            # corresponding count numbers are the values for those keys.
+            # This class will also be used to generate the word cloud.
+            results = count_text(contents, split_char, split_chars,
+                exclusion_set, min_length, recorder)
+
+        if results is not None:
+            record['tokens_out'] = sum(results.values())
+
+    # Stop when the text file cannot be counted; the reason has been
+    # printed.
+    if results is None:
+        sys.exit(1)
+
+    with measure_stage(recorder, 'report_results'):
+        report_results(results, min_length, min_count, top_common,
+            txtsource, exclude_string, report_file, not args.quiet)
+
+    # Save all the counts as a snapshot, to be merged with those of
+    # other parts of the texts. The settings tell which snapshots can
+    # be merged. With '--ids', 'results' only holds the top words, and
+    # all the counts are taken from the vocabulary.
+    if args.snapshot is not None:
+        settings = repr(('wdct', split_char, split_chars,
+            sorted(exclusion_set), min_length))
+        sources = [txtsource]
+        if args.batch is not None:
+            sources = find_sources(args.batch)
+        counts = results
+        if vocabulary is not None:
+            counts = to_counter(vocabulary, min_length)
+        save_snapshot(counts, args.snapshot, 'words', settings, sources)
+
+    # Write all the counted words, which may be millions, into a file,
+    # rather than into the report. With '--ids', they are listed from
+    # the vocabulary, from the most frequent.
+    if args.output is not None:
+        counts = results
+        if vocabulary is not None:
+            counts = top_words(vocabulary, None, min_length)
+        with measure_stage(recorder, 'write_counts') as record:
+            record['tokens_out'] = write_counts(counts, args.output,
+                args.format)
+
+    # Summarize the stages after the report, both on screen and in the
+    # report file, or write them as JSON or as a Prometheus text file.
+    # This is done before the word cloud, whose window waits for the
+    # user to close it, so the word cloud is not a stage.
+    if recorder is not None:
+        stop_recording(recorder, args.profile or '')
+        if args.stats == 'text' and args.stats_file is None:
+            summary = stage_summary(recorder)
+            print(summary)
+            try:
+                with open(report_file, 'a', encoding='utf-8') as file_object:
+                    file_object.write("\n" + summary)
+            except OSError:
+                print("Cannot write the stages into '" + report_file + "'.")
+        else:
+            stats_file = args.stats_file or {'text': 'stages.txt',
+                'json': 'stages.json', 'prometheus': 'stages.prom'}[args.stats]
+            write_stages(recorder, stats_file, args.stats)
+            print("Stages written to " + stats_file)
+
+    # Generate the word cloud image applying a mask image.
+    img_array = open_mask(mask_image)
+    draw_word_cloud(results, cloud_words, wc_img, img_array)
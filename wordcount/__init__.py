@@ -0,0 +1,24 @@
+# This Python package counts the frequency of words and phrases in
+# English text files. It is used by the scripts word_frq.py, wdct.py,
+# phrase_frq.py, ct_word.py and ct_phrase.py, and can be imported by
+# other programs without running any of them.
+#     Importing the package does not read any file, and the modules for
+# drawing word clouds are imported only when a word cloud is drawn.
+# See 'benchmarks/import_time.py' for the time it takes to import.
+# Last modified 2026-10-18 21:50
+
+
+from .source import open_source, open_exclusion
+from .words import (split_words, split_letters, compile_exclusion,
+    exclude_words, min_word_length, is_num, del_num)
+from .count import (count_text, count_stream, count_mapped,
+    count_mapped_letters, count_parallel, find_sources, count_batch)
+from .phrases import (remove_char, split_sentence, read_sentences,
+    compile_phrases, match_phrases, count_phrase, count_ngrams,
+    exclude_phrase, top_counts, count_ngram_range, decode_phrase,
+    top_ngrams)
+from .report import (remove_less_counts, report_results, report_phrases,
+    report_counts)
+from .export import write_counts, read_counts
+from .store import open_store, update_store, lookup_words
+from .cloud import open_mask, draw_word_cloud
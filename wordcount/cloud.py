@@ -0,0 +1,77 @@
+# This Python module draws the word cloud of the counting results.
+# The modules for drawing, i.e., wordcloud, PIL (Pillow), NumPy and
+# Matplotlib, are imported only when a word cloud is drawn, so that
+# counting words does not need them.
+# Last modified 2026-10-18 12:30
+
+
+def open_mask(mask_image):
+    """
+    This function forms an image array for generating a mask image and
+    a color pattern, both of which will be used for the word cloud.
+    Note that words will not show on areas with the white color (NOT
+    transparent areas).
+    """
+    # Imported only when a mask is opened, as they take long to import.
+    import numpy as np
+    from PIL import Image
+
+    try:
+        img_array = np.array(Image.open(mask_image))
+    except FileNotFoundError:
+        return None
+    else:
+        info = "Apply the mask file '" + mask_image
+        info += "' for the word cloud.\n"
+        print(info)
+        return img_array
+
+
+def draw_word_cloud(
+    word_frq,       # A dictionary storing the word frequency results. 
+    max_words=200,  # How many (most frequent) words will display.
+    wc_img=None,    # Where the word cloud image will be stored.
+    img_array=None  # The image array for mask and color patterning.
+    ):
+    """
+    Draw the word cloud, display it on the screen, and save it.
+    More parameters about the word cloud image formed can be adjusted
+    inside this function.
+    """
+    # Imported only when a word cloud is drawn, as they take long to
+    # import.
+    import wordcloud
+    import matplotlib.pyplot as plt
+
+    # Create the word cloud and apply the mask
+    wc_obj = wordcloud.WordCloud(
+        width=1000,                 # The width of the word cloud.
+        height=1000,                # The height of the word cloud.
+        background_color='white',   # Background color; default black.
+        font_path='arialbd.ttf',    # Use the "Arial Bold" font.
+        min_font_size=12,           # Minimum font size; 4 by default.
+      # max_font_size=24,           # Maximum font size.
+        max_words=max_words,        # Maximal number of words to show.
+        mask=img_array              # Apply a mask array for output.
+        )
+
+    # Generate the word cloud object using the given text.
+    wc_obj.generate_from_frequencies(word_frq)
+
+    # Tailor the color pattern of the word cloud from the patten of a
+    # given image. Here, the image used is the same as the mask image.
+    # img_colors = wordcloud.ImageColorGenerator(mskimg)
+    if img_array is None:
+        print("No mask is applied for creating the word cloud.\n")
+    else:
+        # Extract the color pattern for image mask.
+        img_colors = wordcloud.ImageColorGenerator(img_array)
+        wc_obj.recolor(color_func=img_colors)
+
+    # Display the word cloud on the screen.
+    plt.imshow(wc_obj, interpolation='bilinear')
+    plt.axis('off')     # Hide the axis
+    plt.show()          # Display the image on the screen
+
+    # Save the word cloud output to an image
+    wc_obj.to_file(wc_img)
@@ -0,0 +1,625 @@
+# This Python module counts the words in texts and text files, either
+# as a whole, chunk by chunk, through a memory map, on multiple CPU
+# cores, or many files in one run. All the ways give the same results.
+# UTF-8 encoding is used for reading all text files.
+# Last modified 2026-10-18 23:58
+
+
+# For counting by frequency.
+from collections import Counter
+
+# For getting the file size when splitting it into shards.
+import os
+
+# For counting shards of a large file on multiple CPU cores.
+from multiprocessing import Pool
+
+# For reading large files through a memory map without copying them.
+import mmap
+
+# For splitting words in the bytes of a text file.
+import re
+
+# For finding the text files to be counted in batch mode.
+import glob
+
+from .words import split_words, is_num
+from .masks import filter_words
+from .instrument import measure_stage
+from .topk import update_top_view, current_top
+from .export import count_pairs, write_tsv
+
+
+# Bytes of blank ASCII characters, i.e., those for which str.isspace()
+# is true. Shards of a file are cut only after them.
+ASCII_BLANKS = [b' ', b'\t', b'\n', b'\r', b'\x0b', b'\x0c', b'\x1c',
+    b'\x1d', b'\x1e', b'\x1f']
+
+# The pattern for splitting ASCII bytes by blanks, as str.split() does.
+BLANK_BYTES = re.compile(rb'[ \t\n\r\x0b\x0c\x1c-\x1f]+')
+
+# The pattern of a word formed by letters in the bytes of an ASCII or
+# UTF-8 text file. Besides letters, the Kelvin sign is turned into the
+# letter 'k' by str.lower(), and the capital letter 'I' with a dot
+# above into an 'i' followed by a combining dot (a non-letter), which
+# ends the word.
+WORD_BYTES = re.compile(
+    rb'(?:[A-Za-z]|\xe2\x84\xaa)+(?:\xc4\xb0)?|\xc4\xb0')
+
+
+def count_text(
+    contents,               # The text string to be counted.
+    split_char="",          # Characters for splitting words.
+    split_chars=[", ", ". "],   # Character sets for splitting words.
+    exclusion=frozenset(),  # Words to be excluded from counting.
+    min_length=1,           # The minimal length of the word.
+    recorder=None,          # The recorder of the stages, if any.
+    ):
+    """
+    Count the words in a text string, and return the results in class
+    Counter. The words are split by 'split_words()', and then filtered
+    by 'filter_words()', the same as by 'min_word_length()' and
+    'del_num()'.
+        When a recorder (see 'start_recording()') is given, the words
+    are split, excluded, filtered by length and by numbers, and counted
+    one stage at a time, and each stage is measured on its own. The
+    results are the same.
+    """
+    if recorder is not None:
+        return count_text_stages(contents, split_char, split_chars,
+            exclusion, min_length, recorder)
+
+    words = split_words(contents, split_char, split_chars, exclusion)
+    words = filter_words(words, min_length)  # Remove short words and numbers.
+
+    return Counter(words)
+
+
+def count_text_stages(
+    contents, split_char, split_chars, exclusion, min_length, recorder
+    ):
+    """
+    Count the words in a text string as 'count_text()' does, measuring
+    each stage by 'measure_stage()', and return the results in class
+    Counter. The words given out by 'Counter' are the different words.
+    """
+    with measure_stage(recorder, 'split_words') as record:
+        words = split_words(contents, split_char, split_chars)
+        record['tokens_out'] = len(words)
+
+    with measure_stage(recorder, 'exclude_words', len(words)) as record:
+        if exclusion:
+            words = filter_words(words, 1, True, exclusion)
+        record['tokens_out'] = len(words)
+
+    with measure_stage(recorder, 'min_word_length', len(words)) as record:
+        words = filter_words(words, min_length, True)
+        record['tokens_out'] = len(words)
+
+    with measure_stage(recorder, 'del_num', len(words)) as record:
+        words = filter_words(words)
+        record['tokens_out'] = len(words)
+
+    with measure_stage(recorder, 'Counter', len(words)) as record:
+        results = Counter(words)
+        record['tokens_out'] = len(results)
+
+    return results
+
+
+def blank_followers(split_chars=[", ", ". "]):
+    """
+    Return a string of the characters that follow a blank character in
+    any character set of 'split_chars'. A text must not be cut between
+    a blank and such a character, or that character set is cut apart.
+    """
+    after_blanks = ''
+    for chars in split_chars:
+        for index in range(1, len(chars)):
+            if chars[index - 1].isspace():
+                after_blanks += chars[index]
+    return after_blanks
+
+
+def find_cut(buffer, split_char="", after_blanks=""):
+    """
+    Find the last position where the text 'buffer' can be cut into two
+    parts, so that splitting the two parts separately gives the same
+    words as splitting the whole text. Return that position, or 0 when
+    the text cannot be cut. This is used by 'read_chunks()'.
+        A cut is placed right after a blank character, and before a
+    character that does not follow a blank in any character set of
+    'split_chars' (these characters are given as 'after_blanks').
+    Hence, no word and no splitting character set is cut apart.
+    """
+    index = len(buffer) - 1
+    while index > 0:
+        if buffer[index - 1].isspace():
+            char = buffer[index]
+            if char in split_char:
+                char = ' '  # It will be replaced by a space anyway.
+            if char.lower()[:1] not in after_blanks:
+                return index
+        index -= 1
+
+    return 0
+
+
+def read_chunks(
+    filename,               # The text file to be read.
+    split_char="",          # Characters for splitting words.
+    split_chars=[", ", ". "],   # Character sets for splitting words.
+    chunk_size=1048576,     # How many characters are read at a time.
+    ):
+    """
+    Read a text file chunk by chunk, so that the whole file is never
+    kept in memory, and yield the text of each chunk. The chunks can be
+    split into words separately by 'split_words()', which gives the
+    same words as splitting the whole text.
+        Each chunk read is cut after its last blank character that is
+    safe to cut (see 'find_cut()'), and the rest is carried over to
+    the next chunk. UTF-8 encoding is used for opening the text file.
+    """
+    # Characters that follow a blank in a character set; a cut before
+    # them might split that character set.
+    after_blanks = blank_followers(split_chars)
+
+    # When a character set has two blanks in a row, a blank created by
+    # replacing another character set might be joined with it across
+    # a cut. The file is then read in one chunk.
+    if any(char.isspace() for char in after_blanks):
+        chunk_size = -1
+
+    with open(filename, encoding='utf-8') as file_object:
+        buffer = ''     # Text carried over from the last chunk.
+        while True:
+            chunk = file_object.read(chunk_size)
+            if chunk == '':
+                break
+            buffer += chunk
+
+            cut = find_cut(buffer, split_char, after_blanks)
+            if cut > 0:
+                yield buffer[:cut]
+                buffer = buffer[cut:]
+
+        yield buffer
+
+
+def print_top_view(top_view):
+    """
+    Print the current top words in a view (see 'new_top_view()') in one
+    line on screen, while counting is in progress.
+    """
+    msg = "Current top words:"
+    for word, count in current_top(top_view):
+        msg += " " + word + " " + str(count) + ","
+    print(msg.rstrip(','))
+
+
+def count_stream(
+    filename,               # The text file to be counted.
+    split_char="",          # Characters for splitting words.
+    split_chars=[", ", ". "],   # Character sets for splitting words.
+    exclusion=frozenset(),  # Words to be excluded from counting.
+    min_length=1,           # The minimal length of the word.
+    chunk_size=1048576,     # How many characters are read at a time.
+    top_view=None,          # The view of the current top words, if any.
+    ):
+    """
+    Count the words in a text file chunk by chunk, so that the whole
+    file is never kept in memory, and return the results in class
+    Counter. The words are split, excluded, and filtered by length and
+    numbers in the same way as 'split_words()', 'min_word_length()' and
+    'del_num()' on the whole text, and so are the results.
+        The chunks are read by 'read_chunks()'. UTF-8 encoding is used
+    for opening the text file.
+        When a view of the top words (see 'new_top_view()') is given,
+    it is updated after each chunk, and the current top words are
+    printed on screen.
+    """
+    results = Counter()     # The running counts of all chunks.
+
+    try:
+        for chunk in read_chunks(
+                filename, split_char, split_chars, chunk_size):
+            chunk_results = count_text(
+                chunk, split_char, split_chars, exclusion, min_length)
+            results.update(chunk_results)
+
+            if top_view is not None and chunk_results:
+                update_top_view(top_view, results, chunk_results)
+                print_top_view(top_view)
+
+    except FileNotFoundError:   # Abort when the file is not found.
+        print("Cannot open file '" + filename + "'.")
+
+    # Abort when the coding is not correct, e.g., when it is not a
+    # text file, or the coding is wrong.
+    except UnicodeDecodeError:
+        message = "Cannot open file '" + filename + ".\n"
+        message += "Make sure it is an UTF-8 encoded text file."
+        print(message)
+
+    else:
+        return results
+
+
+def next_cut(buffer, offset, end, split_char="", after_blanks=""):
+    """
+    Find the first position from 'offset' on, and before 'end', where
+    the bytes 'buffer' of a text file can be cut. Return that position,
+    or 'end' when there is none.
+        Like 'find_cut()', a cut is placed right after an ASCII blank
+    character, and before a character that does not follow a blank in
+    any character set of 'split_chars'. A cut is never placed between
+    the '\r' and '\n' of a line break. Hence, no word, character set or
+    line break is cut apart.
+    """
+    index = max(offset, 1)
+    while index < end:
+        if (buffer[index - 1:index] in ASCII_BLANKS
+                and buffer[index - 1:index + 1] != b'\r\n'):
+            char = buffer[index:index + 4].decode('utf-8', 'ignore')[:1]
+            if char != '' and char in split_char:
+                char = ' '  # It will be replaced by a space anyway.
+            if char.lower()[:1] not in after_blanks:
+                return index
+        index += 1
+
+    return end
+
+
+def shard_offsets(filename, shards, split_char="", after_blanks=""):
+    """
+    Split a text file into a number of shards (byte ranges) of about
+    the same size, and return the list of the offsets where the shards
+    begin, followed by the file size. This is used by 'count_parallel()'.
+    Shards begin at the positions found by 'next_cut()'.
+    """
+    size = os.path.getsize(filename)
+    offsets = [0]
+
+    if size == 0:           # An empty file cannot be mapped.
+        return [0, 0]
+
+    with open(filename, 'rb') as file_object:
+        with mmap.mmap(file_object.fileno(), 0,
+                access=mmap.ACCESS_READ) as buffer:
+            for shard in range(1, shards):
+                offset = max(size * shard // shards, offsets[-1])
+                offsets.append(
+                    next_cut(buffer, offset, size, split_char, after_blanks))
+
+    offsets.append(size)
+    return offsets
+
+
+def count_bytes(
+    data,                   # The bytes of an ASCII or UTF-8 text.
+    split_char="",          # Characters for splitting words.
+    split_chars=[", ", ". "],   # Character sets for splitting words.
+    exclusion=frozenset(),  # Words to be excluded from counting.
+    min_length=1,           # The minimal length of the word.
+    ):
+    """
+    Count the words in the bytes of an ASCII or UTF-8 text, as read
+    from a file in binary mode, and return the results in class
+    Counter. The results are the same as those of 'count_text()' on
+    the text read in text mode.
+        An ASCII text is split as bytes, by 'BLANK_BYTES', and each
+    different word in it is decoded only once and then filtered. Other
+    texts are decoded and counted as strings.
+    """
+    if not data.isascii():
+        contents = data.decode('utf-8')
+        contents = contents.replace('\r\n', '\n').replace('\r', '\n')
+        return count_text(
+            contents, split_char, split_chars, exclusion, min_length)
+
+    # Splitting characters and character sets for ASCII texts. The
+    # non-ASCII ones never appear in such texts.
+    ascii_char = ''.join(char for char in split_char if char.isascii())
+    char_table = bytes.maketrans(
+        ascii_char.encode(), b' ' * len(ascii_char))
+    ascii_chars = [chars.encode() for chars in split_chars
+        if chars.isascii()]
+
+    # Line breaks are turned into '\n', as reading in text mode does.
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+    data = data.lower().translate(char_table)
+    for chars in ascii_chars:
+        data = data.replace(chars, b' ')
+
+    results = Counter()
+    tokens = Counter(BLANK_BYTES.split(data))
+    for token, count in tokens.items():
+        word = token.decode('ascii')
+        if (word != '' and word not in exclusion
+                and len(word) >= min_length
+                and not is_num(word)):
+            results[word] += count
+
+    return results
+
+
+def count_mapped(
+    filename,               # The text file to be counted.
+    split_char="",          # Characters for splitting words.
+    split_chars=[", ", ". "],   # Character sets for splitting words.
+    exclusion=frozenset(),  # Words to be excluded from counting.
+    min_length=1,           # The minimal length of the word.
+    start=0,                # Where to begin counting in the file.
+    end=None,               # Where to stop counting; None for the end.
+    window=1048576,         # How many bytes are counted at a time.
+    ):
+    """
+    Count the words in an ASCII or UTF-8 text file through a memory
+    map, and return the results in class Counter. The results are the
+    same as those of 'split_words()', 'min_word_length()' and
+    'del_num()' on the whole text, but the text is never decoded into a
+    string as a whole. Only the bytes from 'start' to 'end' are counted,
+    and both must be positions found by 'next_cut()' (or the ends).
+        The file is counted a window of about 'window' bytes at a time,
+    by 'count_bytes()'.
+    """
+    after_blanks = blank_followers(split_chars)
+    results = Counter()
+
+    # Count the words in a window of bytes into the results.
+    def count_window(data):
+        results.update(count_bytes(
+            data, split_char, split_chars, exclusion, min_length))
+
+    # When a character set has two blanks in a row, a blank created by
+    # replacing another character set might be joined with it across
+    # a cut. The file is then counted in one window.
+    if any(char.isspace() for char in after_blanks):
+        window = -1
+
+    try:
+        with open(filename, 'rb') as file_object:
+            size = file_object.seek(0, 2)
+            if end is None:
+                end = size
+            if start >= end:    # An empty file cannot be mapped.
+                return results
+
+            with mmap.mmap(file_object.fileno(), 0,
+                    access=mmap.ACCESS_READ) as buffer:
+                while start < end:
+                    cut = end
+                    if window > 0:
+                        cut = next_cut(buffer, start + window, end,
+                            split_char, after_blanks)
+                    count_window(buffer[start:cut])
+                    start = cut
+
+    except FileNotFoundError:   # Abort when the file is not found.
+        print("Cannot open file '" + filename + "'.")
+
+    # Abort when the coding is not correct, e.g., when it is not a
+    # text file, or the coding is wrong.
+    except UnicodeDecodeError:
+        message = "Cannot open file '" + filename + ".\n"
+        message += "Make sure it is an UTF-8 encoded text file."
+        print(message)
+
+    else:
+        return results
+
+
+def count_mapped_letters(
+    filename, exclusion=frozenset(), min_length=1, window=1048576
+    ):
+    """
+    Count the words formed by letters only (as split by
+    'split_letters()') in an ASCII or UTF-8 text file through a memory
+    map, and return the results in class Counter. The results are the
+    same as those of 'split_letters()' and 'min_word_length()' on the
+    whole text, but the file is never read into a string as a whole.
+        Words are found in the bytes of the file by 'WORD_BYTES', a
+    window of about 'window' bytes at a time. A window that is not all
+    ASCII is decoded first, so that a file that is not UTF-8 is not
+    counted. Each different word in a window is decoded only once, and
+    then excluded if it is in the set 'exclusion' or shorter than
+    'min_length'.
+    """
+    results = Counter()
+
+    try:
+        with open(filename, 'rb') as file_object:
+            # An empty file cannot be mapped.
+            if file_object.seek(0, 2) == 0:
+                return results
+
+            with mmap.mmap(file_object.fileno(), 0,
+                    access=mmap.ACCESS_READ) as buffer:
+                start = 0
+                while start < len(buffer):
+                    # Windows end right after an ASCII non-letter, so
+                    # that no word is cut apart.
+                    end = min(start + window, len(buffer))
+                    while end < len(buffer) and (buffer[end - 1] >= 0x80
+                            or chr(buffer[end - 1]).isalpha()):
+                        end += 1
+
+                    # Raise UnicodeDecodeError if the window is not
+                    # UTF-8, as the bytes of a word alone may still be.
+                    data = buffer[start:end]
+                    if not data.isascii():
+                        data.decode('utf-8')
+
+                    tokens = Counter(WORD_BYTES.findall(data))
+                    for token, count in tokens.items():
+                        word = token.decode('utf-8').lower()
+                        word = word.replace('\u0307', '')
+                        if (len(word) >= min_length
+                                and word not in exclusion):
+                            results[word] += count
+
+                    start = end
+
+    # Abort when the file is not found.
+    except FileNotFoundError:
+        print("Cannot open file '" + filename + "'.")
+
+    # Abort when the coding is not correct, e.g., when it is not a
+    # text file, or the coding is wrong.
+    except UnicodeDecodeError:
+        message = "Cannot open file '" + filename + ".\n"
+        message += "Make sure it is an UTF-8 encoded text file."
+        print(message)
+
+    else:
+        return results
+
+
+def count_shard(task):
+    """
+    Count the words in a shard (a byte range) of a text file, or in a
+    whole file, through a memory map, and return the results in class
+    Counter. The 'task' is a tuple of the arguments of 'count_mapped()',
+    so that it can be sent to a worker process. The workers share the
+    pages of the file mapped in memory, instead of reading their own
+    copies.
+    """
+    return count_mapped(*task)
+
+
+def count_parallel(
+    filename,               # The text file to be counted.
+    split_char="",          # Characters for splitting words.
+    split_chars=[", ", ". "],   # Character sets for splitting words.
+    exclusion=frozenset(),  # Words to be excluded from counting.
+    min_length=1,           # The minimal length of the word.
+    workers=2,              # How many processes count at the same time.
+    ):
+    """
+    Split a text file into shards, count them in a pool of worker
+    processes, and return the merged results in class Counter.
+        The results are the same as counting the whole file in one
+    process, including the order of words with the same count, since
+    the shards are merged in the order they are in the file. The file
+    is split into more shards than workers to balance their load.
+    UTF-8 encoding is used for reading the text file.
+    """
+    after_blanks = blank_followers(split_chars)
+
+    # When a character set has two blanks in a row, it might be cut
+    # apart between shards, so the file is counted as one shard.
+    shards = workers * 4
+    if any(char.isspace() for char in after_blanks):
+        shards = 1
+
+    try:
+        offsets = shard_offsets(filename, shards, split_char, after_blanks)
+
+        tasks = []
+        for index in range(len(offsets) - 1):
+            if offsets[index] < offsets[index + 1]:
+                tasks.append((filename, split_char, split_chars,
+                    exclusion, min_length, offsets[index],
+                    offsets[index + 1]))
+
+        with Pool(workers) as pool:
+            shard_results = pool.map(count_shard, tasks)
+
+    except FileNotFoundError:   # Abort when the file is not found.
+        print("Cannot open file '" + filename + "'.")
+
+    # Abort when the coding is not correct, e.g., when it is not a
+    # text file, or the coding is wrong.
+    except UnicodeDecodeError:
+        message = "Cannot open file '" + filename + ".\n"
+        message += "Make sure it is an UTF-8 encoded text file."
+        print(message)
+
+    else:
+        # A shard that could not be counted has been reported.
+        if None in shard_results:
+            return None
+
+        results = Counter()
+        for shard_result in shard_results:
+            results.update(shard_result)
+        return results
+
+
+def find_sources(pattern):
+    """
+    Return the sorted list of text files to be counted in batch mode.
+    The 'pattern' is either a folder, of which all the .txt files
+    (including those in subfolders) are listed, or a glob pattern like
+    'resource/*.txt' ('**' matches any subfolders).
+    """
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, '**', '*.txt')
+
+    filenames = glob.glob(pattern, recursive=True)
+    return sorted(filename for filename in filenames
+        if os.path.isfile(filename))
+
+
+def write_file_counts(file_object, filename, results):
+    """
+    Write all the words and counts of the results (in class Counter) of
+    a file into an opened table file, from the most frequent, as tab
+    separated lines of the file name, word and count, by 'write_tsv()'.
+    This is used by 'count_batch()'.
+    """
+    prefix = filename + "\t"
+    write_tsv(((prefix + word, count) for word, count in count_pairs(
+        results)), file_object)
+
+
+def count_batch(
+    filenames,              # The text files to be counted.
+    table_file,             # Where the tables of each file are stored.
+    split_char="",          # Characters for splitting words.
+    split_chars=[", ", ". "],   # Character sets for splitting words.
+    exclusion=frozenset(),  # Words to be excluded from counting.
+    min_length=1,           # The minimal length of the word.
+    workers=1,              # How many processes count at the same time.
+    ):
+    """
+    Count the words in each of many text files in one run, and return
+    the results of all the files together in class Counter. The files
+    are counted in a pool of worker processes when 'workers' > 1.
+        All the words and counts of each file, and then those of all the
+    files (listed with the file name '*'), are written into the
+    'table_file' as tab separated lines of file name, word and count
+    (see 'write_file_counts()'); only the report lists the top words.
+    The lines are written through the buffer of one opened file, not by
+    opening the file again for each text file.
+    """
+    tasks = [(filename, split_char, split_chars, exclusion, min_length)
+        for filename in filenames]
+    results = Counter()
+
+    pool = None
+    if workers > 1:
+        pool = Pool(workers)
+        file_results = pool.imap(count_shard, tasks, chunksize=16)
+    else:
+        file_results = map(count_shard, tasks)
+
+    with open(table_file, 'w', encoding='utf-8') as file_object:
+        file_object.write("file\tword\tcount\n")
+
+        for filename, file_result in zip(filenames, file_results):
+            if file_result is None:     # It has been reported.
+                continue
+            results.update(file_result)
+            write_file_counts(file_object, filename, file_result)
+
+        write_file_counts(file_object, '*', results)
+
+    if pool is not None:
+        pool.close()
+        pool.join()
+
+    return results
+
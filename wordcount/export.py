@@ -0,0 +1,232 @@
+# This Python module writes the counting results of words, or of any
+# counted items, in full into files, as TSV, as JSON Lines, or in a
+# compact binary format, and reads them back. Unlike the reports, which
+# only list the top words, the files may hold millions of words, so
+# the lines are written through a large buffer as they are formed,
+# without building the whole contents as one string.
+# UTF-8 encoding is used for all the files.
+# Last modified 2026-10-18 23:59
+
+
+# For writing strings in JSON Lines. 'encode_basestring' quotes a
+# string as 'json.dumps()' does with 'ensure_ascii=False', but faster.
+import json
+from json.encoder import encode_basestring
+
+# For taking the words and counts a block at a time.
+from itertools import islice, chain
+from operator import itemgetter
+
+# For writing the counts of the binary format as arrays, in the same
+# byte order on any machine.
+from array import array
+import sys
+
+
+# The first line of a file in the binary format, telling its format.
+COUNTS_FORMAT = b'wordcount counts 1\n'
+
+# The size of the buffer for writing and reading the files.
+BUFFER_SIZE = 1048576
+
+# How many words are in each block of the binary format.
+BLOCK_SIZE = 65536
+
+# The typecodes of arrays of unsigned and of signed integers by their
+# sizes in bytes, which are told in the blocks, as the size of a
+# typecode may not be the same on another machine.
+UNSIGNED_CODES = {array(typecode).itemsize: typecode
+    for typecode in 'QLIHB'}
+SIGNED_CODES = {array(typecode).itemsize: typecode for typecode in 'qlihb'}
+
+
+def count_pairs(results, min_count=1, order='count'):
+    """
+    Return the words and counts of the results in class Counter as a
+    list of tuples, skipping counts less than 'min_count'. They are
+    sorted from the most frequent ('count'), as 'most_common()' does,
+    or by the words ('word'), e.g., for merging files later.
+    """
+    if order == 'word':
+        pairs = sorted(results.items())
+    else:
+        pairs = results.most_common()
+
+    if min_count > 1:
+        pairs = [pair for pair in pairs if pair[1] >= min_count]
+    return pairs
+
+
+def write_tsv(pairs, file_object):
+    """
+    Write the words and counts, from an iterable of tuples, into a text
+    file object, one word and its count in each line, separated by a
+    tab.
+    """
+    file_object.writelines(word + '\t' + str(count) + '\n'
+        for word, count in pairs)
+
+
+def write_jsonl(pairs, file_object):
+    """
+    Write the words and counts, from an iterable of tuples, into a text
+    file object as JSON Lines, e.g., '{"word": "word", "count": 3}'.
+    """
+    file_object.writelines('{"word": ' + encode_basestring(word)
+        + ', "count": ' + str(count) + '}\n' for word, count in pairs)
+
+
+def count_typecode(counts):
+    """
+    Return the typecode of the smallest array that holds all the counts
+    in a list, so that the small counts of the rare words, which are
+    most of the words, take one or two bytes each. The counts take 1,
+    2 or 4 bytes when none is negative, or 8 bytes otherwise.
+    """
+    least = min(counts)
+    most = max(counts)
+    if least >= 0:
+        for size in [1, 2, 4]:
+            if most < 256 ** size:
+                return UNSIGNED_CODES[size]
+    return SIGNED_CODES[8]
+
+
+def write_blocks(pairs, file_object):
+    """
+    Write the words and counts, from an iterable of tuples, into a
+    binary file object in blocks of 'BLOCK_SIZE', and return the number
+    of words written.
+        Each block has a line of its header in JSON, with the number of
+    words, of bytes of the words, and the type and size in bytes of the
+    counts (see 'count_typecode()'), followed by the words, separated by
+    newlines, and the array of their counts. The counts are always
+    written in little-endian byte order, so that the files written on
+    one machine are read the same on another.
+    """
+    written = 0
+    pairs = iter(pairs)
+    while True:
+        block = list(islice(pairs, BLOCK_SIZE))
+        if not block:
+            return written
+        written += len(block)
+        word_bytes = '\n'.join(map(itemgetter(0), block)).encode('utf-8')
+        counts = list(map(itemgetter(1), block))
+        counts = array(count_typecode(counts), counts)
+        if sys.byteorder == 'big':
+            counts.byteswap()
+        header = {'words': len(block), 'word_bytes': len(word_bytes),
+            'typecode': counts.typecode, 'itemsize': counts.itemsize,
+            'byteorder': 'little'}
+        file_object.write(json.dumps(header).encode('utf-8') + b'\n')
+        file_object.write(word_bytes)
+        counts.tofile(file_object)
+
+
+def write_binary(pairs, file_object):
+    """
+    Write the words and counts, from an iterable of tuples, into a
+    binary file object, as the line 'COUNTS_FORMAT' followed by the
+    blocks of 'write_blocks()'.
+    """
+    file_object.write(COUNTS_FORMAT)
+    write_blocks(pairs, file_object)
+
+
+# The writers by the format names, with whether the file is binary.
+WRITERS = {'tsv': (write_tsv, False), 'jsonl': (write_jsonl, False),
+    'binary': (write_binary, True)}
+
+
+def write_counts(
+    results,            # Word frequency results in class Counter.
+    filename,           # The file to be written.
+    form='tsv',         # The format: 'tsv', 'jsonl' or 'binary'.
+    min_count=1,        # Only counts >= this are written.
+    order='count',      # Sorted by 'count' or by 'word'.
+    ):
+    """
+    Write all the words and counts of the results, as listed by
+    'count_pairs()', into a file in a given format (see 'WRITERS'), and
+    return the number of words written, or None when the file cannot be
+    written. Instead of the results, a list of tuples of the words and
+    counts can also be given, which is written as it is. The words must
+    not hold newlines, nor tabs in TSV, as those split by 'split_words()'
+    do not.
+    """
+    writer, binary = WRITERS[form]
+    if hasattr(results, 'most_common'):
+        results = count_pairs(results, min_count, order)
+
+    try:
+        if binary:
+            file_object = open(filename, 'wb', buffering=BUFFER_SIZE)
+        else:
+            file_object = open(filename, 'w', encoding='utf-8',
+                newline='\n', buffering=BUFFER_SIZE)
+        with file_object:
+            writer(results, file_object)
+
+    except OSError:
+        print("Cannot write file '" + filename + "'.")
+        return None
+
+    return len(results)
+
+
+def read_blocks(file_object):
+    """
+    Read the words and counts from the blocks of 'write_blocks()' in a
+    binary file object, to its end, and yield them as tuples. Only one
+    block is kept in memory at a time.
+        The counts are read by their size and byte order told in the
+    header of each block, whatever the machine that wrote them.
+    """
+    for line in iter(file_object.readline, b''):
+        header = json.loads(line)
+        words = file_object.read(header['word_bytes']).decode(
+            'utf-8').split('\n')
+        typecode = header['typecode']
+        if typecode.islower():
+            counts = array(SIGNED_CODES[header['itemsize']])
+        else:
+            counts = array(UNSIGNED_CODES[header['itemsize']])
+        counts.fromfile(file_object, header['words'])
+        if header['byteorder'] != sys.byteorder:
+            counts.byteswap()
+        yield from zip(words, counts)
+
+
+def read_text(file_object):
+    """
+    Read the words and counts from a text file object in TSV or in JSON
+    Lines, and yield them as tuples. The file is in JSON Lines when its
+    first line begins as those written by 'write_jsonl()'.
+    """
+    first_line = file_object.readline()
+    lines = chain([first_line], file_object) if first_line else []
+    if first_line.startswith('{"word": '):
+        for line in lines:
+            record = json.loads(line)
+            yield record['word'], record['count']
+    else:
+        for line in lines:
+            word, count = line.rstrip('\n').rsplit('\t', 1)
+            yield word, int(count)
+
+
+def read_counts(filename):
+    """
+    Read the words and counts from a file written by 'write_counts()',
+    in any of the formats, and yield them as tuples, in the order they
+    were written. The format is told by the first line of the file.
+    """
+    with open(filename, 'rb', buffering=BUFFER_SIZE) as file_object:
+        if file_object.readline() == COUNTS_FORMAT:
+            yield from read_blocks(file_object)
+            return
+
+    with open(filename, encoding='utf-8', newline='\n',
+            buffering=BUFFER_SIZE) as file_object:
+        yield from read_text(file_object)
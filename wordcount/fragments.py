@@ -0,0 +1,290 @@
+# This Python module keeps a text split into sentence-like fragments
+# and words, so that it is parsed only once for any number of phrase
+# queries. The words are turned into integer IDs, and the fragments are
+# kept as one array of IDs, with 'SEPARATOR' after each fragment, and
+# an array of where each fragment begins.
+#     The fragments are saved in a file next to the text file, with the
+# SHA-256 hash of the text, and used again until the text is changed.
+# The phrases are then counted from the arrays, without removing
+# characters, splitting sentences or splitting words again. The suffix
+# index of suffix.py is also built from the same fragments.
+# Last modified 2026-10-18 22:20
+
+
+# For storing the IDs and the beginnings as arrays of 32-bit integers.
+from array import array
+
+# For storing the header of the fragment file.
+import json
+
+# For telling if the fragments are of the same text.
+import hashlib
+import os
+
+# For counting the phrases as tuples of IDs.
+from collections import Counter
+
+from .source import open_source
+from .phrases import remove_char, split_sentence, split_phrase_words
+
+
+# The ID between two fragments. Words have IDs from 1, so a fragment
+# that ends sorts before any longer one.
+SEPARATOR = 0
+
+# The first line of a fragment file, which tells its format.
+FRAGMENTS_FORMAT = b'wordcount fragments 1\n'
+
+
+def encode_sentences(sentences):
+    """
+    Turn the words of a list of sentences into integer IDs, and return
+    a tuple of the list of words, by their IDs, an array of the IDs of
+    all words, with 'SEPARATOR' after each sentence, and an array of
+    where each sentence begins in it. The words are given IDs from 1,
+    in the order they first appear. Sentences without words are left
+    out.
+    """
+    ids = {}
+    get_id = ids.setdefault
+    tokens = array('i')
+    offsets = array('i')
+
+    for sentence in sentences:
+        words = split_phrase_words(sentence)
+        if words:
+            offsets.append(len(tokens))
+            tokens.extend([get_id(word, len(ids) + 1) for word in words])
+            tokens.append(SEPARATOR)
+
+    return [''] + list(ids), tokens, offsets
+
+
+def build_fragments(sentences):
+    """
+    Build the fragments of a list of sentences, as split by
+    'split_sentence()', and return them as a dict. 'words' lists the
+    words by their IDs, 'ids' maps each word to its ID, 'tokens' is the
+    array of the IDs of the text, and 'offsets' the array of where each
+    fragment begins in 'tokens'.
+    """
+    words, tokens, offsets = encode_sentences(sentences)
+    return {'words': words,
+        'ids': {word: word_id for word_id, word in enumerate(words)},
+        'tokens': tokens, 'offsets': offsets}
+
+
+def iter_fragments(fragments):
+    """
+    Yield the IDs of the words of each fragment as a tuple, without the
+    separator, in the order of the text.
+    """
+    tokens = fragments['tokens']
+    offsets = fragments['offsets']
+    ends = list(offsets[1:]) + [len(tokens)]
+    for start, end in zip(offsets, ends):
+        yield tuple(tokens[start:end - 1])
+
+
+def content_hash(txtsource):
+    """
+    Return the SHA-256 hash of the contents of a file, as a string of
+    hexadecimal digits, or None when the file cannot be read. The file
+    is read 1 MB at a time.
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(txtsource, 'rb') as file_object:
+            for block in iter(lambda: file_object.read(1048576), b''):
+                digest.update(block)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def source_stamp(txtsource):
+    """
+    Return the size and modification time of a text file, which tell
+    if the file may have been changed, or None when the file cannot be
+    found.
+    """
+    try:
+        stat = os.stat(txtsource)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def save_fragments(fragments, filename, header):
+    """
+    Save the fragments in a file, with the header, a dict telling which
+    text they are split from (see 'open_fragments()').
+        The file begins with a line telling its format and a line of
+    the header in JSON, followed by the words, one in each line, and
+    the arrays of the IDs and of the beginnings of the fragments.
+    """
+    word_bytes = '\n'.join(fragments['words']).encode('utf-8')
+    header = dict(header, word_bytes=len(word_bytes),
+        tokens=len(fragments['tokens']), offsets=len(fragments['offsets']))
+
+    with open(filename, 'wb') as file_object:
+        file_object.write(FRAGMENTS_FORMAT)
+        file_object.write(json.dumps(header).encode('utf-8') + b'\n')
+        file_object.write(word_bytes)
+        fragments['tokens'].tofile(file_object)
+        fragments['offsets'].tofile(file_object)
+
+
+def load_fragments(filename):
+    """
+    Load the fragments saved in a file, and return a tuple of the
+    header and the fragments, or None when the file cannot be read.
+    """
+    try:
+        with open(filename, 'rb') as file_object:
+            if file_object.readline() != FRAGMENTS_FORMAT:
+                print("'" + filename + "' is not a fragment file.")
+                return None
+            header = json.loads(file_object.readline())
+
+            words = file_object.read(header['word_bytes']).decode(
+                'utf-8').split('\n')
+            fragments = {'words': words,
+                'ids': {word: word_id for word_id, word in enumerate(words)}}
+            for name in ['tokens', 'offsets']:
+                fragments[name] = array('i')
+                fragments[name].fromfile(file_object, header[name])
+
+    except FileNotFoundError:
+        return None
+
+    except (EOFError, ValueError, KeyError):
+        print("The fragment file '" + filename + "' seems broken.")
+        return None
+
+    return header, fragments
+
+
+def open_fragments(
+    txtsource,              # The text file.
+    filename=None,          # The fragment file.
+    char_list='"-',         # Characters removed from the text.
+    split_chars=',.!?:;()', # Punctuations splitting the fragments.
+    ):
+    """
+    Load the fragments of a text file from the fragment file 'filename'
+    (by default, the text file name + '.frag'), or split the text and
+    save them there when they are missing or of another text. The text
+    is split as 'phrase_frq.py' and 'ct_phrase.py' do, by
+    'remove_char()' and 'split_sentence()'. Return the fragments, or
+    None when the text file cannot be read.
+        The fragments are of the same text when the SHA-256 hash of the
+    text is the same, so that copying or touching the text file does
+    not split it again. The hash is only computed when the size or the
+    modification time of the text file have changed.
+    """
+    if filename is None:
+        filename = txtsource + '.frag'
+    settings = [char_list, split_chars]
+    stamp = source_stamp(txtsource)
+    if stamp is None:
+        print("Cannot open file '" + txtsource + "'.")
+        return None
+
+    digest = None
+    loaded = load_fragments(filename)
+    if loaded is not None and loaded[0].get('settings') == settings:
+        header, fragments = loaded
+        if header.get('stamp') == stamp:
+            return fragments
+        digest = content_hash(txtsource)
+        if header.get('hash') == digest:
+            # The text is the same; only the stamp is renewed, so that
+            # it is not hashed again next time.
+            header['stamp'] = stamp
+            try:
+                save_fragments(fragments, filename, header)
+            except OSError:
+                pass
+            return fragments
+
+    contents = open_source(txtsource)
+    if contents is None:
+        return None
+    fragments = build_fragments(
+        split_sentence(remove_char(contents, char_list), split_chars))
+
+    if digest is None:
+        digest = content_hash(txtsource)
+    header = {'source': txtsource, 'hash': digest, 'stamp': stamp,
+        'settings': settings}
+    try:
+        save_fragments(fragments, filename, header)
+    except OSError:     # The fragments are still used, but not kept.
+        print("Cannot save the fragments in '" + filename + "'.")
+    return fragments
+
+
+def count_stored_phrases(fragments, phrases):
+    """
+    Count each of a list of phrases in the fragments, and return a dict
+    containing each phrase as the key and the corresponding counting as
+    the value, the same as 'count_phrase()' on the sentences the
+    fragments are split from. Overlapping phrases are all counted.
+        The phrases are turned into tuples of IDs, and only the windows
+    of the lengths of the phrases are taken from the fragments.
+    """
+    ids = fragments['ids']
+    targets = {}            # The phrases of each length, by their IDs.
+    phrase_ids = {}
+    for phrase in phrases:
+        words = split_phrase_words(phrase)
+        if all(word in ids for word in words):
+            phrase_ids[phrase] = tuple([ids[word] for word in words])
+            if words:
+                targets.setdefault(len(words), set()).add(
+                    phrase_ids[phrase])
+
+    counts = Counter()
+    for fragment in iter_fragments(fragments):
+        for length, target in targets.items():
+            counts.update(window for window in (fragment[s_index:s_index
+                + length] for s_index in range(len(fragment) - length + 1))
+                if window in target)
+
+    count_dict = {}
+    for phrase in phrases:
+        if phrase not in phrase_ids:    # A word is not in the text.
+            count_dict[phrase] = 0
+        elif phrase_ids[phrase] == ():
+            # As 'match_phrases()', a phrase without words is counted
+            # once for each word.
+            count_dict[phrase] = (len(fragments['tokens'])
+                - len(fragments['offsets']))
+        else:
+            count_dict[phrase] = counts[phrase_ids[phrase]]
+    return count_dict
+
+
+def count_stored_ngrams(fragments, min_length=2, max_length=6):
+    """
+    Count all phrases of 'min_length' to 'max_length' words in the
+    fragments at once, and return a tuple of the list of words, by
+    their IDs, and a dict with each phrase length as the key and the
+    counts of the phrases of that length, as tuples of IDs, as the
+    value, the same as 'count_ngram_range()' gives. The tables can be
+    listed by 'top_ngrams()'.
+    """
+    if min_length < 2:      # A phrase can't have less than 2 words.
+        min_length = 2
+
+    tables = {length: Counter()
+        for length in range(min_length, max_length + 1)}
+    for fragment in iter_fragments(fragments):
+        for length, table in tables.items():
+            table.update(
+                fragment[s_index:s_index + length]
+                for s_index in range(len(fragment) - length + 1)
+                )
+
+    return fragments['words'], tables
@@ -0,0 +1,231 @@
+# This Python module counts the words in many small text files, with
+# the reading of files overlapped with the counting. The files are read
+# by a few threads at the same time (asyncio), while the files already
+# read are counted by worker processes. The bytes of the files read but
+# not yet counted are limited, so that reading never runs far ahead of
+# counting.
+# UTF-8 encoding is used for reading all text files.
+# Last modified 2026-10-18 23:58
+
+
+# For overlapping the reading of files with the counting.
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# For keeping the files in the order they are given.
+from collections import Counter, deque
+
+# For getting the file sizes.
+import os
+
+# For measuring the throughput.
+import time
+
+from .count import count_bytes, write_file_counts
+
+
+# The settings of counting (the arguments of 'count_bytes()' after the
+# text) in this process, as set by 'set_count_settings()'.
+count_settings = ()
+
+
+def set_count_settings(*settings):
+    """
+    Set the settings of counting in this process. The settings are set
+    once in each worker process when it starts, so that the set of
+    excluded words is not sent along with every text.
+    """
+    global count_settings
+    count_settings = settings
+
+
+def read_file(filename):
+    """
+    Read a text file in binary mode, and return its bytes, or None when
+    the file cannot be opened.
+    """
+    try:
+        with open(filename, 'rb') as file_object:
+            return file_object.read()
+
+    except FileNotFoundError:   # Abort when the file is not found.
+        print("Cannot open file '" + filename + "'.")
+
+
+def count_file_bytes(filename, data):
+    """
+    Count the bytes of a text file with the settings set in this
+    process, and return the results in class Counter, or None when the
+    coding of the file is wrong.
+    """
+    try:
+        return count_bytes(data, *count_settings)
+
+    # Abort when the coding is not correct, e.g., when it is not a
+    # text file, or the coding is wrong.
+    except UnicodeDecodeError:
+        message = "Cannot open file '" + filename + ".\n"
+        message += "Make sure it is an UTF-8 encoded text file."
+        print(message)
+
+
+def file_size(filename):
+    """Return the size of a file in bytes, or 0 when it is not found."""
+    try:
+        return os.path.getsize(filename)
+    except OSError:
+        return 0
+
+
+async def ingest_files(
+    filenames,              # The text files to be counted.
+    split_char="",          # Characters for splitting words.
+    split_chars=[", ", ". "],   # Character sets for splitting words.
+    exclusion=frozenset(),  # Words to be excluded from counting.
+    min_length=1,           # The minimal length of the word.
+    workers=2,              # How many processes count at the same time.
+    readers=8,              # How many files are read at the same time.
+    max_bytes=67108864,     # How many bytes may be read but not counted.
+    ):
+    """
+    Count the words in each of many text files, and yield the file name
+    and its results (in class Counter, or None when the file cannot be
+    read) one file after another, in the order of 'filenames'. The
+    words are counted by 'count_bytes()', as a whole text file.
+        Up to 'readers' files are read by threads at the same time, and
+    the bytes read are counted by 'workers' processes, or by the thread
+    of the event loop when 'workers' is 1. A file is only read when the
+    bytes of the files being read or counted, plus its own, are not
+    more than 'max_bytes'; a larger file is read when nothing else is
+    in flight.
+    """
+    loop = asyncio.get_running_loop()
+    io_pool = ThreadPoolExecutor(readers)
+    settings = (split_char, split_chars, exclusion, min_length)
+    cpu_pool = None
+    if workers > 1:
+        cpu_pool = ProcessPoolExecutor(workers,
+            initializer=set_count_settings, initargs=settings)
+    else:
+        set_count_settings(*settings)
+
+    read_slots = asyncio.Semaphore(readers)
+    flight = asyncio.Condition()
+    in_flight = 0           # The bytes being read or counted.
+
+    async def release(size):
+        nonlocal in_flight
+        async with flight:
+            in_flight -= size
+            flight.notify_all()
+
+    async def count_file(filename, size):
+        try:
+            async with read_slots:
+                data = await loop.run_in_executor(
+                    io_pool, read_file, filename)
+            if data is None:        # It has been reported.
+                return None
+            # With one worker, the files are counted in this thread,
+            # while the other files are still being read by the threads.
+            if cpu_pool is None:
+                return count_file_bytes(filename, data)
+            return await loop.run_in_executor(
+                cpu_pool, count_file_bytes, filename, data)
+        finally:
+            await release(size)
+
+    tasks = deque()         # The files being counted, in their order.
+    try:
+        for filename in filenames:
+            size = await loop.run_in_executor(io_pool, file_size, filename)
+
+            # Wait until the bytes in flight leave room for this file.
+            async with flight:
+                await flight.wait_for(
+                    lambda: in_flight == 0 or in_flight + size <= max_bytes)
+                in_flight += size
+            tasks.append(
+                (filename, asyncio.ensure_future(count_file(filename, size))))
+
+            while tasks and tasks[0][1].done():
+                filename, task = tasks.popleft()
+                yield filename, task.result()
+
+        while tasks:
+            filename, task = tasks.popleft()
+            yield filename, await task
+
+    finally:
+        for filename, task in tasks:
+            task.cancel()
+        io_pool.shutdown()
+        if cpu_pool is not None:
+            cpu_pool.shutdown()
+
+
+async def write_ingested(
+    filenames, table_file, split_char, split_chars, exclusion, min_length,
+    workers, readers, max_bytes
+    ):
+    """
+    Count the files by 'ingest_files()', write the tables of all their
+    words into 'table_file', and return the results of all the files
+    together and the number of files counted. See 'count_ingested()'.
+    """
+    results = Counter()
+    counted = 0
+
+    with open(table_file, 'w', encoding='utf-8') as file_object:
+        file_object.write("file\tword\tcount\n")
+
+        async for filename, file_result in ingest_files(filenames,
+                split_char, split_chars, exclusion, min_length, workers,
+                readers, max_bytes):
+            if file_result is None:     # It has been reported.
+                continue
+            results.update(file_result)
+            counted += 1
+            write_file_counts(file_object, filename, file_result)
+
+        write_file_counts(file_object, '*', results)
+
+    return results, counted
+
+
+def count_ingested(
+    filenames,              # The text files to be counted.
+    table_file,             # Where the tables of each file are stored.
+    split_char="",          # Characters for splitting words.
+    split_chars=[", ", ". "],   # Character sets for splitting words.
+    exclusion=frozenset(),  # Words to be excluded from counting.
+    min_length=1,           # The minimal length of the word.
+    workers=2,              # How many processes count at the same time.
+    readers=8,              # How many files are read at the same time.
+    max_bytes=67108864,     # How many bytes may be read but not counted.
+    ):
+    """
+    Count the words in each of many text files in one run, as
+    'count_batch()' does, and return the results of all the files
+    together in class Counter. The tables written into 'table_file' are
+    the same as those of 'count_batch()'.
+        The files are read while others are being counted (see
+    'ingest_files()'), which is faster for many small files, whose time
+    is mostly spent on opening and reading them. The throughput, in
+    files and megabytes per second, is printed in the end.
+    """
+    start = time.perf_counter()
+    results, counted = asyncio.run(write_ingested(filenames, table_file,
+        split_char, split_chars, exclusion, min_length, workers, readers,
+        max_bytes))
+    seconds = time.perf_counter() - start
+
+    size = sum(file_size(filename) for filename in filenames)
+    msg = "Counted " + str(counted) + " of " + str(len(filenames))
+    msg += " files (" + format(size / 1000000, '.1f') + " MB) in "
+    msg += format(seconds, '.2f') + " s: "
+    msg += format(counted / seconds, '.1f') + " files/s, "
+    msg += format(size / 1000000 / seconds, '.1f') + " MB/s.\n"
+    print(msg)
+
+    return results
@@ -0,0 +1,179 @@
+# This Python module measures the stages of counting, e.g., splitting
+# the words, excluding words, filtering numbers, and reporting. For
+# each stage, the wall time, the number of words taken in and given
+# out, and, optionally, the peak memory traced by tracemalloc are
+# recorded. The whole run can also be profiled by cProfile. The records
+# are summarized as text, next to the report of the results, or written
+# as JSON or as a Prometheus text file.
+# Last modified 2026-10-18 23:20
+
+
+# For measuring the wall time and the peak memory of each stage.
+import time
+import tracemalloc
+
+# For measuring a stage by a 'with' statement.
+from contextlib import contextmanager
+
+# For writing the records as JSON.
+import json
+
+# For replacing the file of the records at once.
+import os
+
+
+def start_recording(memory=False, profile=False):
+    """
+    Return a new recorder of the stages as a dict, for 'measure_stage()'.
+    'stages' lists the records of the stages, in the order they end, and
+    'peaks' the peak memory so far of each stage not ended yet.
+        When 'memory' is True, the memory is traced by tracemalloc from
+    now on, which makes counting slower. When 'profile' is True, the
+    run is also profiled by cProfile until 'stop_recording()'.
+    """
+    if memory:
+        tracemalloc.start()
+
+    profiler = None
+    if profile:
+        # Imported only here, as it is only needed for profiling.
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    return {'stages': [], 'peaks': [], 'memory': memory,
+        'profiler': profiler, 'start': time.perf_counter()}
+
+
+def stop_recording(recorder, profile_file=''):
+    """
+    Stop tracing the memory and profiling, and return the recorder.
+    The profile, if any, is saved in 'profile_file', which can be read
+    by 'python -m pstats'.
+    """
+    recorder['seconds'] = time.perf_counter() - recorder['start']
+    if recorder['profiler'] is not None:
+        recorder['profiler'].disable()
+        if profile_file != '':
+            recorder['profiler'].dump_stats(profile_file)
+    if recorder['memory']:
+        tracemalloc.stop()
+    return recorder
+
+
+@contextmanager
+def measure_stage(recorder, stage, tokens_in=None):
+    """
+    Measure the stage run in a 'with' statement, and add its record to
+    the recorder, e.g.,
+
+        with measure_stage(recorder, 'del_num', len(words)) as record:
+            words = del_num(words)
+            record['tokens_out'] = len(words)
+
+    'tokens_in' and 'tokens_out' are the numbers of words taken in and
+    given out, or None when they are not words. When the recorder is
+    None, nothing is measured.
+        Stages can be nested. The peak of tracemalloc is reset for each
+    stage, so the peak of a stage so far is kept in 'peaks' while a
+    stage nested in it is run, and the peak of the nested stage is
+    added to it afterwards.
+    """
+    record = {'stage': stage, 'tokens_in': tokens_in, 'tokens_out': None}
+    if recorder is None:
+        yield record
+        return
+
+    peaks = recorder['peaks']
+    if recorder['memory']:
+        if peaks:
+            peaks[-1] = max(peaks[-1], tracemalloc.get_traced_memory()[1])
+        peaks.append(0)
+        tracemalloc.reset_peak()
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record['seconds'] = time.perf_counter() - start
+        if recorder['memory']:
+            record['peak_bytes'] = max(peaks.pop(),
+                tracemalloc.get_traced_memory()[1])
+            if peaks:
+                peaks[-1] = max(peaks[-1], record['peak_bytes'])
+        recorder['stages'].append(record)
+
+
+def stage_summary(recorder):
+    """
+    Format the records of the stages as a table, and return it as a
+    string, e.g., to be printed and added to the report file.
+    """
+    msg = "Stage\t\t\tSeconds\t\tWords in\tWords out"
+    if recorder['memory']:
+        msg += "\tPeak MB"
+    msg += "\n"
+
+    for record in recorder['stages']:
+        msg += record['stage'].ljust(24)
+        msg += format(record['seconds'], '.4f') + "\t\t"
+        for key in ['tokens_in', 'tokens_out']:
+            value = record[key]
+            msg += ('-' if value is None else str(value)).ljust(8) + "\t"
+        if recorder['memory']:
+            msg += format(record['peak_bytes'] / 1048576, '.1f')
+        msg = msg.rstrip() + "\n"
+
+    msg += "Total\t\t\t" + format(recorder.get('seconds', 0), '.4f') + "\n"
+    return msg
+
+
+def stages_json(recorder):
+    """Return the records of the stages as a JSON string."""
+    return json.dumps({'seconds': recorder.get('seconds'),
+        'stages': recorder['stages']}, indent=2)
+
+
+def stages_prometheus(recorder, prefix='wordcount'):
+    """
+    Return the records of the stages in the text format of Prometheus,
+    e.g., for the textfile collector of the node exporter. Each value
+    of a stage is a gauge, labelled by the stage.
+    """
+    metrics = [('stage_seconds', 'seconds', "Wall time of each stage."),
+        ('stage_tokens_in', 'tokens_in', "Words taken in by each stage."),
+        ('stage_tokens_out', 'tokens_out',
+            "Words given out by each stage.")]
+    if recorder['memory']:
+        metrics.append(('stage_peak_bytes', 'peak_bytes',
+            "Peak memory traced during each stage."))
+
+    lines = []
+    for name, key, help_text in metrics:
+        name = prefix + '_' + name
+        lines.append('# HELP ' + name + ' ' + help_text)
+        lines.append('# TYPE ' + name + ' gauge')
+        for record in recorder['stages']:
+            if record.get(key) is not None:
+                lines.append(name + '{stage="' + record['stage'] + '"} '
+                    + repr(record[key]))
+    return '\n'.join(lines) + '\n'
+
+
+def write_stages(recorder, filename, form='json'):
+    """
+    Write the records of the stages into a file, as JSON ('json'), as
+    a Prometheus text file ('prometheus'), or as the table of
+    'stage_summary()' ('text').
+    """
+    if form == 'prometheus':
+        contents = stages_prometheus(recorder)
+    elif form == 'text':
+        contents = stage_summary(recorder)
+    else:
+        contents = stages_json(recorder)
+
+    # The file is replaced at once, so that it is never read half
+    # written, e.g., by the node exporter.
+    with open(filename + '.tmp', 'w', encoding='utf-8') as file_object:
+        file_object.write(contents)
+    os.replace(filename + '.tmp', filename)
@@ -0,0 +1,106 @@
+# This Python module filters long lists of words by boolean masks,
+# instead of testing each word in a Python loop. Each different word is
+# tested once, and all the words are picked by the results. When asked
+# for, and NumPy is installed, the words are held as one array of bytes
+# instead, with the offset and length of each word, and the masks of
+# the lengths and of the numbers are computed on the arrays for all the
+# words at once. This is not faster on the texts measured by
+# 'benchmarks/filter_words.py', and importing NumPy alone takes about
+# 0.1 s, so it is not done by default.
+# Last modified 2026-10-18 23:58
+
+
+# For picking the words kept by the mask without a Python loop.
+from itertools import compress
+
+from .words import is_num
+
+
+def number_mask(np, words, lengths):
+    """
+    Return a NumPy array of booleans telling if each word is a number,
+    as 'is_num()' does, or None when the words are not all ASCII. The
+    words are joined into one array of bytes, and 'lengths' gives where
+    each of them is.
+        A number begins with a digit, after a sign if it has one, so
+    the first bytes of all the words are checked on the arrays. Only
+    the few words that pass are checked by 'is_num()'.
+    """
+    text = ''.join(words)
+    if not text.isascii():
+        return None
+    chars = np.frombuffer(text.encode('ascii') + b'\0', dtype=np.uint8)
+
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+
+    # Where each word begins after its sign, if it has one.
+    firsts = chars[starts]
+    bodies = starts + ((firsts == ord('-')) | (firsts == ord('+')))
+    leads = chars[bodies]
+    candidates = np.flatnonzero((leads >= ord('0')) & (leads <= ord('9'))
+        & (bodies < ends))
+
+    is_number = np.zeros(len(words), dtype=bool)
+    is_number[candidates] = [is_num(words[index])
+        for index in candidates.tolist()]
+    return is_number
+
+
+def word_masks(
+    distinct, min_length=1, numbers=False, exclusion=frozenset()
+    ):
+    """
+    Return a list of booleans, one for each word in the list of
+    different words 'distinct', telling if the word is kept by
+    'filter_words()'.
+    """
+    return [(min_length <= 1 or len(word) >= min_length)
+        and (numbers or not is_num(word)) and word not in exclusion
+        for word in distinct]
+
+
+def filter_words(
+    words, min_length=1, numbers=False, exclusion=frozenset(),
+    use_numpy=False
+    ):
+    """
+    Return a list of the words that are not shorter than 'min_length',
+    not numbers (see 'is_num()') unless 'numbers' is True, and not in
+    the set 'exclusion'. The list is the same as that given by
+    'exclude_words()', 'min_word_length()' and 'del_num()' in turn.
+        The different words are found by a dict, in the order they
+    first appear, and tested by 'word_masks()'. With 'use_numpy' True,
+    and NumPy installed, the masks are made on arrays instead (see
+    'number_mask()'). The words are then picked by 'compress()'.
+    """
+    if min_length <= 1 and numbers and not exclusion:
+        return words
+
+    np = None
+    if use_numpy:
+        # Imported here, as vocab.py imports count.py, which uses this
+        # module.
+        from .vocab import load_numpy
+        np = load_numpy()
+
+    if np is not None:
+        lengths = np.fromiter(map(len, words), dtype=np.intp,
+            count=len(words))
+        keep = lengths >= (min_length if min_length > 1 else 0)
+        if not numbers:
+            is_number = number_mask(np, words, lengths)
+            if is_number is None:
+                keep = None
+            else:
+                keep &= ~is_number
+        if keep is not None:
+            if exclusion:
+                keep &= ~np.fromiter(map(exclusion.__contains__, words),
+                    dtype=bool, count=len(words))
+            return list(compress(words, keep.tolist()))
+
+    distinct = list(dict.fromkeys(words))
+    keep = dict(zip(distinct,
+        word_masks(distinct, min_length, numbers, exclusion)))
+    return list(compress(words, map(keep.__getitem__, words)))
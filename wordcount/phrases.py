@@ -0,0 +1,422 @@
+# This Python module counts phrases (i.e., combination of words) in
+# texts split into sentence-like fragments, either the given phrases,
+# or all phrases with a given number of words, or with a range of
+# numbers of words at once.
+# Last modified 2026-10-18 23:58
+
+
+# For splitting sentences by punctuations.
+import re
+
+# For counting all phrases in a single pass.
+from collections import Counter
+
+# For building the phrase matcher breadth-first.
+from collections import deque
+
+from .source import open_exclusion
+from .words import split_letters
+from .topk import top_items
+
+
+def split_phrase_words(contents):
+    """
+    Split a string into a list of words in lower cases, and return
+    that list. Words in phrases are formed by letters and apostrophes,
+    e.g., "it's" is a word.
+    """
+    return split_letters(contents, apostrophe=True)
+
+
+def remove_char(string, char_list=''):
+    """"
+    This will remove the specific characters listed in the 
+    string 'char_list' from the original string 'orig_string', and
+    return a new string.
+        DO NOT use any so-called separating characters (like a
+    space) in the 'char_list', because ALL the listed characters
+    will be chopped off.
+    """
+    for char in char_list:
+        if char in string:
+            string = string.replace(char, '')
+    return string
+
+
+def split_sentence(contents, split_chars=',.!?:;()'):
+    """
+    Split texts into short, sentence-like fragments according to 
+    punctuations, and return a list of sentences (strings).
+        Punctuation characters for spliting are typically '.!?:;', 
+    but a comma ',' is also considered.
+    """
+    split_pattern = "[" + split_chars + "]+"
+    sentences = re.split(split_pattern, contents)
+
+    # This loop removes empty spaces in each sentence fragment.
+    for index in range(len(sentences)):
+        sentences[index] = sentences[index].strip().lower()
+
+    return sentences
+
+
+def read_sentences(
+    filename,               # The text file to be read.
+    char_list='',           # Characters removed from the text.
+    split_chars=',.!?:;()', # Punctuations splitting the sentences.
+    chunk_size=1048576,     # How many characters are read at a time.
+    ):
+    """
+    Read a text file chunk by chunk, so that the whole file is never
+    kept in memory, and yield its sentences, as 'split_sentence()' on
+    'remove_char()' of the whole text gives, except that more empty
+    sentences may be yielded. UTF-8 encoding is used for opening the
+    text file.
+        Each chunk read is cut after its last punctuation in
+    'split_chars', and the rest is carried over to the next chunk, so
+    that no sentence is cut apart. A text without punctuations is thus
+    read as a whole.
+        When the file cannot be read, a message is printed, and no more
+    sentences are yielded.
+    """
+    try:
+        with open(filename, encoding='utf-8') as file_object:
+            buffer = ''     # Text carried over from the last chunk.
+            while True:
+                chunk = file_object.read(chunk_size)
+                if chunk == '':
+                    break
+                buffer += remove_char(chunk, char_list)
+
+                cut = max(buffer.rfind(char) for char in split_chars) + 1
+                if cut > 0:
+                    yield from split_sentence(buffer[:cut], split_chars)
+                    buffer = buffer[cut:]
+
+            yield from split_sentence(buffer, split_chars)
+
+    except FileNotFoundError:   # Abort when the file is not found.
+        print("Cannot open file '" + filename + "'.")
+
+    # Abort when the coding is not correct, e.g., when it is not a
+    # text file, or the coding is wrong.
+    except UnicodeDecodeError:
+        message = "Cannot open file '" + filename + ".\n"
+        message += "Make sure it is an UTF-8 encoded text file."
+        print(message)
+
+
+def phrases_in_sentence(sentence, phrase_length=2):
+    """
+    Extracts all phrases in a string (typically a sentence), and
+    return a list of these phrases. When the phrase cannot be
+    created (e.g., the sentence fragment is shorter than the given
+    length), an empty list is returned.
+        Phrases are defined as continuesly written words. The
+    length of the phrase (phrase_len) is defined as the number of
+    words in the phrase. The words are separated by blanks,
+    typically a space. 
+    """
+    words = split_phrase_words(sentence)
+
+    # Count the number of words in the splited sentence.
+    word_number = len(words)
+
+    # Create an empty list to store these phrases.
+    phrases = []
+
+    # A phrase should not have less than 2 words.
+    if phrase_length < 2:
+        phrase_length = 2
+    
+    # Extract phrases in the sentence. 
+    # 's_index': the index in the sentence fragment.
+    # 'pr_index': the index in the phrase.
+    else:
+        for s_index in range(word_number):
+            if (s_index + phrase_length) <= word_number:
+                phrase = ''     # An empty string to store a phrase.
+                for pr_index in range(phrase_length):
+                    phrase += words[s_index + pr_index] + ' '
+                phrase = phrase.rstrip()    # Remove the last space.
+                phrases.append(phrase)
+            else:
+                break
+        
+        phrases = set(phrases)     # Combine same phrases, if any.
+        return phrases
+
+
+def phrase_set(sentences, phrase_length=2):
+    """
+    Collect all phrases with given number of words in a list of
+    sentences, and return them as a list of phrases.
+        Same phrases are combined as one.
+    """
+    if phrase_length < 2:   # A phrase can't have less than 2 words.
+        phrase_length = 2
+
+    phrases = []            # An empty list to store phrases.
+    
+    for sentence in sentences:
+        phrases += phrases_in_sentence(sentence, phrase_length) 
+
+    while '' in phrases:    # Remove empty phrases, if any.
+        phrases.remove('')
+
+    phrases = set(phrases)  # Combine same phrases, if any.
+    return phrases
+
+
+def exclude_phrase(phrases, exclusion=''):
+    """
+    Exclude the phrases, as listed in the given file 'exclusion',
+    from a list of phrases (strings). This will return a list of
+    phrases without the excluded ones.
+        A dict of counting results, e.g., from 'count_ngrams()', can
+    also be given, and the excluded phrases are removed as its keys.
+        In the file 'exclusion', the phrases to be excluded are
+    separated from each other by a new line.
+    """
+    # When the file for storing excluded words is not given.
+    if exclusion == '':
+        return phrases
+    
+    # When the file for storing excluded words is given.
+    else:
+        contents = open_exclusion(exclusion, 'phrase').lower()
+        exclude_phrases = contents.splitlines()
+
+        for exclude_phrase in exclude_phrases:
+            # Counting results (a dict) drop the phrase as a key.
+            if isinstance(phrases, dict):
+                phrases.pop(exclude_phrase, None)
+                continue
+            while exclude_phrase in phrases:
+                phrases.remove(exclude_phrase)
+        return phrases
+
+
+def list_a_in_b(str_a, str_b):
+    """
+    Count how many list_a, as a whole, continuous series of items,
+    can be found in list_b. 
+    """
+    list_a = split_phrase_words(str_a)
+    list_b = split_phrase_words(str_b)
+
+    a_len = len(list_a)
+    b_len = len(list_b)
+    count = 0
+    
+    for b_index in range(b_len):
+        if b_index + a_len <= b_len:
+
+            # Make a copy for part of list_b, and the length of the
+            # copy is the same length as that of list_a.
+            sect_b = []     # An empty list to store part of list_b.
+            for a_index in range(a_len):
+                sect_b.append(list_b[b_index + a_index])
+
+            # Compare if list_a is the same as sect_b.
+            if list_a == sect_b:
+                count += 1
+    
+    return count
+
+
+def compile_phrases(phrases):
+    """
+    Compile a list of phrases into a matcher (an Aho-Corasick automaton
+    over words), and return the matcher as a dict. The matcher can be
+    reused by 'match_phrases()' for any number of sentences or files
+    without being compiled again.
+        Each node of the automaton is a position in a phrase. 'goto'
+    stores the next node for each word, 'fail' stores the node of the
+    longest suffix that is also the beginning of a phrase, and 'order'
+    lists the nodes (except the root 0) breadth-first.
+    """
+    goto = [{}]     # The root node; nodes are indexed by the position.
+    fail = [0]
+    terminals = []  # Pairs of a phrase and the node where it ends.
+
+    # Build a trie of the words of all phrases.
+    for phrase in phrases:
+        node = 0
+        for word in split_phrase_words(phrase):
+            if word not in goto[node]:
+                goto[node][word] = len(goto)
+                goto.append({})
+                fail.append(0)
+            node = goto[node][word]
+        terminals.append((phrase, node))
+
+    # Link each node to its failure node, breadth-first, so that the
+    # failure node of the parent is always linked before the child.
+    order = []
+    queue = deque(goto[0].values())
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for word, child in goto[node].items():
+            queue.append(child)
+            if node != 0:
+                suffix = fail[node]
+                while suffix and word not in goto[suffix]:
+                    suffix = fail[suffix]
+                fail[child] = goto[suffix].get(word, 0)
+
+    return {'goto': goto, 'fail': fail, 'order': order,
+        'phrases': terminals}
+
+
+def match_phrases(matcher, sentences=[]):
+    """
+    Count the phrases compiled in the 'matcher' in a list of sentences
+    that have no punctuations. Each sentence is split and scanned only
+    once, from left to right, for all the phrases. This will return a
+    dict containing each phrase as the key and the corresponding
+    counting as the value, the same as 'count_phrase()'.
+        Overlapping phrases are all counted, e.g., 'of which' and
+    'which of' are both found in 'of which of'.
+    """
+    goto = matcher['goto']
+    fail = matcher['fail']
+    hits = [0] * len(goto)  # How many times each node is reached.
+
+    for sentence in sentences:
+        node = 0            # Each sentence starts from the root.
+        for word in split_phrase_words(sentence):
+            while node and word not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(word, 0)
+            hits[node] += 1
+
+    # A phrase ending at a node also ends at its failure nodes, so the
+    # hits are passed on from the deepest nodes up to the root.
+    for node in reversed(matcher['order']):
+        hits[fail[node]] += hits[node]
+
+    count_dict = {}     # An empty dict to store counting results.
+    for phrase, node in matcher['phrases']:
+        if phrase not in count_dict:
+            count_dict[phrase] = hits[node]
+
+    return count_dict
+
+
+def count_phrase(phrases, sentences=[]):
+    """
+    Count the number of phrase in a list of sentences that have no
+    punctuations. This will return a dict containing each phrase as
+    the key and the corresponding counting as the value.
+        The phrases are compiled by 'compile_phrases()' each time. To
+    count the same phrases in many files, compile them once and call
+    'match_phrases()' instead.
+    """
+    return match_phrases(compile_phrases(phrases), sentences)
+
+
+def count_ngrams(sentences, phrase_length=2):
+    """
+    Count all phrases with given number of words in a list of
+    sentences, and return a dict containing each phrase as the key and
+    the corresponding counting as the value.
+        A window of 'phrase_length' words slides over the words of
+    each sentence only once, so that every sentence is split and
+    scanned a single time, no matter how many different phrases it
+    contains. The results are the same as those of 'count_phrase()'
+    applied on 'phrase_set()', i.e., overlapping phrases are counted.
+    """
+    if phrase_length < 2:   # A phrase can't have less than 2 words.
+        phrase_length = 2
+
+    count_dict = Counter()  # An empty Counter to store the results.
+
+    for sentence in sentences:
+        words = split_phrase_words(sentence)
+        count_dict.update(
+            ' '.join(words[s_index:s_index + phrase_length])
+            for s_index in range(len(words) - phrase_length + 1)
+            )
+
+    return count_dict
+
+
+def top_counts(count_dict, top_range=10, least_count=0):
+    """
+    Rearrange the phrase count results based on count numbers, from
+    more to less, and list the top counted phrases (by default, the
+    top 10). Those whose counts are less than a given number will
+    be ignored. In the end, the top counted phrases and their
+    corresponding counts are returned.
+        The top phrases are picked by 'top_items()', so that the
+    phrases are never sorted all, and the dict is not changed.
+    """
+    return top_items(count_dict, top_range, least_count)
+
+
+def count_ngram_range(sentences, min_length=2, max_length=6):
+    """
+    Count all phrases of 'min_length' to 'max_length' words in a list
+    of sentences at once, and return a tuple of the list of words, by
+    their IDs, and a dict with each phrase length as the key and the
+    counts of the phrases of that length as the value.
+        Each sentence is split into words only once, and its words are
+    turned into integer IDs, in the order they first appear. The
+    phrases of all lengths are taken from the same tuple of IDs, and
+    counted as tuples of IDs (see 'decode_phrase()'), not strings. The
+    counts of each length are the same as those of 'count_ngrams()'.
+    """
+    if min_length < 2:      # A phrase can't have less than 2 words.
+        min_length = 2
+
+    ids = {}                # Each word and its ID.
+    get_id = ids.setdefault
+    tables = {length: Counter()
+        for length in range(min_length, max_length + 1)}
+
+    for sentence in sentences:
+        word_ids = tuple([get_id(word, len(ids))
+            for word in split_phrase_words(sentence)])
+        for length, table in tables.items():
+            table.update(
+                word_ids[s_index:s_index + length]
+                for s_index in range(len(word_ids) - length + 1)
+                )
+
+    return list(ids), tables
+
+
+def decode_phrase(words, phrase_ids):
+    """
+    Turn a phrase counted as a tuple of word IDs, e.g., by
+    'count_ngram_range()', back into a string, and return it.
+    """
+    return ' '.join([words[word_id] for word_id in phrase_ids])
+
+
+def top_ngrams(words, tables, top_range=10, least_count=0, exclusion=''):
+    """
+    List the top counted phrases of each length, as counted by
+    'count_ngram_range()', and return a dict with each phrase length as
+    the key and the list of tuples of the phrase and its count, like
+    'top_counts()' gives, as the value.
+        The phrases listed in the file 'exclusion' are removed from the
+    counts first. Only the top phrases are turned back into strings.
+    """
+    if exclusion != '':
+        ids = {word: word_id for word_id, word in enumerate(words)}
+        contents = open_exclusion(exclusion, 'phrase').lower()
+        for exclude_phrase in contents.splitlines():
+            # Only the phrases that can be counted are excluded, as
+            # 'exclude_phrase()' does.
+            phrase_words = exclude_phrase.split(' ')
+            if len(phrase_words) in tables and all(word in ids
+                    for word in phrase_words):
+                tables[len(phrase_words)].pop(
+                    tuple([ids[word] for word in phrase_words]), None)
+
+    return {length: [(decode_phrase(words, phrase_ids), count)
+        for phrase_ids, count in top_counts(table, top_range, least_count)]
+        for length, table in tables.items()}
@@ -0,0 +1,149 @@
+# This Python module counts the words of a text file through a chain
+# of lazy filters. The file is read chunk by chunk, and each word flows
+# through all the filters one at a time, into the counts, so that no
+# list of all the words is ever made, and the memory used does not
+# grow with the length of the text. The filters, and their order, are
+# given as a list of names, and new filters can be added to 'FILTERS'.
+# See 'benchmarks/pipeline_memory.py'.
+# UTF-8 encoding is used for reading all text files.
+# Last modified 2026-10-18 19:50
+
+
+# For counting by frequency.
+from collections import Counter
+
+# For filtering the words lazily, without a Python loop for each word.
+from itertools import compress, filterfalse, tee
+
+from .words import split_words, split_letters, is_num
+from .count import read_chunks
+
+
+def iter_words(chunks, split_char="", split_chars=[", ", ". "]):
+    """
+    Split each chunk of text from an iterable (see 'read_chunks()') by
+    'split_words()', and yield the words one at a time.
+    """
+    for chunk in chunks:
+        yield from split_words(chunk, split_char, split_chars)
+
+
+def iter_letters(chunks):
+    """
+    Split each chunk of text from an iterable by 'split_letters()', and
+    yield the words one at a time.
+    """
+    for chunk in chunks:
+        yield from split_letters(chunk)
+
+
+def exclude_filter(words, settings):
+    """
+    Lazily drop the words in the set 'exclusion' of the 'settings' from
+    an iterable of words, as 'exclude_words()' does.
+    """
+    exclusion = settings.get('exclusion', frozenset())
+    if not exclusion:
+        return words
+    return filterfalse(exclusion.__contains__, words)
+
+
+def length_filter(words, settings):
+    """
+    Lazily drop the words shorter than 'min_length' of the 'settings'
+    from an iterable of words, as 'min_word_length()' does. The words
+    are read twice by 'tee()', once for their lengths.
+    """
+    min_length = settings.get('min_length', 1)
+    if min_length <= 1:
+        return words
+    words, lengths = tee(words)
+    return compress(words, map(min_length.__le__, map(len, lengths)))
+
+
+class NumberCache(dict):
+    """
+    A dict telling whether each word is a number (see 'is_num()'). A
+    word is tested the first time it is looked up, and its result is
+    kept, so that looking it up again does not call any Python code.
+    """
+
+    def __missing__(self, word):
+        is_number = self[word] = is_num(word)
+        return is_number
+
+
+def number_filter(words, settings):
+    """
+    Lazily drop the numbers (see 'is_num()') from an iterable of words,
+    as 'del_num()' does. Each different word is only tested once.
+    """
+    return filterfalse(NumberCache().__getitem__, words)
+
+
+# The filters by their names. Each takes an iterable of words and a
+# dict of settings, and returns an iterable of the words it keeps.
+FILTERS = {'exclude': exclude_filter, 'min_length': length_filter,
+    'numbers': number_filter}
+
+
+def chain_filters(
+    words, filters=['exclude', 'min_length', 'numbers'], settings={}
+    ):
+    """
+    Chain the filters named in the list 'filters' (see 'FILTERS'), in
+    that order, on an iterable of words, and return the iterable of the
+    words that pass all of them. A filter can also be given as a
+    function, which takes and returns the same as those in 'FILTERS'.
+    Nothing is filtered until the words are taken from the result.
+    """
+    for name in filters:
+        if callable(name):
+            words = name(words, settings)
+        else:
+            words = FILTERS[name](words, settings)
+    return words
+
+
+def count_pipeline(
+    filename,               # The text file to be counted.
+    split_char="",          # Characters for splitting words.
+    split_chars=[", ", ". "],   # Character sets for splitting words.
+    filters=['exclude', 'min_length', 'numbers'],   # The filters.
+    settings={},            # The settings of the filters.
+    chunk_size=1048576,     # How many characters are read at a time.
+    letters=False,          # Split the words by 'split_letters()'.
+    ):
+    """
+    Count the words in a text file through the filters named in
+    'filters' (see 'chain_filters()'), and return the results in class
+    Counter. The file is read by 'read_chunks()', and the words are
+    split by 'split_words()', or by 'split_letters()' when 'letters' is
+    True. With the default filters, the results are the same as those
+    of 'count_text()' on the whole text (or 'split_letters()' and
+    'min_word_length()', when the numbers are not filtered).
+        'settings' is a dict, which holds 'exclusion', the set of
+    excluded words, and 'min_length', the minimal length of the word.
+    """
+    try:
+        if letters:
+            chunks = read_chunks(filename, '', [], chunk_size)
+            words = iter_letters(chunks)
+        else:
+            chunks = read_chunks(filename, split_char, split_chars,
+                chunk_size)
+            words = iter_words(chunks, split_char, split_chars)
+        results = Counter(chain_filters(words, filters, settings))
+
+    except FileNotFoundError:   # Abort when the file is not found.
+        print("Cannot open file '" + filename + "'.")
+
+    # Abort when the coding is not correct, e.g., when it is not a
+    # text file, or the coding is wrong.
+    except UnicodeDecodeError:
+        message = "Cannot open file '" + filename + ".\n"
+        message += "Make sure it is an UTF-8 encoded text file."
+        print(message)
+
+    else:
+        return results
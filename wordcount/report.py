@@ -0,0 +1,119 @@
+# This Python module formats the counting results of words and
+# phrases into reports, prints them on screen, and appends them to a
+# report file. The reports only list the top results; all the results
+# can be written into files by the module export.py.
+# Last modified 2026-10-18 21:20
+
+
+# For getting the time and forming the result report.
+import time
+
+from .topk import top_items
+
+
+def remove_less_counts(results, min_count=1):
+    """
+    Exclude words with counts less than a given value.
+    The count results are a list of tuples containing two elements - 
+    the counted element (the word) and the member of count.
+    """
+    if min_count <= 1:          # A listed word cannot have < 1 count.
+        return results
+    else:
+        sorted_results = []     # Store the result list for returning.
+        for index in range(len(results)):
+            if results[index][1] >= min_count:
+                sorted_results.append(results[index])
+        return sorted_results
+
+
+def report_results(
+    results,        # Word frequency results in class Counter.
+    min_length,     # The minimal length of the word for counting.
+    min_count,      # The minimal counting number of the word.
+    top_common,     # The top most frequently counted words.
+    txtsource,      # Where the text is stored (for report).
+    exclude_string, # Words to be excluded (for reporting.
+    report_file,    # Where the result report is stored.
+    echo=True,      # Print the report on screen.
+    ):
+    """
+    Format the word counting results, print them on screen, and append
+    them to the report file. Only the top words are reported; see
+    'write_counts()' for writing all of them.
+    """
+    # Format date and test conditions
+    lines = [time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())]
+    lines.append("Read file:\t" + txtsource)
+
+    if exclude_string == '':
+        lines.append("No word is specifically excluded.")
+    else:
+        lines.append("Exclusion word list is applied.")
+
+    lines.append("Word length >= " + str(min_length) + ", "
+        + "count >= " + str(min_count) + ". "
+        + "Top " + str(top_common) + " most frequent words:")
+
+    # Format results for printing and storage.
+    printed_words = top_items(results, top_common, min_count)
+    lines += [word + "\t\t" + str(count) for word, count in printed_words]
+
+    write_report(lines, report_file, echo)
+
+
+def report_phrases(
+    top_results, top_range, least_count, txtsource, report_file, note='',
+    echo=True,
+    ):
+    """
+    Format the top counted phrases, as listed by 'top_counts()', print
+    them on screen, and append them to the report file. A 'note' about
+    the results, e.g., how approximate they are, is added if given.
+    """
+    # Format date and test conditions
+    lines = [time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())]
+    lines.append("Read file:\t" + txtsource)
+    lines.append("The top " + str(top_range) + " results "
+        + "(skimmed if counts < " + str(least_count) + "):")
+
+    lines += [result[0] + "\t\t" + str(result[1]) for result in top_results]
+
+    if note != '':
+        lines.append(note)
+
+    write_report(lines, report_file, echo)
+
+
+def report_counts(results, txtsource, report_file, echo=True):
+    """
+    Format the counts of given words or phrases, as a list of tuples of
+    the word (or phrase) and its count, print them on screen, and
+    append them to the report file.
+    """
+    # Format date and test conditions
+    lines = [time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())]
+    lines.append("Read file:\t" + txtsource)
+
+    lines += [result[0] + "\t\t" + str(result[1]) for result in results]
+
+    write_report(lines, report_file, echo)
+
+
+def write_report(lines, report_file, echo=True):
+    """
+    Join the lines of a report, with the report file at the end, print
+    it on screen if 'echo' is True, and append it to the report file.
+    The lines are joined once, so that a long report does not take
+    longer than its length.
+    """
+    lines.append("Output file:\t" + report_file + "\n\n\n")
+    msg = "\n".join(lines)
+
+    # Print results and associated info.
+    if echo:
+        print(msg)
+
+    # Also, write the results and associated into to the file.
+    with open(report_file, 'a') as file_object:
+        file_object.write(msg)
@@ -0,0 +1,322 @@
+# This Python module runs word counting as a long-running service on
+# localhost, so that the modules, the compiled patterns and the sets of
+# excluded words are kept warm between requests, instead of being
+# loaded again by every run of a script. Requests and results are in
+# JSON, over HTTP.
+#     Start the service with 'python -m wordcount.service', or count a
+# file in this process only with 'python -m wordcount.service --count
+# FILE', which prints the same JSON results.
+# Last modified 2026-10-18 23:58
+
+
+# For reading and writing requests and results.
+import json
+
+# For serving the requests on localhost.
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# For passing requests to the counting thread in batches.
+import queue
+import threading
+from concurrent.futures import Future
+
+# For counting the requests of a batch on multiple CPU cores.
+from multiprocessing import Pool
+
+# For checking if an exclusion file has been changed, and keeping the
+# sets of excluded words of the files used last.
+import os
+from collections import OrderedDict
+
+# For reading options from the command line.
+import argparse
+
+from .source import open_exclusion
+from .words import compile_exclusion
+from .count import count_text, count_mapped
+
+
+# The characters and character sets for splitting words, as in wdct.py.
+SPLIT_CHAR = ":;!?\"#$&{}<>*/÷=\\@|·~‘“”–⋯"
+SPLIT_CHARS = [", ", ". ", ".\n", ".\r", "' ", "’ ", " (", ") "]
+
+# The sets of excluded words of the exclusion files used last, keyed by
+# the file and the time it was modified, from the one used longest ago.
+# Each process keeps its own sets.
+exclusion_cache = OrderedDict()
+
+# The most sets of excluded words kept in 'exclusion_cache'.
+EXCLUSION_CACHE_SIZE = 32
+
+
+def load_exclusion(filename=''):
+    """
+    Return the set of words excluded by the file 'filename', or an
+    empty set when it is ''. The file is only read and split again when
+    it has been modified since it was last loaded. When the file does
+    not exist, None is returned.
+        Only the sets of the 32 files used last are kept, and a file
+    that does not exist is never kept, so that a long-running service
+    does not keep every path it has ever been given.
+    """
+    if filename == '':
+        return frozenset()
+
+    try:
+        key = (filename, os.stat(filename).st_mtime_ns)
+    except OSError:
+        return None
+
+    exclusion = exclusion_cache.get(key)
+    if exclusion is None:
+        exclusion = compile_exclusion(open_exclusion(filename))
+        exclusion_cache[key] = exclusion
+        if len(exclusion_cache) > EXCLUSION_CACHE_SIZE:
+            exclusion_cache.popitem(last=False)
+    else:
+        exclusion_cache.move_to_end(key)
+
+    return exclusion
+
+
+def count_request(request):
+    """
+    Count the words of a request, and return the results as a dict that
+    can be sent as JSON. The request is a dict giving either the 'text'
+    to be counted or the 'path' of a text file, and optionally the
+    'exclusion' file, 'min_length', 'min_count' and 'top' (how many of
+    the most frequent words to return; 0 for all).
+        The results list the words and their counts, from the most
+    frequent, as 'words', and the number of words counted as 'total'.
+    When the file or the exclusion file cannot be counted or opened,
+    the results give an 'error'.
+    """
+    exclusion = load_exclusion(request.get('exclusion', ''))
+    if exclusion is None:
+        return {'error': "Cannot open exclusion file '"
+            + request['exclusion'] + "'."}
+    min_length = request.get('min_length', 1)
+
+    if 'text' in request:
+        contents = request['text']
+        contents = contents.replace('\r\n', '\n').replace('\r', '\n')
+        results = count_text(
+            contents, SPLIT_CHAR, SPLIT_CHARS, exclusion, min_length)
+    else:
+        results = count_mapped(request['path'], SPLIT_CHAR, SPLIT_CHARS,
+            exclusion, min_length)
+        if results is None:     # It has been printed by the service.
+            return {'error': "Cannot count file '" + request['path']
+                + "'."}
+
+    top = request.get('top', 0)
+    min_count = request.get('min_count', 1)
+    top_words = results.most_common(top if top > 0 else None)
+
+    return {
+        'words': [[word, count] for word, count in top_words
+            if count >= min_count],
+        'total': sum(results.values()),
+        }
+
+
+def count_guarded(request):
+    """
+    Count a request by 'count_request()', and return a tuple of the
+    results and None, or of None and the error raised, so that the
+    error of one request does not fail the other requests of its batch.
+    """
+    try:
+        return count_request(request), None
+    except Exception as error:
+        return None, error
+
+
+def check_request(request):
+    """
+    Check that a request can be counted, and return a message telling
+    what is wrong, or '' when nothing is wrong.
+    """
+    if not isinstance(request, dict):
+        return "A request must be a JSON object."
+    if ('text' in request) == ('path' in request):
+        return "A request must give either 'text' or 'path'."
+    if not isinstance(request.get('text', request.get('path')), str):
+        return "'text' or 'path' must be a string."
+    if not isinstance(request.get('exclusion', ''), str):
+        return "'exclusion' must be a string."
+    for name in ['min_length', 'min_count', 'top']:
+        value = request.get(name, 0)
+        if not isinstance(value, int) or isinstance(value, bool):
+            return "'" + name + "' must be an integer."
+    return ''
+
+
+def serve_batches(requests, workers=1, batch_size=64):
+    """
+    Count the requests put into the queue 'requests' in batches, until
+    None is put into it. Each item is a tuple of the request and the
+    Future that receives its results.
+        The requests waiting when a batch begins are all taken into
+    that batch, up to 'batch_size'. With 'workers' > 1, the requests of
+    a batch are counted in a pool of worker processes at the same time;
+    each worker keeps its own sets of excluded words warm.
+    """
+    pool = Pool(workers) if workers > 1 else None
+
+    while True:
+        item = requests.get()
+        if item is None:
+            break
+
+        batch = [item]
+        while len(batch) < batch_size:
+            try:
+                item = requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                requests.put(None)  # Stop after this batch.
+                break
+            batch.append(item)
+
+        # Each request is counted on its own by 'count_guarded()', and
+        # only its own Future receives its error. The whole batch only
+        # fails when the pool itself fails.
+        try:
+            if pool is not None:
+                results = pool.map(
+                    count_guarded, [request for request, future in batch])
+            else:
+                results = [count_guarded(request)
+                    for request, future in batch]
+        except Exception as error:
+            for request, future in batch:
+                future.set_exception(error)
+        else:
+            for (request, future), (result, error) in zip(batch, results):
+                if error is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(error)
+
+    if pool is not None:
+        pool.close()
+        pool.join()
+
+
+class CountServer(ThreadingHTTPServer):
+    """
+    The HTTP server of the service. It keeps more connections waiting
+    than by default, so that clients sending requests at the same time
+    are not refused.
+    """
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class CountHandler(BaseHTTPRequestHandler):
+    """
+    Answer the requests to the service. A request is a POST to '/count'
+    with a JSON object as the body (see 'count_request()'), and the
+    results are returned as a JSON object.
+    """
+
+    def do_POST(self):
+        if self.path != '/count':
+            self.send_json(404, {'error': "Unknown path '" + self.path
+                + "'; use '/count'."})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length))
+        except ValueError:
+            self.send_json(400, {'error': "The request is not JSON."})
+            return
+
+        message = check_request(request)
+        if message != '':
+            self.send_json(400, {'error': message})
+            return
+
+        future = Future()
+        self.server.requests.put((request, future))
+        try:
+            result = future.result()
+        except Exception as error:
+            self.send_json(500, {'error': repr(error)})
+        else:
+            self.send_json(422 if 'error' in result else 200, result)
+
+    def send_json(self, status, result):
+        body = json.dumps(result, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass    # Requests are not logged, as there are thousands.
+
+
+def run_service(port=8765, workers=1, batch_size=64, exclusion=''):
+    """
+    Run the counting service on localhost at the given port until it is
+    stopped by Ctrl+C. The service only listens on localhost, as a
+    request may name any file that the service can read.
+        The exclusion file given is loaded before the first request.
+    """
+    requests = queue.Queue()
+    counter = threading.Thread(target=serve_batches,
+        args=(requests, workers, batch_size))
+    counter.start()
+
+    # Warm up before the first request.
+    if load_exclusion(exclusion) is None:
+        print("Cannot open exclusion file '" + exclusion + "'.")
+
+    server = CountServer(('127.0.0.1', port), CountHandler)
+    server.requests = requests
+    print("Counting words at http://127.0.0.1:" + str(port) + "/count",
+        flush=True)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        requests.put(None)
+        counter.join()
+
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Run word counting as a service on localhost.")
+    parser.add_argument('--port', type=int, default=8765,
+        help="the port of the service (default: 8765)")
+    parser.add_argument('--workers', type=int, default=1,
+        help="the number of processes for counting (default: 1)")
+    parser.add_argument('--batch-size', type=int, default=64,
+        help="the most requests counted in a batch (default: 64)")
+    parser.add_argument('--exclusion', default='',
+        help="the exclusion file to be loaded at start")
+    parser.add_argument('--count', metavar='FILE',
+        help="count a file in this process, print the JSON results, "
+        "and exit, without starting the service")
+    parser.add_argument('--min-length', type=int, default=1,
+        help="the minimal length of the word (default: 1)")
+    parser.add_argument('--top', type=int, default=0,
+        help="the most frequent words to return; 0 for all (default: 0)")
+    args = parser.parse_args()
+
+    if args.count is not None:
+        print(json.dumps(count_request({'path': args.count,
+            'exclusion': args.exclusion, 'min_length': args.min_length,
+            'top': args.top}), ensure_ascii=False))
+    else:
+        run_service(args.port, args.workers, args.batch_size,
+            args.exclusion)
@@ -0,0 +1,108 @@
+# This Python module counts the most frequent phrases (or words) of
+# large texts approximately, in a fixed amount of memory. Most long
+# phrases appear only once, so counting all of them exactly takes
+# memory that grows with the text; a summary keeps only the counts that
+# may belong to the most frequent ones, with a known bound on the
+# error of each count.
+# Last modified 2026-10-18 17:10
+
+
+# For counting each block of phrases exactly before it is merged.
+from collections import Counter
+
+from .phrases import split_phrase_words
+from .topk import top_items
+
+
+def new_summary(capacity=100000):
+    """
+    Return a new, empty summary of counts as a dict, which keeps the
+    counts of at most 'capacity' phrases. 'counts' are the counts kept,
+    'total' is the number of phrases counted, and 'error' is how much
+    any count may be less than the true count.
+        The error is never more than total / (capacity + 1), so the
+    capacity is chosen by the error that can be accepted, e.g., a
+    capacity of 99999 keeps every count within 0.001% of the total.
+    """
+    return {'capacity': capacity, 'counts': Counter(), 'total': 0,
+        'error': 0}
+
+
+def merge_counts(summary, counts):
+    """
+    Merge the exact counts of a block of phrases (e.g., a Counter) into
+    the summary, and return the summary.
+        This is the merge of Misra-Gries summaries, of which
+    Space-Saving is another form: the counts are added, and when more
+    than 'capacity' phrases are kept, the (capacity + 1)-th largest
+    count is subtracted from all counts, and those not above it are
+    dropped. The amount subtracted is added to the error. In this way,
+    a count is never more than the true count, and never less than the
+    true count minus the error.
+    """
+    kept = summary['counts']
+    kept.update(counts)
+    summary['total'] += sum(counts.values())
+
+    capacity = summary['capacity']
+    if len(kept) > capacity:
+        cut = sorted(kept.values(), reverse=True)[capacity]
+        summary['counts'] = Counter({phrase: count - cut
+            for phrase, count in kept.items() if count > cut})
+        summary['error'] += cut
+
+    return summary
+
+
+def count_ngrams_approx(
+    sentences, phrase_length=2, capacity=100000, block_size=1000000
+    ):
+    """
+    Count all phrases with given number of words in a list (or any
+    iterable) of sentences approximately, and return the summary (see
+    'new_summary()'). The phrases are the same as those counted by
+    'count_ngrams()'.
+        The phrases are counted exactly in blocks of about 'block_size'
+    phrases, and each block is merged into the summary, so the memory
+    used is bounded by the block size and the capacity.
+    """
+    if phrase_length < 2:   # A phrase can't have less than 2 words.
+        phrase_length = 2
+
+    summary = new_summary(capacity)
+    block = Counter()
+    block_count = 0
+
+    for sentence in sentences:
+        words = split_phrase_words(sentence)
+        windows = len(words) - phrase_length + 1
+        if windows <= 0:
+            continue
+
+        block.update(
+            ' '.join(words[s_index:s_index + phrase_length])
+            for s_index in range(windows)
+            )
+        block_count += windows
+
+        if block_count >= block_size:
+            merge_counts(summary, block)
+            block = Counter()
+            block_count = 0
+
+    merge_counts(summary, block)
+    return summary
+
+
+def summary_top(summary, top_range=10, least_count=0):
+    """
+    List the top counted phrases in the summary, as a list of tuples of
+    the phrase, the least and the most that its true count can be.
+        Only phrases whose least count reaches 'least_count' are
+    listed, so each of them surely appears at least 'least_count'
+    times. Any phrase that appears more times than the error is surely
+    kept in the summary.
+    """
+    error = summary['error']
+    return [(phrase, count, count + error) for phrase, count in
+        top_items(summary['counts'], top_range, least_count)]
@@ -0,0 +1,205 @@
+# This Python module saves the counts of words or phrases as snapshots,
+# which can be merged, e.g., when the texts are split across several
+# hosts, and each host counts its own part. A snapshot holds all the
+# counts, sorted by the words, in the blocks of the binary format of
+# export.py, after a line telling its format and version and a line of
+# its header in JSON, which tells what was counted, with which
+# settings, and from which text files. The counts are written in the
+# same byte order and sizes on any host, so that snapshots of hosts of
+# different kinds can be merged.
+#     Any number of snapshots are merged in one pass, reading one block
+# of each at a time, so that the memory used does not grow with the
+# size of the snapshots. The least count and the top range are only
+# applied to the merged counts, e.g.,
+# 'python -m wordcount.snapshot host1.snap host2.snap --top 40'.
+#     The module is not imported by the package, as it is also run as
+# a program; import it by 'from wordcount.snapshot import ...'.
+# Last modified 2026-10-18 23:59
+
+
+# For reading and writing the headers of the snapshots.
+import json
+
+# For merging the sorted counts of the snapshots.
+import heapq
+from itertools import groupby
+from operator import itemgetter
+
+# For reading options from the command line.
+import argparse
+
+from .export import BUFFER_SIZE, write_blocks, read_blocks
+from .report import report_phrases
+
+
+# The first line of a snapshot file, telling its format and version.
+SNAPSHOT_FORMAT = b'wordcount snapshot 1\n'
+
+
+def save_snapshot(
+    results,            # The counts, in a dict, e.g., class Counter.
+    filename,           # The snapshot file to be written.
+    kind='words',       # What is counted, 'words' or 'phrases'.
+    settings='',        # The settings of counting, as a string.
+    sources=[],         # The text files counted.
+    ):
+    """
+    Save all the counts of the results into a snapshot file, sorted by
+    the words (or phrases), and return the number of words saved, or
+    None when the file cannot be written. Instead of a dict, the words
+    and counts can also be given as an iterable of tuples already sorted
+    by the words, e.g., by 'merge_snapshots()'.
+        Only snapshots of the same kind and settings can be merged, so
+    'settings' should tell everything that changes the counts, e.g.,
+    the excluded words and the least length of a word.
+    """
+    if hasattr(results, 'items'):
+        results = sorted(results.items())
+    header = {'kind': kind, 'settings': settings, 'sources': list(sources)}
+
+    try:
+        with open(filename, 'wb', buffering=BUFFER_SIZE) as file_object:
+            file_object.write(SNAPSHOT_FORMAT)
+            file_object.write(json.dumps(header).encode('utf-8') + b'\n')
+            return write_blocks(results, file_object)
+
+    except OSError:
+        print("Cannot write the snapshot '" + filename + "'.")
+        return None
+
+
+def load_header(filename):
+    """
+    Return the header of a snapshot file as a dict, or None when the
+    file cannot be read or is not a snapshot.
+    """
+    try:
+        with open(filename, 'rb') as file_object:
+            if file_object.readline() != SNAPSHOT_FORMAT:
+                print("'" + filename + "' is not a snapshot of this "
+                    "version.")
+                return None
+            return json.loads(file_object.readline())
+
+    except FileNotFoundError:
+        print("Cannot open file '" + filename + "'.")
+
+    except ValueError:
+        print("The snapshot '" + filename + "' seems broken.")
+
+
+def read_snapshot(filename):
+    """
+    Read the words and counts of a snapshot file, and yield them as
+    tuples, sorted by the words. See 'load_header()' for checking the
+    file first.
+    """
+    with open(filename, 'rb', buffering=BUFFER_SIZE) as file_object:
+        file_object.readline()      # The format and the header.
+        file_object.readline()
+        yield from read_blocks(file_object)
+
+
+def merge_counts(iterables):
+    """
+    Merge iterables of words and counts, each sorted by the words, by a
+    k-way merge, and yield each word with the sum of its counts, sorted
+    by the words. Only the next tuple of each iterable is compared.
+    """
+    merged = heapq.merge(*iterables, key=itemgetter(0))
+    for word, pairs in groupby(merged, key=itemgetter(0)):
+        yield word, sum(map(itemgetter(1), pairs))
+
+
+def merge_snapshots(filenames):
+    """
+    Merge the snapshot files, and return a tuple of the merged header
+    and an iterable of the merged words and counts (see
+    'merge_counts()'), or None when a file cannot be read, or when the
+    snapshots are not of the same kind and settings.
+        The text files counted in more than one snapshot are told, as
+    their counts would be added up more than once.
+    """
+    headers = [load_header(filename) for filename in filenames]
+    if not headers or None in headers:
+        return None
+
+    first = headers[0]
+    sources = []
+    for filename, header in zip(filenames, headers):
+        if (header['kind'] != first['kind']
+                or header['settings'] != first['settings']):
+            print("'" + filename + "' is not counted the same as '"
+                + filenames[0] + "', and cannot be merged with it.")
+            return None
+        for source in header['sources']:
+            if source in sources:
+                print("'" + source + "' is counted in more than one "
+                    "snapshot.")
+        sources += header['sources']
+
+    header = {'kind': first['kind'], 'settings': first['settings'],
+        'sources': sources}
+    return header, merge_counts([read_snapshot(filename)
+        for filename in filenames])
+
+
+def top_merged(pairs, top_range=10, min_count=1):
+    """
+    Return the 'top_range' most frequently counted words of an iterable
+    of words and counts, e.g., merged by 'merge_snapshots()', skipping
+    counts less than 'min_count', as a list of tuples from the most
+    counted. Only a heap of 'top_range' words is kept.
+    """
+    if min_count > 1:
+        pairs = (pair for pair in pairs if pair[1] >= min_count)
+    return heapq.nlargest(top_range, pairs, key=itemgetter(1))
+
+
+# Merge snapshots, e.g., 'python -m wordcount.snapshot a.snap b.snap
+# --output all.snap --top 40 --min-count 3', and list the top words.
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Merge snapshots of counts, and list the top words "
+        "or phrases of the merged counts.")
+    parser.add_argument('snapshots', nargs='+',
+        help="the snapshot files to be merged")
+    parser.add_argument('--output', metavar='FILE',
+        help="save the merged counts as a snapshot in FILE")
+    parser.add_argument('--top', type=int, default=30,
+        help="the number of top words or phrases listed (default: 30)")
+    parser.add_argument('--min-count', type=int, default=1,
+        help="only counts >= this are listed (default: 1)")
+    parser.add_argument('--report', metavar='FILE',
+        help="also append the list to a report file")
+    args = parser.parse_args()
+
+    merged = None
+    if args.output in args.snapshots:
+        print("The merged snapshot cannot replace one being merged.")
+    else:
+        merged = merge_snapshots(args.snapshots)
+
+    # The merged counts are saved first, and then read back for the top
+    # words, so that they are never all kept in memory.
+    if merged is not None and args.output is not None:
+        header, pairs = merged
+        saved = save_snapshot(pairs, args.output, header['kind'],
+            header['settings'], header['sources'])
+        merged = None
+        if saved is not None:
+            print(str(saved) + " " + header['kind'] + " saved in '"
+                + args.output + "'.")
+            merged = header, read_snapshot(args.output)
+
+    if merged is not None:
+        header, pairs = merged
+        top_results = top_merged(pairs, args.top, args.min_count)
+        if args.report is not None:
+            note = "Merged from " + str(len(args.snapshots))
+            note += " snapshots."
+            report_phrases(top_results, args.top, args.min_count,
+                ', '.join(header['sources']), args.report, note)
+        else:
+            for word, count in top_results:
+                print(word + "\t\t" + str(count))
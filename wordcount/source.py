@@ -0,0 +1,58 @@
+# This Python module opens the text files to be counted, and the files
+# listing the words or phrases to be excluded from counting.
+# UTF-8 encoding is used for reading all text files.
+# Last modified 2026-10-18 12:30
+
+
+def open_source(filename):
+    """
+    Open the file and return text contents as a string.
+    UTF-8 encoding is used for opening the text file.
+    """
+    try:
+        with open(filename, encoding='utf-8') as file_object:
+            contents = file_object.read()
+
+    except FileNotFoundError:   # Abort when the file is not found.
+        print("Cannot open file '" + filename + "'.")
+
+    # Abort when the coding is not correct, e.g., when it is not a
+    # text file, or the coding is wrong.
+    except UnicodeDecodeError:
+        message = "Cannot open file '" + filename + ".\n"
+        message += "Make sure it is an UTF-8 encoded text file."
+        print(message)
+
+    else:
+        return contents
+
+
+def open_exclusion(filename, item='word'):
+    """
+    Open the file containing words (sometimes called 'stop word'), or
+    phrases as told by 'item', to be excluded. This will return a
+    string for further use.
+        The file to be openned should be in ASCII or UTF-8 encoding.
+        If the file can't be openned properly, return ''.
+    """
+    try:
+        with open(filename, encoding='utf-8') as file_object:
+            contents = file_object.read()
+
+    # Abort when the file is not found.
+    except FileNotFoundError:
+        msg = "Cannot open file '" + filename + "'.\n"
+        msg += "No " + item + " is exluded from counting.\n"
+        print(msg)
+        return ''
+
+    # Abort when the coding is not correct,
+    # e.g., if it is not a text file, or the coding is wrong.
+    except UnicodeDecodeError:
+        msg = "The coding of '" + filename + "' seems wrong.\n"
+        msg += "No " + item + " is exluded from counting.\n"
+        print(msg)
+        return ''
+
+    else:
+        return contents
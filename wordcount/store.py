@@ -0,0 +1,203 @@
+# This Python module keeps word counts of text files in a SQLite
+# database, so that a rerun of word counting only counts the files
+# that are new or changed since the last run. The counts of given
+# words can also be looked up without reading the text.
+# Last modified 2026-10-18 23.50
+
+
+# For storing the counts in a database file.
+import sqlite3
+
+# For telling if a file has been changed by its contents.
+import hashlib
+
+# For getting the size and modification time of a file.
+import os
+
+# For returning counts in the same class as the counting scripts.
+from collections import Counter
+
+
+def open_store(filename, settings=''):
+    """
+    Open (or create) the count store in a database file, and return
+    the connection to it.
+        The counts depend on how the words are counted, e.g., which
+    words are excluded. These counting settings are given as a string
+    'settings'. When they are not the same as those of the counts in
+    the store, all the counts stored are dropped.
+    """
+    connection = sqlite3.connect(filename)
+    connection.executescript("""
+        CREATE TABLE IF NOT EXISTS settings (value TEXT);
+        CREATE TABLE IF NOT EXISTS files (
+            path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER,
+            digest TEXT);
+        CREATE TABLE IF NOT EXISTS counts (
+            path TEXT, word TEXT, count INTEGER,
+            PRIMARY KEY (path, word)) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS totals (
+            word TEXT PRIMARY KEY, count INTEGER);
+        """)
+
+    row = connection.execute("SELECT value FROM settings").fetchone()
+    if row is None or row[0] != settings:
+        with connection:
+            connection.execute("DELETE FROM settings")
+            connection.execute("DELETE FROM files")
+            connection.execute("DELETE FROM counts")
+            connection.execute("DELETE FROM totals")
+            connection.execute(
+                "INSERT INTO settings VALUES (?)", (settings,))
+
+    return connection
+
+
+def file_digest(filename, block_size=1048576):
+    """
+    Return the SHA-1 digest of a file's contents as a hex string. The
+    file is read by blocks, so it is never kept in memory as a whole.
+    """
+    digest = hashlib.sha1()
+    with open(filename, 'rb') as file_object:
+        block = file_object.read(block_size)
+        while block:
+            digest.update(block)
+            block = file_object.read(block_size)
+    return digest.hexdigest()
+
+
+def add_counts(connection, counts, sign=1):
+    """
+    Add the counts of a file (in class Counter) to the totals, or
+    subtract them when 'sign' is -1. Words whose total count drops to
+    0 are removed from the totals.
+    """
+    connection.executemany(
+        "INSERT INTO totals VALUES (?, ?) ON CONFLICT (word) "
+        "DO UPDATE SET count = count + excluded.count",
+        ((word, sign * count) for word, count in counts.items()
+            if count != 0))
+
+    # Only the words counted less than before may drop to 0.
+    connection.executemany(
+        "DELETE FROM totals WHERE word = ? AND count <= 0",
+        ((word,) for word, count in counts.items() if sign * count < 0))
+
+
+def stored_counts(connection, path):
+    """Return the stored counts of a file in class Counter."""
+    rows = connection.execute(
+        "SELECT word, count FROM counts WHERE path = ?", (path,))
+    return Counter(dict(rows))
+
+
+def remove_file(connection, path):
+    """Remove a file and its counts from the store and the totals."""
+    add_counts(connection, stored_counts(connection, path), -1)
+    connection.execute("DELETE FROM counts WHERE path = ?", (path,))
+    connection.execute("DELETE FROM files WHERE path = ?", (path,))
+
+
+def refresh_store(connection, filenames, count_file):
+    """
+    Bring the count store up to date with a list of text files.
+        'count_file' is the function that counts a file; it takes the
+    file name and returns the counts in class Counter, or None when
+    the file cannot be counted. It is only called for files that are
+    new or changed. A file whose size and modification time are the
+    same as stored is taken as unchanged; otherwise, it is compared by
+    its digest. Files in the store but not in 'filenames' are removed,
+    and so are those that cannot be counted.
+    """
+    paths = [os.path.abspath(filename) for filename in filenames]
+
+    # Remove the files that are no longer counted.
+    stored = connection.execute("SELECT path FROM files").fetchall()
+    counted = set(paths)
+    with connection:
+        for (path,) in stored:
+            if path not in counted:
+                remove_file(connection, path)
+
+    for path in paths:
+        try:
+            status = os.stat(path)
+
+        # A file that is gone is removed from the store as well.
+        except FileNotFoundError:
+            print("Cannot open file '" + path + "'.")
+            with connection:
+                remove_file(connection, path)
+            continue
+
+        row = connection.execute(
+            "SELECT size, mtime, digest FROM files WHERE path = ?",
+            (path,)).fetchone()
+        if row is not None and row[:2] == (
+                status.st_size, status.st_mtime_ns):
+            continue
+
+        digest = file_digest(path)
+        if row is not None and row[2] == digest:
+            with connection:    # Only touched; the contents are same.
+                connection.execute(
+                    "UPDATE files SET size = ?, mtime = ? WHERE path = ?",
+                    (status.st_size, status.st_mtime_ns, path))
+            continue
+
+        # A changed file that cannot be counted any more is removed, so
+        # that its old counts are not taken as those of the file now.
+        counts = count_file(path)
+        if counts is None:
+            with connection:
+                remove_file(connection, path)
+            continue
+
+        # Replace the old counts of the file, if any, with the new ones,
+        # and merge the difference into the totals.
+        with connection:
+            old_counts = stored_counts(connection, path)
+            delta = Counter(counts)
+            delta.subtract(old_counts)
+            add_counts(connection, delta)
+
+            connection.execute("DELETE FROM counts WHERE path = ?", (path,))
+            connection.executemany(
+                "INSERT INTO counts VALUES (?, ?, ?)",
+                ((path, word, count) for word, count in counts.items()))
+            connection.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                (path, status.st_size, status.st_mtime_ns, digest))
+
+
+def update_store(connection, filenames, count_file):
+    """
+    Bring the count store up to date with a list of text files (see
+    'refresh_store()'), and return the total counts of all these files
+    in class Counter.
+        Words with the same total count are listed in the order they
+    were first added to the store.
+    """
+    refresh_store(connection, filenames, count_file)
+    rows = connection.execute(
+        "SELECT word, count FROM totals ORDER BY rowid")
+    return Counter(dict(rows))
+
+
+def lookup_words(connection, filenames, count_file, words):
+    """
+    Bring the count store up to date with a list of text files (see
+    'refresh_store()'), and return the total counts of the given words
+    only, as a dict containing each word as the key and its count as
+    the value (0 for a word never counted).
+        Each word is looked up by the primary key of the totals, so
+    neither the text nor the other counts are read.
+    """
+    refresh_store(connection, filenames, count_file)
+    count_dict = {}
+    for word in words:
+        row = connection.execute(
+            "SELECT count FROM totals WHERE word = ?", (word,)).fetchone()
+        count_dict[word] = row[0] if row is not None else 0
+    return count_dict
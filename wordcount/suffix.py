@@ -0,0 +1,388 @@
+# This Python module builds an index of a text for counting any phrase
+# without reading the text again. The words of the text are turned
+# into integer IDs, and all the suffixes of the sequence of IDs are
+# sorted (a suffix array), with the length of the phrase each suffix
+# shares with the one before it (the LCP array). Sentence-like
+# fragments, as split by 'split_sentence()', are kept apart, so that no
+# phrase is counted across two fragments.
+#     The index is saved in a file, and the count of a phrase is then
+# found by a binary search over the suffixes. NumPy is used for
+# building the index when it is installed. The IDs of the text are
+# taken from the fragments of fragments.py, so that the text is not
+# split again when they are kept.
+# Last modified 2026-10-18 23:59
+
+
+# For storing the IDs and the index as arrays of 32-bit integers.
+from array import array
+
+# For storing the header of the index file.
+import json
+
+# For listing the top repeated phrases without sorting all.
+import heapq
+
+# For reading options from the command line.
+import argparse
+
+from .phrases import split_phrase_words
+from .fragments import (SEPARATOR, encode_sentences, source_stamp,
+    open_fragments)
+from .vocab import load_numpy
+
+# The first line of an index file, which tells its format.
+INDEX_FORMAT = b'wordcount suffix index 1\n'
+
+
+def longest_fragment(tokens):
+    """
+    Return the number of IDs in the longest fragment of 'tokens',
+    including the separator after it.
+    """
+    longest = 0
+    start = 0
+    for end, token in enumerate(tokens):
+        if token == SEPARATOR:
+            longest = max(longest, end - start + 1)
+            start = end + 1
+    return longest
+
+
+def sort_suffixes(tokens):
+    """
+    Sort the suffixes of the IDs that begin with a word, i.e., not with
+    the separator, and return the positions where they begin, in their
+    sorted order, as an array. Suffixes are compared only up to the end
+    of their fragments, as no phrase goes further.
+        With NumPy, the suffixes are sorted by prefix doubling: they are
+    ranked by their first 1, 2, 4, ... IDs, each time from the ranks of
+    the halves, until the longest fragment is covered. Without NumPy,
+    the rest of the fragment of each suffix is sorted as a tuple.
+    """
+    np = load_numpy()
+    longest = longest_fragment(tokens)
+
+    if np is not None and len(tokens) > 0:
+        rank = np.frombuffer(tokens, dtype=np.intc).astype(np.int64)
+        order = np.argsort(rank, kind='stable')
+        length = 1
+        while length < longest:
+            # The ranks of both halves make one key, as a rank is never
+            # more than the number of IDs.
+            key = rank * (len(rank) + 1)
+            key[:-length] += rank[length:]
+            order = np.argsort(key, kind='stable')
+
+            sorted_keys = key[order]
+            changed = np.empty(len(order), dtype=np.int64)
+            changed[0] = 1
+            np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=changed[1:])
+            rank[order] = np.cumsum(changed)
+            if rank[order[-1]] == len(rank):    # All are different.
+                break
+            length *= 2
+
+        order = order[np.frombuffer(tokens, dtype=np.intc)[order]
+            != SEPARATOR]
+        return array('i', order.astype(np.intc).tobytes())
+
+    # The end of the fragment of each position, i.e., its separator.
+    ends = [0] * len(tokens)
+    end = len(tokens)
+    for position in range(len(tokens) - 1, -1, -1):
+        if tokens[position] == SEPARATOR:
+            end = position
+        ends[position] = end
+
+    words = tuple(tokens)
+    starts = [position for position in range(len(words))
+        if words[position] != SEPARATOR]
+    starts.sort(key=lambda position: words[position:ends[position]])
+    return array('i', starts)
+
+
+def common_prefixes(tokens, suffixes):
+    """
+    Return the LCP array of the sorted suffixes, i.e., an array of how
+    many words each suffix has in common with the one before it, not
+    going beyond the end of a fragment. The first is always 0.
+    """
+    lcp = array('i', bytes(4 * len(suffixes)))
+    if len(suffixes) < 2:
+        return lcp
+
+    np = load_numpy()
+    if np is not None:
+        words = np.frombuffer(tokens, dtype=np.intc)
+        starts = np.frombuffer(suffixes, dtype=np.intc).astype(np.int64)
+        lengths = np.frombuffer(lcp, dtype=np.intc)
+
+        # All pairs of neighbours are compared one word at a time, and
+        # a pair drops out at the first word that differs. Every
+        # fragment ends with a separator, so no index goes too far.
+        pairs = np.arange(1, len(starts))
+        offset = 0
+        while len(pairs) > 0:
+            this = words[starts[pairs] + offset]
+            same = (this == words[starts[pairs - 1] + offset]) & (
+                this != SEPARATOR)
+            pairs = pairs[same]
+            lengths[pairs] += 1
+            offset += 1
+        return lcp
+
+    for index in range(1, len(suffixes)):
+        this = suffixes[index]
+        before = suffixes[index - 1]
+        length = 0
+        while (tokens[this + length] == tokens[before + length]
+                and tokens[this + length] != SEPARATOR):
+            length += 1
+        lcp[index] = length
+    return lcp
+
+
+def build_index(sentences):
+    """
+    Build the index of a list of sentences, as split by
+    'split_sentence()', and return it as a dict. 'words' lists the
+    words by their IDs, 'ids' maps each word to its ID, 'tokens' is the
+    array of the IDs of the text, 'suffixes' the suffix array, and
+    'lcp' the LCP array.
+    """
+    words, tokens, offsets = encode_sentences(sentences)
+    return index_tokens(words, tokens)
+
+
+def index_tokens(words, tokens):
+    """
+    Build the index of the IDs of a text, with 'SEPARATOR' after each
+    fragment, e.g., those kept by 'open_fragments()', and the list of
+    words by their IDs, and return it as 'build_index()' does.
+    """
+    suffixes = sort_suffixes(tokens)
+    return {'words': words,
+        'ids': {word: word_id for word_id, word in enumerate(words)},
+        'tokens': tokens, 'suffixes': suffixes,
+        'lcp': common_prefixes(tokens, suffixes)}
+
+
+def save_index(index, filename, txtsource=''):
+    """
+    Save the index in a file, with the size and modification time of
+    the text file 'txtsource' it is built from.
+        The file begins with a line telling its format and a line of
+    the header in JSON, followed by the words, one in each line, and
+    the arrays of the index.
+    """
+    word_bytes = '\n'.join(index['words']).encode('utf-8')
+    header = {'source': txtsource, 'stamp': source_stamp(txtsource),
+        'word_bytes': len(word_bytes), 'tokens': len(index['tokens']),
+        'suffixes': len(index['suffixes'])}
+
+    with open(filename, 'wb') as file_object:
+        file_object.write(INDEX_FORMAT)
+        file_object.write(json.dumps(header).encode('utf-8') + b'\n')
+        file_object.write(word_bytes)
+        index['tokens'].tofile(file_object)
+        index['suffixes'].tofile(file_object)
+        index['lcp'].tofile(file_object)
+
+
+def load_index(filename, txtsource=None):
+    """
+    Load the index saved in a file, and return it, or None when the
+    file cannot be read. When 'txtsource' is given, None is also
+    returned if the index was built from another file, or the file has
+    been changed since, so that the index is built again.
+    """
+    try:
+        with open(filename, 'rb') as file_object:
+            if file_object.readline() != INDEX_FORMAT:
+                print("'" + filename + "' is not an index file.")
+                return None
+            header = json.loads(file_object.readline())
+            if txtsource is not None and (header['source'] != txtsource
+                    or header['stamp'] != source_stamp(txtsource)):
+                return None
+
+            words = file_object.read(header['word_bytes']).decode(
+                'utf-8').split('\n')
+            index = {'words': words,
+                'ids': {word: word_id for word_id, word in enumerate(words)}}
+            for name, length in [('tokens', header['tokens']),
+                    ('suffixes', header['suffixes']),
+                    ('lcp', header['suffixes'])]:
+                index[name] = array('i')
+                index[name].fromfile(file_object, length)
+
+    except FileNotFoundError:
+        return None
+
+    except (EOFError, ValueError, KeyError):
+        print("The index file '" + filename + "' seems broken.")
+        return None
+
+    return index
+
+
+def open_index(txtsource, filename, fragment_file=None):
+    """
+    Load the index of a text file from the index file 'filename', or
+    build the index and save it there when it is missing or out of
+    date. The index is built from the fragments of the text, as kept
+    in 'fragment_file' by 'open_fragments()', which split the text as
+    'ct_phrase.py' does. Return the index, or None when the text file
+    cannot be read.
+    """
+    index = load_index(filename, txtsource)
+    if index is not None:
+        return index
+
+    fragments = open_fragments(txtsource, fragment_file)
+    if fragments is None:
+        return None
+    index = index_tokens(fragments['words'], fragments['tokens'])
+    try:
+        save_index(index, filename, txtsource)
+    except OSError:     # The index is still used, but not kept.
+        print("Cannot save the index in '" + filename + "'.")
+    return index
+
+
+def phrase_range(index, phrase):
+    """
+    Find the suffixes that begin with a phrase (a string) by a binary
+    search, and return the range of their positions in the suffix
+    array, as a tuple of the first position and the one after the
+    last. The range is empty when the phrase is not in the text.
+        A phrase without words begins every suffix, so its range is the
+    whole suffix array, and it is counted once for each word, as
+    'match_phrases()' and 'count_stored_phrases()' count it.
+    """
+    ids = index['ids']
+    words = split_phrase_words(phrase)
+    if not words:
+        return 0, len(index['suffixes'])
+    if not all(word in ids for word in words):
+        return 0, 0
+
+    tokens = index['tokens']
+    suffixes = index['suffixes']
+    target = array('i', [ids[word] for word in words])
+    length = len(target)
+
+    # The first suffix not less than the phrase.
+    low, high = 0, len(suffixes)
+    while low < high:
+        middle = (low + high) // 2
+        start = suffixes[middle]
+        if tokens[start:start + length] < target:
+            low = middle + 1
+        else:
+            high = middle
+    first = low
+
+    # The first suffix that does not begin with the phrase.
+    high = len(suffixes)
+    while low < high:
+        middle = (low + high) // 2
+        start = suffixes[middle]
+        if tokens[start:start + length] == target:
+            low = middle + 1
+        else:
+            high = middle
+
+    return first, low
+
+
+def count_indexed(index, phrases):
+    """
+    Count each of a list of phrases in the indexed text, and return a
+    dict containing each phrase as the key and the corresponding
+    counting as the value, the same as 'count_phrase()' on the
+    sentences the index is built from.
+    """
+    count_dict = {}
+    for phrase in phrases:
+        first, after = phrase_range(index, phrase)
+        count_dict[phrase] = after - first
+    return count_dict
+
+
+def top_repeated(
+    index, top_range=10, min_length=2, max_length=None, least_count=2
+    ):
+    """
+    List the most frequent phrases of 'min_length' to 'max_length'
+    words (any number of words when it is None) that appear at least
+    'least_count' times, as a list of tuples of the phrase and its
+    count, from the most counted. Of the phrases with the same count,
+    the longer ones come first.
+        The LCP array is scanned once with a stack. Each interval of
+    suffixes that share the same beginning gives the phrases of a
+    range of lengths that appear as many times as there are suffixes;
+    only the longest of them within the lengths is listed, as the
+    shorter ones are parts of it that appear in the same places.
+    """
+    lcp = index['lcp']
+    suffixes = index['suffixes']
+    if max_length is None:
+        max_length = max(lcp) if len(lcp) > 0 else 0
+    least_count = max(least_count, 2)   # Only repeated ones share.
+
+    # Each interval as a tuple of its count, phrase length, and a
+    # suffix where the phrase begins.
+    intervals = []
+    stack = [(0, 0)]        # The shared length and first suffix.
+    for position in range(1, len(suffixes) + 1):
+        shared = lcp[position] if position < len(suffixes) else 0
+        first = position - 1
+        while shared < stack[-1][0]:
+            length, first = stack.pop()
+            parent = max(shared, stack[-1][0])
+            count = position - first
+            longest = min(length, max_length)
+            if (count >= least_count and longest > parent
+                    and longest >= min_length):
+                intervals.append((count, longest, suffixes[first]))
+        if shared > stack[-1][0]:
+            stack.append((shared, first))
+
+    words = index['words']
+    tokens = index['tokens']
+    return [(' '.join([words[word_id]
+        for word_id in tokens[start:start + length]]), count)
+        for count, length, start in heapq.nlargest(top_range, intervals,
+            key=lambda interval: interval[:2])]
+
+
+# Build the index of a text file and count phrases in it, e.g.,
+# 'python -m wordcount.suffix source.txt "in which" "of which"', or list
+# the top repeated phrases, e.g., 'python -m wordcount.suffix source.txt
+# --top 20 --min-n 3'.
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Count phrases in a text file by its suffix index.")
+    parser.add_argument('source', help="the text file")
+    parser.add_argument('phrases', nargs='*', help="the phrases to count")
+    parser.add_argument('--index',
+        help="the index file (default: the text file name + '.sa')")
+    parser.add_argument('--top', type=int, default=0,
+        help="list the top repeated phrases (default: 0)")
+    parser.add_argument('--min-n', type=int, default=2,
+        help="the least number of words in a listed phrase (default: 2)")
+    parser.add_argument('--max-n', type=int,
+        help="the most number of words in a listed phrase")
+    args = parser.parse_args()
+
+    index_file = args.index if args.index else args.source + '.sa'
+    index = open_index(args.source, index_file)
+
+    if index is not None:
+        for phrase, count in count_indexed(index, args.phrases).items():
+            print(phrase + "\t\t" + str(count))
+        if args.top > 0:
+            for phrase, count in top_repeated(index, args.top, args.min_n,
+                    args.max_n):
+                print(phrase + "\t\t" + str(count))
@@ -0,0 +1,97 @@
+# This Python module lists the top most frequently counted words or
+# phrases without sorting all of them. The top items are picked by a
+# heap, either from the counts when counting is done, or while counting
+# is still in progress (the "current" top items).
+# Last modified 2026-10-18 16:20
+
+
+# For picking the top items by a heap.
+import heapq
+
+
+def top_items(counts, top_range=None, min_count=1):
+    """
+    Return the 'top_range' most frequently counted items (all of them
+    when it is None) in a dict of counts, e.g., a Counter, as a list of
+    tuples of the item and its count. Items counted less than
+    'min_count' times are left out.
+        The list is the same as 'most_common()' of class Counter gives,
+    followed by 'remove_less_counts()', including the order of items
+    with the same count, i.e., the order they are in the dict. Only a
+    heap of 'top_range' items is kept, instead of sorting all items.
+    """
+    items = counts.items()
+    if min_count > 1:
+        items = ((item, count) for item, count in items
+            if count >= min_count)
+
+    if top_range is None:
+        return sorted(items, key=lambda item: item[1], reverse=True)
+    return heapq.nlargest(top_range, items, key=lambda item: item[1])
+
+
+def new_top_view(top_range=10, min_count=1):
+    """
+    Return a new view of the current top items while counting is in
+    progress, as a dict, for 'update_top_view()' and 'current_top()'.
+    'members' maps each item in the view to its count, and 'heap' holds
+    the items in the view by their counts, the least counted first.
+    """
+    return {'top_range': top_range, 'min_count': min_count,
+        'members': {}, 'heap': []}
+
+
+def update_top_view(top_view, counts, changed):
+    """
+    Update the view of the current top items after the counts of the
+    items listed in 'changed' have grown, and return the view. 'counts'
+    are the running counts of all items, e.g., a Counter updated chunk
+    by chunk, and 'changed' may be the counts of the last chunk.
+        As counts only grow, an item can only enter the view when its
+    own count has grown, so only the changed items are checked. The
+    least counted member is found on the heap; its entries that are
+    out of date (the member has been counted more since) are renewed
+    when they come to the top of the heap.
+    """
+    members = top_view['members']
+    heap = top_view['heap']
+    if top_view['top_range'] <= 0:
+        return top_view
+
+    for item in changed:
+        count = counts[item]
+        if count < top_view['min_count']:
+            continue
+
+        if item in members:
+            members[item] = count   # Its heap entry is renewed later.
+            continue
+
+        if len(members) < top_view['top_range']:
+            members[item] = count
+            heapq.heappush(heap, (count, item))
+            continue
+
+        # Find the least counted member, renewing the entries of the
+        # members counted more since they were pushed.
+        while heap[0][0] != members[heap[0][1]]:
+            least, member = heap[0]
+            heapq.heapreplace(heap, (members[member], member))
+
+        if count > heap[0][0]:
+            least, member = heapq.heapreplace(heap, (count, item))
+            del members[member]
+            members[item] = count
+
+    return top_view
+
+
+def current_top(top_view):
+    """
+    Return the current top items in the view, from the most counted, as
+    a list of tuples of the item and its count. When counting is done,
+    these are the same items as 'top_items()' gives, except that items
+    with the same count as the last of the top items may differ.
+    """
+    return sorted(top_view['members'].items(), key=lambda item: item[1],
+        reverse=True)
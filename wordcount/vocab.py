@@ -0,0 +1,141 @@
+# This Python module counts words by integer IDs. The words of a text
+# file are counted chunk by chunk by 'count_stream()', so that the list
+# of all the words is never made, and each different word is then
+# given an ID, in the order the words first appear. The counts and the
+# lengths of the words are stored in arrays by the IDs, so that the
+# words are filtered by them, and the top words are found, for all the
+# words at once, with NumPy when it is installed.
+# UTF-8 encoding is used for reading all text files.
+# Last modified 2026-10-18 23:59
+
+
+# For storing the counts and lengths as arrays of integers.
+from array import array
+
+# For returning the counts in class Counter.
+from collections import Counter
+
+# For listing the top most frequent words without sorting all.
+import heapq
+
+from .count import count_stream
+
+
+def load_numpy():
+    """
+    Import NumPy and return it, or return None when it is not
+    installed; the arrays are then handled in Python instead.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def new_vocabulary(results):
+    """
+    Turn the counts of words in a dict, e.g., the results of
+    'count_stream()' in class Counter, into a vocabulary, and return it
+    as a dict. 'words' lists the words by their IDs, in the order of the
+    dict, and 'counts' and 'lengths' are arrays, indexed by the IDs, of
+    the count and length of each word.
+    """
+    words = list(results)
+    return {'words': words, 'counts': array('q', results.values()),
+        'lengths': array('i', map(len, words))}
+
+
+def select_ids(vocabulary, min_length=1, min_count=1):
+    """
+    Return the IDs of the words counted at least 'min_count' times and
+    not shorter than 'min_length', in the order of the IDs.
+        The IDs are returned in a NumPy array when NumPy is installed,
+    or in a list otherwise.
+    """
+    counts = vocabulary['counts']
+    lengths = vocabulary['lengths']
+
+    np = load_numpy()
+    if np is not None and len(counts) > 0:
+        mask = np.frombuffer(counts, dtype=np.int64) >= min_count
+        if min_length > 1:
+            mask &= np.frombuffer(lengths, dtype=np.intc) >= min_length
+        return np.flatnonzero(mask)
+
+    return [word_id for word_id in range(len(counts))
+        if counts[word_id] >= min_count and lengths[word_id] >= min_length]
+
+
+def top_words(vocabulary, top_common=None, min_length=1, min_count=1):
+    """
+    List the 'top_common' most frequently counted words that pass
+    'select_ids()' (all of them when it is None), as a list of tuples
+    of the word and its count. The list is the same as that given by
+    'most_common()' of class Counter on the same counts, including the
+    order of words with the same count, i.e., the order they first
+    appear in.
+    """
+    words = vocabulary['words']
+    counts = vocabulary['counts']
+    selected = select_ids(vocabulary, min_length, min_count)
+    if top_common is None or top_common > len(selected):
+        top_common = len(selected)
+
+    np = load_numpy()
+    if top_common <= 0:
+        top_ids = []
+
+    # Only the words counted at least as many times as the last of the
+    # top words are sorted. A stable sort keeps words with the same
+    # count in the order of their IDs.
+    elif np is not None:
+        selected_counts = np.frombuffer(counts, dtype=np.int64)[selected]
+        last = len(selected) - top_common
+        threshold = np.partition(selected_counts, last)[last]
+        kept = selected_counts >= threshold
+        order = np.argsort(-selected_counts[kept], kind='stable')
+        top_ids = selected[kept][order[:top_common]].tolist()
+
+    else:
+        top_ids = heapq.nsmallest(top_common, selected,
+            key=lambda word_id: (-counts[word_id], word_id))
+
+    return [(words[word_id], counts[word_id]) for word_id in top_ids]
+
+
+def to_counter(vocabulary, min_length=1, min_count=1):
+    """
+    Return the counts of the words that pass 'select_ids()' in class
+    Counter, in the order the words first appear.
+    """
+    words = vocabulary['words']
+    counts = vocabulary['counts']
+    selected = select_ids(vocabulary, min_length, min_count)
+    if not isinstance(selected, list):
+        selected = selected.tolist()
+    return Counter({words[word_id]: counts[word_id]
+        for word_id in selected})
+
+
+def count_ids(
+    filename,               # The text file to be counted.
+    split_char="",          # Characters for splitting words.
+    split_chars=[", ", ". "],   # Character sets for splitting words.
+    exclusion=frozenset(),  # Words to be excluded from counting.
+    chunk_size=1048576,     # How many characters are read at a time.
+    ):
+    """
+    Count the words in a text file chunk by chunk by 'count_stream()',
+    and return the vocabulary of the counts (see 'new_vocabulary()'),
+    or None when the file cannot be read.
+        The words are not filtered by length while counted, only the
+    numbers are left out; 'top_words()' or 'to_counter()' does that
+    afterwards, for any least length, and gives the same results as
+    'count_text()' on the whole text.
+    """
+    results = count_stream(
+        filename, split_char, split_chars, exclusion, 1, chunk_size)
+    if results is None:     # It has been printed by 'count_stream()'.
+        return None
+    return new_vocabulary(results)
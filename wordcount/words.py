@@ -0,0 +1,161 @@
+# This Python module splits texts into words, and filters the words,
+# e.g., by a list of excluded words, by their lengths, or by whether
+# they are numbers.
+# Last modified 2026-10-18 22:40
+
+
+# For splitting words by blanks and punctuations.
+import re
+
+# For caching the compiled set of excluded words.
+from functools import lru_cache
+
+
+def split_words(
+    contents, split_char="", split_chars=[", ", ". "], exclusion=frozenset()
+    ):
+    """
+    Split a text string (the 'contents') into a list of words in lower
+    cases, and return the word list. Characters listed in 'split_char'
+    will be replaced by a space, and character sets in the list
+    'split_chars' will be replaced by a space, too. Then, blank
+    characters are used as for word splitting.
+        Words in the set 'exclusion' (see 'compile_exclusion()') are
+    dropped while splitting, so they never enter the word list.
+    """
+    string = contents.lower()    # Turn all letters into lower cases.
+
+    # Replace all spliting characters (mostly punctuations) into
+    # spaces. For dealing with acadamic papers, uft-8 encoding is
+    # suggested to avoid encoding errors.
+    for char in split_char:
+        string = string.replace(char, ' ')
+
+    # Replace all splitting character sets into spaces, one set after
+    # another. Replacing them all in one pass (an alternation regex) is
+    # slower, and does not give the same words when a set is formed by
+    # replacing another, e.g., "' " in "x', y" after ", " is replaced.
+    # See 'benchmarks/split_words.py'.
+    for chars in split_chars:
+        string = string.replace(chars, ' ')
+
+    # Split the text string by blank letters, including the space, \t,
+    # \r, and \n.
+    if not exclusion:
+        return string.split()
+
+    words = [word for word in string.split() if word not in exclusion]
+
+    return words
+
+
+def split_letters(contents, exclusion=frozenset(), apostrophe=False):
+    """
+    Split a string into a list of words in lower cases, and return
+    that list. Words are formed by letters only, or also by the
+    apostrophe (') when 'apostrophe' is True, e.g., for phrases.
+        Words in the set 'exclusion' (see 'compile_exclusion()') are
+    dropped while splitting, so they never enter the list.
+    """
+    string = contents.lower()   # turn letters into lower cases.
+
+    # Replace each non-alphabetic character with a space.
+    if apostrophe:
+        string = re.sub('[^A-Za-z\']', ' ', string)
+    else:
+        string = re.sub('[^A-Za-z]', ' ', string)
+
+    if not exclusion:
+        return string.split()
+
+    words = [word for word in string.split() if word not in exclusion]
+    return words
+
+
+@lru_cache(maxsize=32)
+def compile_exclusion(exclude_string='', letters_only=False):
+    """
+    Turn the string of excluded words, as read by 'open_exclusion()',
+    into a frozenset of words in lower cases, and return that set. The
+    words are split by 'split_words()', or by 'split_letters()' when
+    'letters_only' is True.
+        The set is cached, so the same string is only split once in a
+    run, and the set can be shared by all the calls afterwards. Only
+    the 32 strings used last are kept, so that a long-running service
+    does not keep every exclusion it has ever been given.
+    """
+    if letters_only:
+        return frozenset(split_letters(exclude_string))
+    return frozenset(split_words(exclude_string))
+
+
+def exclude_words(words, exclude_string='', letters_only=False):
+    """
+    Exclude the words listed in the given file 'exclusion'.
+    This will return a list words without the excluded words.
+    """
+    # When the file for storing excluded words is not given. This may
+    # happen, for instance, when the file storing excluded words
+    # cannot be opened properly.
+    if exclude_string == '':
+        return words
+
+    # When the file for storing excluded words is given.
+    else:
+        exclusion = compile_exclusion(exclude_string, letters_only)
+        return [word for word in words if word not in exclusion]
+
+
+def min_word_length(words, min_length=1):
+    """
+    Exclude words short than the minimum length as defined by the
+    'min_length', and return a list of words without these short words.
+    """
+    if min_length <= 1:     # A word cannot be less than a character.
+        return words
+    else:
+        sorted_words = []   # Store the new word list for returning.
+        for index in range(len(words)):
+            if len(words[index]) >= min_length:
+                sorted_words.append(words[index])
+        return sorted_words
+
+
+def is_num(string):
+    """
+    Determine if a string is a number or not. The number can be an
+    integer or a folat, and can be a positive or a negative number.
+    This is used by the following function 'del_num()'.
+    """
+    if len(string) == 0:
+        return False
+
+    if (string[0] == '-' or string[0] == '+'):
+        string = string[1:]     # Remove the negetive sign.
+
+    # Split the string into sections by the decimal mark '.'.
+    sects = string.split('.')
+
+    if len(sects) > 2:          # A number cannot have > 2 sections.
+        return False
+    else:
+        for sect in sects:      # Check if each sector is a number.
+            if not sect.isdigit():
+                return False
+            else:
+                return True
+
+
+def del_num(words):
+    """
+    Remove numbers (including negative ones) from a list of strings.
+    """
+    sorted_words = []
+
+    for word in words:
+        if is_num(word):
+            continue
+        else:
+            sorted_words.append(word)
+
+    return sorted_words